@@ -0,0 +1,191 @@
+"""
+Page-object benchmarks - times BasePage / CareersPage operations in
+headless Chrome against the local stand-in site, at several board sizes.
+
+Usage:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes 10 1000 --repeat 10
+    python -m benchmarks.run_benchmarks --update-baseline
+
+Each operation is run --repeat times per board size. p50/p95 latency and
+the WebDriver command count per run are written to benchmarks/results/latest.json
+and compared with benchmarks/baseline.json; the run exits 1 when an
+operation got slower than the threshold allows or issues more commands.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+from pages.careers_page import CareersPage
+from utils.driver_factory import create_chrome_driver
+from utils.perf_metrics import percentile
+from utils.profiler import CommandProfiler
+from utils.standin_server import StandInServer
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, "baseline.json")
+RESULTS_FILE = os.path.join(BENCHMARK_DIR, "results", "latest.json")
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.20
+
+# Timings below this many seconds are noise; don't flag them on ratio alone
+ABSOLUTE_SLACK = 0.005
+
+LOCATION = "Istanbul, Turkiye"
+DEPARTMENT = "Quality Assurance"
+
+
+# --- Operations ---
+# Each operation is (name, setup, run). setup(page, server) is not timed.
+
+def _open_board(page, server):
+    page.go_to(server.board_url)
+
+
+def _open_careers(page, server):
+    page.go_to(server.home_url + "careers/")
+
+
+OPERATIONS = [
+    ("get_all_jobs", _open_board, lambda page: len(page.get_all_jobs())),
+    ("extract_postings", _open_board, lambda page: page.extract_postings()),
+    ("iter_postings", _open_board, lambda page: list(page.iter_postings())),
+    ("verify_all_jobs_match_filters", _open_board,
+     lambda page: page.verify_all_jobs_match_filters(LOCATION, DEPARTMENT, screenshot_dir=None)),
+    ("apply_filters", _open_board, lambda page: page.apply_filters(LOCATION, DEPARTMENT)),
+    ("click_software_development_block", _open_careers,
+     lambda page: page.click_software_development_block()),
+]
+
+
+# --- Measurement ---
+
+def measure(driver, profiler, server, setup, run, repeat):
+    """Run one operation repeat times; return its latency percentiles and command count."""
+    page = CareersPage(driver)
+    durations, commands = [], []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            setup(page, server)
+            before = profiler.total["commands"]
+            started = time.perf_counter()
+            run(page)
+            durations.append(time.perf_counter() - started)
+            commands.append(profiler.total["commands"] - before)
+
+    return {
+        "runs": repeat,
+        "p50": round(percentile(durations, 50), 4),
+        "p95": round(percentile(durations, 95), 4),
+        "commands": max(commands),
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, operations=None):
+    """Benchmark every operation at every board size; returns {"<op>@<size>": stats}."""
+    wanted = [op for op in OPERATIONS if not operations or op[0] in operations]
+    results = {}
+
+    for size in sizes:
+        with StandInServer() as server:
+            server.add_synthetic_postings(size)
+            driver = create_chrome_driver(headless=True)
+            profiler = CommandProfiler(driver).attach()
+            try:
+                for name, setup, run in wanted:
+                    key = f"{name}@{size}"
+                    results[key] = measure(driver, profiler, server, setup, run, repeat)
+                    stats = results[key]
+                    print(f"  {key:<45} p50 {stats['p50']:.4f}s  p95 {stats['p95']:.4f}s  "
+                          f"{stats['commands']} command(s)")
+            finally:
+                profiler.detach()
+                driver.quit()
+
+    return results
+
+
+# --- Baseline comparison ---
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, slack=ABSOLUTE_SLACK):
+    """
+    Return a list of regression messages. An operation regresses when its
+    p50 exceeds the baseline p50 by more than threshold (plus slack
+    seconds), or when it issues more WebDriver commands than before.
+    """
+    regressions = []
+    for key, stats in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        limit = base["p50"] * (1 + threshold) + slack
+        if stats["p50"] > limit:
+            regressions.append(f"{key}: p50 {stats['p50']:.4f}s > {limit:.4f}s "
+                               f"(baseline {base['p50']:.4f}s)")
+        if stats["commands"] > base["commands"]:
+            regressions.append(f"{key}: {stats['commands']} commands > baseline {base['commands']}")
+    return regressions
+
+
+def load_json(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the page objects against the stand-in site.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Board sizes (number of postings) to benchmark.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="Runs per operation and size.")
+    parser.add_argument("--operation", action="append", default=[],
+                        help="Only run this operation; may be repeated.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed p50 slowdown as a fraction of the baseline (default 0.2).")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--results", default=RESULTS_FILE)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Store this run as the new baseline instead of comparing.")
+    args = parser.parse_args(argv)
+
+    print(f"Benchmarking {len(args.sizes)} board size(s), {args.repeat} run(s) each...")
+    results = run_benchmarks(args.sizes, args.repeat, args.operation)
+    write_json(args.results, results)
+    print(f"Results saved: {args.results}")
+
+    if args.update_baseline:
+        baseline = load_json(args.baseline) or {}
+        baseline.update(results)
+        write_json(args.baseline, baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        print("No baseline found; run with --update-baseline to create one.")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for message in regressions:
+        print(f"  REGRESSION: {message}")
+    print(f"\n{len(regressions)} regression(s) against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
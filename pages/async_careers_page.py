@@ -0,0 +1,116 @@
+"""
+Async Careers Page - Lever job board checks for one AsyncTab.
+Shares locators and in-page scripts with CareersPage, so many filter
+combinations can be checked concurrently in tabs of a single browser.
+"""
+
+from pages.careers_page import CareersPage
+from utils.stability import FIRST_PARTY_HOSTS, LONG_REQUEST_MS, QUIET_MS, WAIT_STABLE_JS
+
+
+class AsyncCareersPage:
+
+    CHUNK_SIZE = CareersPage.CHUNK_SIZE
+
+    def __init__(self, tab):
+        self.tab = tab
+
+    @staticmethod
+    def _css(locator):
+        return CareersPage.to_css_selector(locator)
+
+    # --- Lever board ---
+
+    async def open(self, board_url):
+        await self.tab.goto(board_url)
+
+    async def wait_for_page_stable(self, timeout=2, quiet_ms=QUIET_MS):
+        """Same idle check as BasePage.wait_for_page_stable; returns {stable, waiting_for}."""
+        return await self.tab.call(
+            WAIT_STABLE_JS, quiet_ms, int(timeout * 1000), list(FIRST_PARTY_HOSTS), LONG_REQUEST_MS,
+            async_script=True,
+        )
+
+    async def apply_filters(self, location="Istanbul, Turkiye", department="Quality Assurance"):
+        """Apply location and team filters, via URL or the dropdowns like CareersPage."""
+        if CareersPage.FILTERS_VIA_URL:
+            url = CareersPage.filter_url(await self.tab.url(), location=location, team=department)
+            await self.tab.goto(url)
+            await self.wait_for_page_stable()
+            return []
+
+        results = []
+        for index, option_text in ((1, location), (2, department)):
+            async with self.tab.settles():
+                result = await self.tab.call(
+                    CareersPage.SELECT_FILTER_JS,
+                    self._css(CareersPage.FILTER_WRAPPER),
+                    self._css(CareersPage.FILTER_BUTTON),
+                    self._css(CareersPage.FILTER_POPUP),
+                    index,
+                    option_text,
+                    async_script=True,
+                )
+            if result["status"] == "no_filter":
+                raise Exception(f"Lever filter [{index}] not found "
+                                f"({result['count']} filter(s) on the page).")
+            if result["status"] != "already_selected":
+                # The board re-renders in-page without a load event
+                await self.wait_for_page_stable()
+            results.append(result)
+        return results
+
+    # --- Job listings ---
+
+    async def extract_postings(self):
+        return await self._read_postings(0, -1)
+
+    async def iter_postings(self, chunk_size=None):
+        """Async generator over posting records, one chunk per round trip."""
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        start = 0
+        while True:
+            chunk = await self._read_postings(start, chunk_size)
+            for record in chunk:
+                yield record
+            if len(chunk) < chunk_size:
+                return
+            start += chunk_size
+
+    async def _read_postings(self, start, count):
+        return await self.tab.call(
+            CareersPage.EXTRACT_POSTINGS_JS,
+            self._css(CareersPage.JOB_ITEM),
+            self._css(CareersPage.JOB_TITLE),
+            self._css(CareersPage.JOB_LOCATION),
+            self._css(CareersPage.JOB_GROUP_TITLE),
+            self._css(CareersPage.APPLY_BTN),
+            start,
+            count,
+        ) or []
+
+    async def verify_postings(self, expected_location="Istanbul, Turkiye",
+                              expected_department="Quality Assurance"):
+        """
+        Check every posting against the filters, like
+        CareersPage.verify_all_jobs_match_filters. Returns a summary dict
+        instead of printing, since many tabs report at once.
+        """
+        scanned, mismatches, groups, apply_hrefs = 0, [], {}, []
+        async for posting in self.iter_postings():
+            scanned += 1
+            if posting["group"]:
+                groups[posting["group"]] = True
+            if posting["apply_href"]:
+                apply_hrefs.append(posting["apply_href"])
+            if not CareersPage.location_matches(posting, expected_location):
+                mismatches.append(posting)
+
+        group_found = any(expected_department.lower() in name.lower() for name in groups)
+        return {
+            "scanned": scanned,
+            "mismatches": mismatches,
+            "groups": list(groups),
+            "apply_hrefs": apply_hrefs,
+            "passed": scanned > 0 and not mismatches and group_found,
+        }
@@ -3,59 +3,137 @@ Base Page - parent class for all page objects.
 Provides reusable helpers built on Selenium explicit waits.
 """
 
+import sys
+
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from utils.event_wait import EventDrivenWait, locator_event
+from utils.element_cache import ElementCache, bump_generation
+from utils.stability import QUIET_MS, install as install_stability_tracker, wait_until_stable
 
 
 class BasePage:
     """Base class that all page objects inherit from."""
 
+    # "poll" = WebDriverWait polling, "event" = in-page observer with polling fallback
+    WAIT_ENGINE = "poll"
+
+    # CheckpointStore shared by all pages; None disables checkpointing
+    checkpoints = None
+
+    # PerfStore shared by all pages; None disables navigation metrics
+    perf_store = None
+
+    # LeanProfile re-applied to tabs opened later; None when not blocking
+    lean_profile = None
+
+    # Cache find_all / find_present results until the page state changes
+    CACHE_ELEMENTS = False
+
     def __init__(self, driver, timeout=15):
         self.driver = driver
         self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
         self.actions = ActionChains(driver)
+        self.element_cache = ElementCache(driver) if self.CACHE_ELEMENTS else None
+
+    # --- Waiting ---
+
+    def wait_until(self, condition, timeout=None, event=None):
+        """
+        Wait for condition(driver) with the configured wait engine.
+        event describes the same condition for the in-page observer,
+        e.g. ("visible", By.ID, "foo"); it is ignored by the polling engine.
+        """
+        timeout = timeout or self.timeout
+        if self.WAIT_ENGINE == "event" and event:
+            return EventDrivenWait(self.driver, timeout).until(condition, event=event)
+        return WebDriverWait(self.driver, timeout).until(condition)
 
     # --- Element lookup ---
 
     def find(self, locator, timeout=None):
         """Wait for element to be visible and return it."""
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        return self.wait_until(EC.visibility_of_element_located(locator), timeout,
+                               locator_event("visible", locator))
 
     def find_clickable(self, locator, timeout=None):
         """Wait for element to be clickable and return it."""
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        return self.wait_until(EC.element_to_be_clickable(locator), timeout,
+                               locator_event("clickable", locator))
 
     def find_all(self, locator, timeout=None):
         """Wait for all matching elements to be present and return them."""
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.presence_of_all_elements_located(locator))
+        cached = self._cache_get(("all", locator))
+        if cached is not None:
+            return cached
+        elements = self.wait_until(EC.presence_of_all_elements_located(locator), timeout,
+                                   locator_event("all_present", locator))
+        self._cache_put(("all", locator), elements)
+        return elements
 
     def find_present(self, locator, timeout=None):
         """Wait for element to exist in DOM (doesn't need to be visible)."""
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        cached = self._cache_get(("present", locator))
+        if cached is not None:
+            return cached
+        element = self.wait_until(EC.presence_of_element_located(locator), timeout,
+                                  locator_event("present", locator))
+        self._cache_put(("present", locator), element)
+        return element
+
+    def with_elements(self, locator, action, timeout=None):
+        """
+        Run action(elements) on the (possibly cached) matches of locator.
+        If a cached element has gone stale, look it up again and retry once.
+        """
+        try:
+            return action(self.find_all(locator, timeout))
+        except StaleElementReferenceException:
+            if self.element_cache is None:
+                raise
+            self.element_cache.invalidate(("all", locator))
+            return action(self.find_all(locator, timeout))
+
+    # --- Element cache ---
+
+    def _cache_get(self, key):
+        if self.element_cache is None:
+            return None
+        return self.element_cache.get(key)
+
+    def _cache_put(self, key, value):
+        if self.element_cache is not None:
+            self.element_cache.put(key, value)
+
+    def page_changed(self):
+        """Invalidate cached elements of every page sharing this driver."""
+        bump_generation(self.driver)
 
     # --- Element actions ---
 
     def click(self, locator, timeout=None):
         """Wait for element to be clickable, then click."""
         element = self.find_clickable(locator, timeout)
+        self.mark_navigation()
         element.click()
+        self.page_changed()
 
     def js_click(self, element):
         """Click element via JavaScript (bypasses overlay issues)."""
+        self.mark_navigation()
         self.driver.execute_script("arguments[0].click();", element)
+        self.page_changed()
 
     def send_keys(self, locator, text, timeout=None):
         """Clear field and type text."""
         element = self.find(locator, timeout)
         element.clear()
         element.send_keys(text)
+        self.page_changed()
 
     def get_text(self, locator, timeout=None):
         """Return the visible text of an element."""
@@ -66,9 +144,7 @@ class BasePage:
     def is_visible(self, locator, timeout=5):
         """Return True if element is visible within timeout."""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self.find(locator, timeout)
             return True
         except TimeoutException:
             return False
@@ -76,9 +152,7 @@ class BasePage:
     def is_clickable(self, locator, timeout=5):
         """Return True if element is clickable within timeout."""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
+            self.find_clickable(locator, timeout)
             return True
         except TimeoutException:
             return False
@@ -86,9 +160,7 @@ class BasePage:
     def is_present(self, locator, timeout=5):
         """Return True if element exists in the DOM within timeout."""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
+            self.find_present(locator, timeout)
             return True
         except TimeoutException:
             return False
@@ -101,21 +173,26 @@ class BasePage:
     def get_url(self):
         return self.driver.current_url
 
+    def go_to(self, url):
+        """Navigate the current tab to url."""
+        install_stability_tracker(self.driver)
+        self.mark_navigation()
+        self.driver.get(url)
+        self.page_changed()
+
     def wait_for_url_contains(self, text, timeout=None):
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.url_contains(text))
+        return self.wait_until(EC.url_contains(text), timeout, ("url_contains", None, text))
 
     def wait_for_title_contains(self, text, timeout=None):
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.title_contains(text))
+        return self.wait_until(EC.title_contains(text), timeout, ("title_contains", None, text))
 
     # --- Scrolling ---
 
-    def scroll_to_element(self, element):
-        """Scroll element into the center of the viewport."""
+    def scroll_to_element(self, element, smooth=False):
+        """Scroll element into the center of the viewport (instantly unless smooth)."""
         self.driver.execute_script(
-            "arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});",
-            element
+            "arguments[0].scrollIntoView({block: 'center', behavior: arguments[1]});",
+            element, "smooth" if smooth else "instant"
         )
         self.wait_for_page_stable()
 
@@ -142,23 +219,76 @@ class BasePage:
         """Switch to the most recently opened tab."""
         self.wait.until(lambda d: len(d.window_handles) > 1)
         self.driver.switch_to.window(self.driver.window_handles[-1])
+        self.page_changed()
+        if self.lean_profile is not None:
+            # Network.setBlockedURLs only covers the tab it was sent to
+            self.lean_profile.apply_driver(self.driver)
 
     def switch_to_main_tab(self):
         self.driver.switch_to.window(self.driver.window_handles[0])
+        self.page_changed()
 
     def get_tab_count(self):
         return len(self.driver.window_handles)
 
+    # --- Checkpoints ---
+
+    def save_checkpoint(self, name):
+        """Record browser state after a journey step (no-op when disabled)."""
+        if self.checkpoints is not None:
+            self.checkpoints.save(name, self.driver)
+
+    def resume_from(self, name):
+        """Restore a saved checkpoint; returns False if none is available."""
+        if self.checkpoints is None:
+            return False
+        self.page_changed()
+        return self.checkpoints.restore(name, self.driver)
+
+    # --- Performance metrics ---
+
+    def mark_navigation(self):
+        """Snapshot CDP counters before a possible navigation, so the next page gets its own share."""
+        if self.perf_store is not None:
+            self.perf_store.mark(self.driver)
+
+    def record_performance(self, page):
+        """Store navigation/paint/CDP metrics of the current page under page (no-op when disabled)."""
+        if self.perf_store is not None:
+            self.perf_store.record(page, self.driver)
+
     # --- Utilities ---
 
-    def wait_for_page_stable(self, timeout=2):
-        """Wait until document.readyState is 'complete'."""
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-        except TimeoutException:
-            pass
+    @staticmethod
+    def to_css_selector(locator):
+        """Convert an ID / CLASS_NAME / CSS_SELECTOR locator to a CSS selector string."""
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            return value
+        if by == By.CLASS_NAME:
+            return f".{value}"
+        if by == By.ID:
+            return f"#{value}"
+        if by == By.TAG_NAME:
+            return value
+        raise ValueError(f"Locator {locator} has no CSS equivalent.")
+
+    def wait_for_page_stable(self, timeout=2, quiet_ms=QUIET_MS, strict=False):
+        """
+        Wait until the page is idle: loaded, no first-party fetch/XHR in
+        flight, no content mutations for quiet_ms and no finite animations
+        running. Returns the seconds it took. A page still busy at the
+        timeout is reported, or raises TimeoutException when strict is set.
+        """
+        label = f"{type(self).__name__}.{sys._getframe(1).f_code.co_name}"
+        result = wait_until_stable(self.driver, timeout, quiet_ms, label=label)
+        if not result["stable"]:
+            message = (f"Page not idle after {result['elapsed']:.2f}s "
+                       f"(waiting for: {', '.join(result['waiting_for'])})")
+            if strict:
+                raise TimeoutException(message)
+            print(f"  {message}")
+        return result["elapsed"]
 
     def wait_for_element_staleness(self, element, timeout=10):
         """Wait until element is removed from the DOM (e.g. after page reload)."""
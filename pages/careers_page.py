@@ -3,10 +3,14 @@ Careers Page - handles the Insider One careers page and Lever job board interact
 Covers navigation, filtering, job listing verification, and application.
 """
 
+import os
+import datetime
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
+from utils.event_wait import locator_event
+from utils.lever_api import company_from_board_url, posting_id_from_url
 
 
 class CareersPage(BasePage):
@@ -28,6 +32,105 @@ class CareersPage(BasePage):
     JOB_GROUP_TITLE = (By.CLASS_NAME, "posting-category-title")
     APPLY_BTN = (By.CSS_SELECTOR, "a.posting-btn-submit")
 
+    # Select the Lever dropdowns through query parameters instead of the UI
+    FILTERS_VIA_URL = False
+
+    # Opens the dropdown, waits in-page for its options, then picks the exact
+    # match or else the first partial match. Resolves with a status dict.
+    SELECT_FILTER_JS = """
+        var wrapperSel = arguments[0], buttonSel = arguments[1], popupSel = arguments[2],
+            index = arguments[3], wanted = arguments[4].trim().toLowerCase();
+        var done = arguments[arguments.length - 1];
+        function text(el) { return el ? (el.innerText || el.textContent || '').trim() : ''; }
+
+        var wrappers = document.querySelectorAll(wrapperSel);
+        var wrapper = wrappers[index];
+        if (!wrapper) { done({status: 'no_filter', count: wrappers.length}); return; }
+
+        var btn = wrapper.querySelector(buttonSel);
+        if (text(btn).toLowerCase().indexOf(wanted) !== -1) {
+            done({status: 'already_selected', label: text(btn)});
+            return;
+        }
+        btn.click();
+
+        function options() {
+            var popup = wrapper.querySelector(popupSel);
+            if (!popup) return [];
+            return Array.prototype.filter.call(popup.querySelectorAll('*'), function (el) {
+                return el.children.length === 0 && text(el);
+            });
+        }
+
+        var deadline = Date.now() + 10000;
+        (function pick() {
+            var leaves = options();
+            if (!leaves.length && Date.now() < deadline) { setTimeout(pick, 50); return; }
+
+            var target = leaves.filter(function (el) { return text(el).toLowerCase() === wanted; })[0]
+                || leaves.filter(function (el) { return text(el).toLowerCase().indexOf(wanted) !== -1; })[0];
+            if (target) {
+                var label = text(target);
+                target.click();
+                done({status: 'selected', label: label});
+            } else {
+                btn.click();
+                done({status: 'not_found', options: leaves.map(text)});
+            }
+        })();
+    """
+
+    # Indexes postings [start, start + count) directly (count < 0 = all) and
+    # gives each the nearest preceding group header as its department: a
+    # binary search by document position for the first posting, then a
+    # forward-only cursor over the headers. Unlike walking the board from the
+    # top, later chunks don't revisit every earlier posting.
+    EXTRACT_POSTINGS_JS = """
+        var postingSel = arguments[0], titleSel = arguments[1], locationSel = arguments[2],
+            groupSel = arguments[3], applySel = arguments[4], start = arguments[5], count = arguments[6];
+        function text(el) { return el ? (el.innerText || el.textContent || '').trim() : null; }
+        function precedes(a, b) { return !!(a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING); }
+
+        var postings = document.querySelectorAll(postingSel);
+        var headers = document.querySelectorAll(groupSel);
+        var end = count < 0 ? postings.length : Math.min(postings.length, start + count);
+        var records = [];
+        if (start >= end) return records;
+
+        var lo = 0, hi = headers.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >> 1;
+            if (precedes(headers[mid], postings[start])) lo = mid + 1; else hi = mid;
+        }
+        var header = lo - 1;
+
+        for (var i = start; i < end; i++) {
+            var el = postings[i];
+            while (header + 1 < headers.length && precedes(headers[header + 1], el)) header++;
+            var apply = el.querySelector(applySel);
+            records.push({
+                index: i,
+                id: el.getAttribute('data-qa-posting-id'),
+                title: text(el.querySelector(titleSel)),
+                location: text(el.querySelector(locationSel)),
+                group: header >= 0 ? text(headers[header]) : null,
+                apply_href: apply ? apply.href : null
+            });
+        }
+        return records;
+    """
+
+    COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+
+    APPLY_HREFS_JS = """
+        return Array.prototype.map.call(document.querySelectorAll(arguments[0]), function (a) {
+            return a.href;
+        });
+    """
+
+    # Default number of postings serialized per round trip when streaming
+    CHUNK_SIZE = 100
+
     def __init__(self, driver):
         super().__init__(driver)
 
@@ -35,7 +138,11 @@ class CareersPage(BasePage):
 
     def is_careers_page_opened(self):
         """Check if URL contains 'careers'."""
-        return "careers" in self.get_url().lower()
+        return self.is_careers_url(self.get_url())
+
+    @staticmethod
+    def is_careers_url(url):
+        return "careers" in url.lower()
 
     def is_explore_open_roles_visible(self):
         """Check if 'Explore open roles' button exists in the DOM."""
@@ -52,15 +159,13 @@ class CareersPage(BasePage):
 
     def click_software_development_block(self):
         """Click the Software Development link that navigates to Lever."""
-        # Team blocks load via AJAX after readyState is already "complete",
-        # so we use a longer timeout to account for the async rendering.
-        link = self.find_present(self.SOFTWARE_DEV_LINK, timeout=30)
+        # Team blocks load via AJAX after readyState is already "complete";
+        # the stability wait returns once those requests and re-renders settle.
+        self.wait_for_page_stable(timeout=self.timeout)
+        link = self.find_present(self.SOFTWARE_DEV_LINK)
 
         # Verify href is populated (content loads dynamically)
-        WebDriverWait(self.driver, 20).until(
-            lambda d: link.get_attribute("href") is not None
-            and "Software%20Development" in link.get_attribute("href")
-        )
+        self.wait_until(lambda d: "Software%20Development" in (link.get_attribute("href") or ""))
 
         print(f"  Found: {link.text}")
         print(f"  Href: {link.get_attribute('href')}")
@@ -69,8 +174,10 @@ class CareersPage(BasePage):
         self.js_click(link)
 
         # Wait for navigation to Lever
-        WebDriverWait(self.driver, 20).until(EC.url_contains("lever.co"))
+        self.wait_for_url_contains("lever.co")
         print("  Navigated to Lever page.")
+        self.record_performance("lever_board")
+        self.save_checkpoint("lever_board")
 
     # --- Lever filters ---
 
@@ -78,56 +185,57 @@ class CareersPage(BasePage):
         """
         Select an option from a Lever filter dropdown by wrapper index.
         Indices: 0=Location Type, 1=Location, 2=Team, 3=Work Type
+        Opening the dropdown, exact-then-partial matching and the click all
+        happen in one in-page script.
         """
-        wrappers = self.find_all(self.FILTER_WRAPPER, timeout=15)
-        wrapper = wrappers[wrapper_index]
-
-        btn = wrapper.find_element(*self.FILTER_BUTTON)
-        current_text = btn.text.strip()
+        result = self.driver.execute_async_script(
+            self.SELECT_FILTER_JS,
+            self.to_css_selector(self.FILTER_WRAPPER),
+            self.to_css_selector(self.FILTER_BUTTON),
+            self.to_css_selector(self.FILTER_POPUP),
+            wrapper_index,
+            option_text,
+        )
+        status = result["status"]
 
-        # Skip if already selected
-        if option_text.lower() in current_text.lower():
+        if status == "already_selected":
             print(f"  Filter [{wrapper_index}]: '{option_text}' already selected, skipping.")
             return
+        if status == "no_filter":
+            raise Exception(f"Lever filter [{wrapper_index}] not found "
+                            f"({result['count']} filter(s) on the page).")
 
-        # Open dropdown
-        self.scroll_to_element(btn)
-        self.js_click(btn)
-
-        # Wait for popup to appear
-        popup = WebDriverWait(wrapper, 10).until(
-            EC.visibility_of_element_located(self.FILTER_POPUP)
-        )
-
-        # Find the matching option inside the popup
-        options = popup.find_elements(By.XPATH, ".//*[not(*)]")
-        target = None
-
-        for opt in options:
-            opt_text = opt.text.strip()
-            if opt_text and option_text.lower() == opt_text.lower():
-                target = opt
-                break
-
-        # Fallback: partial match
-        if target is None:
-            for opt in options:
-                opt_text = opt.text.strip()
-                if opt_text and option_text.lower() in opt_text.lower():
-                    target = opt
-                    break
-
-        if target:
-            print(f"  Filter [{wrapper_index}]: selecting '{target.text.strip()}'")
-            self.js_click(target)
+        self.page_changed()
+        if status == "selected":
+            print(f"  Filter [{wrapper_index}]: selecting '{result['label']}'")
         else:
             print(f"  Filter [{wrapper_index}]: '{option_text}' not found, closing popup.")
-            self.js_click(btn)
+            print(f"  Available options: {result['options']}")
 
         self.wait_for_page_stable()
 
+    @staticmethod
+    def filter_url(url, **filters):
+        """Return url with Lever's filter query parameters (location, team, ...) set."""
+        parts = urlsplit(url)
+        query = dict(parse_qsl(parts.query))
+        query.update(filters)
+        return urlunsplit(parts._replace(query=urlencode(query, quote_via=quote)))
+
+    def _select_lever_filters_via_url(self, **filters):
+        """Apply filters through Lever's query parameters, skipping the dropdowns."""
+        url = self.filter_url(self.get_url(), **filters)
+
+        print(f"  Filters via URL: {url}")
+        self.go_to(url)
+        self.wait_for_page_stable()
+
     def apply_filters(self, location="Istanbul, Turkiye", department="Quality Assurance"):
         """Apply location and department filters on the Lever page."""
+        if self.FILTERS_VIA_URL:
+            self._select_lever_filters_via_url(location=location, team=department)
+            return
+
         print(f"  Location filter: {location}")
         self._select_lever_filter(1, location)
 
@@ -137,86 +245,200 @@ class CareersPage(BasePage):
     # --- Job listing verification ---
 
     def is_job_list_displayed(self):
-        """Return True if at least one job posting is visible."""
-        return self.is_present(self.JOB_ITEM, timeout=15)
+        """Return True if at least one job posting is on the board."""
+        try:
+            return self.wait_until(lambda d: self.get_job_count() > 0, 15,
+                                   locator_event("all_present", self.JOB_ITEM))
+        except TimeoutException:
+            return False
 
-    def get_all_jobs(self):
-        """Return all job posting elements."""
-        return self.find_all(self.JOB_ITEM, timeout=10)
+    def get_all_jobs(self, timeout=10):
+        """
+        Return all job posting WebElements, for callers that interact with
+        them (click, hover, find inside). To count or read postings use
+        get_job_count / iter_postings, which don't create an element
+        reference per posting.
+        """
+        return self.find_all(self.JOB_ITEM, timeout=timeout)
 
     def get_job_count(self):
-        return len(self.get_all_jobs())
+        """Number of postings on the board, in one execute_script call."""
+        return self.driver.execute_script(self.COUNT_JS, self.to_css_selector(self.JOB_ITEM))
+
+    def extract_postings(self):
+        """
+        Read every posting in a single execute_script call.
+        Returns plain dicts: index, id, title, location, group, apply_href.
+        """
+        return self._read_postings(0, -1)
+
+    def iter_postings(self, chunk_size=None):
+        """
+        Yield posting records (same shape as extract_postings) in chunks of
+        chunk_size, paging through the board by index. Only one chunk is
+        held at a time, so memory and per-call latency stay flat on large boards.
+        """
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        start = 0
+        while True:
+            chunk = self._read_postings(start, chunk_size)
+            yield from chunk
+            if len(chunk) < chunk_size:
+                return
+            start += chunk_size
+
+    def _read_postings(self, start, count):
+        return self.driver.execute_script(
+            self.EXTRACT_POSTINGS_JS,
+            self.to_css_selector(self.JOB_ITEM),
+            self.to_css_selector(self.JOB_TITLE),
+            self.to_css_selector(self.JOB_LOCATION),
+            self.to_css_selector(self.JOB_GROUP_TITLE),
+            self.to_css_selector(self.APPLY_BTN),
+            start,
+            count,
+        ) or []
+
+    @staticmethod
+    def location_matches(posting, expected_location):
+        return expected_location.lower() in (posting["location"] or "").lower()
+
+    def screenshot_posting(self, index, filename):
+        """Scroll a single posting card into view and save a screenshot of it."""
+        job = self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0])[arguments[1]];",
+            self.to_css_selector(self.JOB_ITEM), index
+        )
+        self.scroll_to_element(job)
+        job.screenshot(filename)
+        return filename
 
     def verify_all_jobs_match_filters(self, expected_location="Istanbul, Turkiye",
-                                       expected_department="Quality Assurance"):
+                                       expected_department="Quality Assurance",
+                                       screenshot_dir="screenshots"):
         """
         Verify every listed job matches the applied filters.
         Checks location per posting card and department via group headers.
+        Postings are streamed in chunks (iter_postings) and validated in
+        memory; failing cards are only scrolled to when screenshot_dir is set.
         """
-        jobs = self.get_all_jobs()
+        print("  Scanning job postings...")
+        all_match = True
+        scanned = 0
+        group_names = {}
+
+        for posting in self.iter_postings():
+            scanned += 1
+            print(f"  Job {posting['index'] + 1}: {posting['title']} | Location: {posting['location']}")
+            if posting["group"]:
+                group_names[posting["group"]] = True
+
+            if not self.location_matches(posting, expected_location):
+                print(f"    FAIL: job {posting['index'] + 1} expected location '{expected_location}'")
+                all_match = False
+                if screenshot_dir:
+                    self._screenshot_failing_posting(posting, screenshot_dir)
 
-        if not jobs:
+        if not scanned:
             print("  ERROR: No job postings found on the Lever page.")
             return False
+        print(f"  Scanned {scanned} job posting(s).")
 
-        print(f"  Scanning {len(jobs)} job posting(s)...")
-        all_match = True
+        # Department check via group headers
+        group_names = list(group_names)
+        print(f"  Group headers: {group_names}")
 
-        for index, job in enumerate(jobs, 1):
-            try:
-                self.scroll_to_element(job)
+        if not any(expected_department.lower() in name.lower() for name in group_names):
+            print(f"  FAIL: '{expected_department}' group header not found.")
+            all_match = False
+        else:
+            print(f"  '{expected_department}' group header verified.")
 
-                title = job.find_element(*self.JOB_TITLE).text
-                location = job.find_element(*self.JOB_LOCATION).text
+        return all_match
 
-                print(f"  Job {index}: {title} | Location: {location}")
+    def _screenshot_failing_posting(self, posting, screenshot_dir):
+        os.makedirs(screenshot_dir, exist_ok=True)
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        filename = f"{screenshot_dir}/FAIL_posting_{posting['index'] + 1}_{timestamp}.png"
+        try:
+            self.screenshot_posting(posting["index"], filename)
+            print(f"    Screenshot saved: {filename}")
+        except Exception as e:
+            print(f"    Could not save screenshot: {e}")
 
-                if expected_location.lower() not in location.lower():
-                    print(f"    FAIL: expected location '{expected_location}'")
-                    all_match = False
+    def verify_jobs_against_api(self, client, expected_location="Istanbul, Turkiye",
+                                expected_department="Quality Assurance"):
+        """
+        Diff the postings rendered on the board against the expected set
+        from Lever's postings API, filtered in Python. Returns True when
+        the board shows exactly the expected postings.
+        """
+        company = company_from_board_url(self.get_url())
+        expected = client.expected_postings(company, expected_location, expected_department)
 
-            except Exception as e:
-                print(f"  WARNING: Could not inspect job {index} - {e}")
-                continue
+        def key(record):
+            return record.get("id") or posting_id_from_url(record.get("apply_href")) or record["title"]
 
-        # Department check via group headers
-        try:
-            group_titles = self.find_all(self.JOB_GROUP_TITLE, timeout=5)
-            group_names = [g.text for g in group_titles]
-            print(f"  Group headers: {group_names}")
+        expected_by_key = {key(r): r for r in expected}
+        shown_by_key = {key(r): r for r in self.iter_postings()}
+        missing = [expected_by_key[k] for k in expected_by_key if k not in shown_by_key]
+        unexpected = [shown_by_key[k] for k in shown_by_key if k not in expected_by_key]
 
-            if not any(expected_department.lower() in name.lower() for name in group_names):
-                print(f"  FAIL: '{expected_department}' group header not found.")
-                all_match = False
-            else:
-                print(f"  '{expected_department}' group header verified.")
-        except Exception:
-            print("  WARNING: Could not verify group headers.")
+        print(f"  API: {len(expected)} expected posting(s), board shows {len(shown_by_key)}.")
+        for record in missing:
+            print(f"    MISSING on board: {record['title']} | {record['location']}")
+        for record in unexpected:
+            print(f"    UNEXPECTED on board: {record['title']} | {record['location']}")
 
-        return all_match
+        return not missing and not unexpected
 
     # --- Application ---
 
     def click_apply_on_first_job(self):
         """Click the Apply button on the first job posting."""
-        jobs = self.get_all_jobs()
-
-        if not jobs:
-            raise Exception("No job postings found to apply to.")
+        def find_apply_button(jobs):
+            if not jobs:
+                raise Exception("No job postings found to apply to.")
 
-        first_job = jobs[0]
-        self.scroll_to_element(first_job)
+            first_job = jobs[0]
+            self.scroll_to_element(first_job)
+            apply_btn = first_job.find_element(*self.APPLY_BTN)
+            return apply_btn, apply_btn.get_attribute("href")
 
-        apply_btn = first_job.find_element(*self.APPLY_BTN)
-        print(f"  Apply URL: {apply_btn.get_attribute('href')}")
+        apply_btn, href = self.with_elements(self.JOB_ITEM, find_apply_button, timeout=10)
+        print(f"  Apply URL: {href}")
         self.js_click(apply_btn)
 
+    def collect_apply_hrefs(self):
+        """Return every posting's Apply link in one execute_script call."""
+        selector = f"{self.to_css_selector(self.JOB_ITEM)} {self.to_css_selector(self.APPLY_BTN)}"
+        return [href for href in self.driver.execute_script(self.APPLY_HREFS_JS, selector) or [] if href]
+
+    def verify_apply_links(self, checker, hrefs=None):
+        """
+        Check every Apply link over HTTP (ApplyLinkChecker) instead of
+        clicking through them. True when all land on a Lever application form.
+        """
+        hrefs = self.collect_apply_hrefs() if hrefs is None else hrefs
+        if not hrefs:
+            print("  ERROR: No Apply links found on the Lever page.")
+            return False
+
+        results = checker.check_all(hrefs)
+        failed = [r for r in results if not r["ok"]]
+        slowest = max(r["elapsed"] for r in results)
+        print(f"  Checked {len(results)} Apply link(s), slowest {slowest:.2f}s.")
+        for result in failed:
+            print(f"    FAIL: {result['href']} - {result['error']}")
+        return not failed
+
     def is_lever_application_form_opened(self):
         """Verify the browser navigated to a Lever application form."""
         if len(self.driver.window_handles) > 1:
             self.switch_to_new_tab()
 
         self.wait_for_page_stable()
+        self.record_performance("apply_form")
         current_url = self.get_url()
         print(f"  Redirected to: {current_url}")
         return "lever.co" in current_url
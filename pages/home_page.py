@@ -19,9 +19,10 @@ class HomePage(BasePage):
 
     def open(self):
         """Navigate to the homepage and dismiss the cookie banner if present."""
-        self.driver.get(self.URL)
+        self.go_to(self.URL)
         self._accept_cookies()
         self.wait_for_page_stable()
+        self.record_performance("home")
 
     def _accept_cookies(self):
         """Click the cookie accept button if it appears."""
@@ -33,11 +34,14 @@ class HomePage(BasePage):
 
     def is_home_page_opened(self):
         """Verify the homepage loaded by checking URL and title."""
-        current_url = self.get_url()
-        title = self.get_title()
-        return ("insiderone.com" in current_url or
-                "Insider" in title or
-                "insider" in current_url.lower())
+        return self.looks_like_home(self.get_url(), self.get_title())
+
+    @staticmethod
+    def looks_like_home(url, title):
+        """Homepage check on a URL and title, shared with the HTTP engine."""
+        return ("insiderone.com" in url or
+                "Insider" in (title or "") or
+                "insider" in url.lower())
 
     def click_we_are_hiring(self):
         """Scroll to footer, click 'We're hiring' link via JS to avoid overlay issues."""
@@ -46,3 +50,4 @@ class HomePage(BasePage):
         self.scroll_to_element(element)
         self.js_click(element)
         self.wait_for_url_contains("careers")
+        self.record_performance("careers")
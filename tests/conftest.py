@@ -3,47 +3,378 @@ Pytest configuration - fixtures and automatic screenshot on failure.
 """
 
 import pytest
+import contextlib
 import os
 import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from functools import partial
+from utils.driver_factory import build_chrome_options, create_chrome_driver, resolve_chromedriver
+from utils.driver_pool import DriverPool
+from utils.remote_scheduler import NODE_LOST_ERRORS, RemoteScheduler
+from utils.record_replay import NetworkRecorder, RecordingListener, ReplayServer
+from utils.profiler import CommandProfiler
+from utils.steps import add_step_listener, remove_step_listener
+from utils.lever_api import LEVER_API_URL, LeverPostingsClient
+from utils.checkpoints import DEFAULT_CHECKPOINT_FILE, CheckpointStore
+from utils.lean_profile import LeanProfile
+from utils.element_cache import ElementCache
+from utils.capture import StepCapture, wait_for_pending_writes
+from utils.cdp import CDPError
+from utils.screencast import ScreencastRecorder, wait_for_encoders
+from utils.link_checker import ApplyLinkChecker
+from utils.fingerprints import DEFAULT_BOARD_URL, DEFAULT_FINGERPRINT_FILE, ContentFingerprinter, FingerprintStore
+from utils import stability
+from utils.perf_metrics import DEFAULT_PERF_DB, PerfStore
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+from pages.base_page import BasePage
+from pages.home_page import HomePage
+from pages.careers_page import CareersPage
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("browser")
+    group.addoption("--headless", action="store_true", default=False,
+                    help="Run Chrome in headless mode (CI/CD).")
+    group.addoption("--pool-size", type=int, default=1,
+                    help="Number of warm Chrome sessions kept between tests.")
+    group.addoption("--max-reuse", type=int, default=20,
+                    help="Quit a pooled session after this many tests.")
+    group.addoption("--prewarm", action="store_true", default=False,
+                    help="Start the next browser in the background while a test runs.")
+    group.addoption("--lean", action="store_true", default=False,
+                    help="Block images, fonts, media, analytics and chat widgets; eager page loads.")
+    group.addoption("--block-url", action="append", default=[], metavar="PATTERN",
+                    help="Extra URL pattern to block in the lean profile; may be repeated.")
+    group.addoption("--network-stats", action="store_true", default=False,
+                    help="Report requests/bytes for a normal run, to compare against --lean.")
+    group.addoption("--element-cache", action="store_true", default=False,
+                    help="Cache located elements per page until navigation or staleness.")
+    group.addoption("--wait-engine", choices=("poll", "event"), default="poll",
+                    help="poll = WebDriverWait polling, event = in-page MutationObserver waits.")
+    group.addoption("--remote-url", action="append", default=[], metavar="URL",
+                    help="Remote WebDriver endpoint (standalone server or Grid); may be repeated.")
+    group.addoption("--remote-max-sessions", type=int, default=1,
+                    help="Sessions per remote endpoint that doesn't report its slots.")
+    group.addoption("--requeue", type=int, default=1,
+                    help="Times a session start is retried when no endpoint is free, and (with "
+                         "pytest-rerunfailures) a test is re-run when its endpoint dies.")
+
+    group = parser.getgroup("record/replay")
+    group.addoption("--record", metavar="DIR", default=None,
+                    help="Record the site's HTTP exchanges into an archive directory.")
+    group.addoption("--replay", metavar="DIR", default=None,
+                    help="Serve a recorded archive locally instead of the live site.")
+
+    group = parser.getgroup("checkpoints")
+    group.addoption("--checkpoints", action="store_true", default=False,
+                    help="Save a Lever board checkpoint for the matrix runner to resume from.")
+    group.addoption("--checkpoint-ttl", type=int, default=3600,
+                    help="Seconds before a saved checkpoint expires.")
+    group.addoption("--checkpoint-file", default=DEFAULT_CHECKPOINT_FILE)
+
+    group = parser.getgroup("verification")
+    group.addoption("--filters-via-url", action="store_true", default=False,
+                    help="Apply Lever filters through query parameters instead of the dropdowns.")
+    group.addoption("--verify-mode", choices=("ui", "api"), default="ui",
+                    help="ui = check each rendered card, api = diff the board against Lever's postings API.")
+    group.addoption("--lever-api", default=LEVER_API_URL,
+                    help="Base URL of the Lever postings API (or a local stand-in).")
+    group.addoption("--apply-mode", choices=("click", "links"), default="click",
+                    help="click = open the first Apply link in the browser, "
+                         "links = check every Apply link concurrently over HTTP.")
+    group.addoption("--link-concurrency", type=int, default=8,
+                    help="Apply links checked at once in --apply-mode links.")
+
+    group = parser.getgroup("incremental")
+    group.addoption("--incremental", action="store_true", default=False,
+                    help="Skip journeys whose content is unchanged since their last passing run.")
+    group.addoption("--unchanged", choices=("skip", "smoke"), default="skip",
+                    help="skip = skip unchanged journeys, smoke = only walk them to the Lever board.")
+    group.addoption("--force-full", action="store_true", default=False,
+                    help="Run every journey in full, but still record fingerprints for --incremental.")
+    group.addoption("--fingerprint-file", default=DEFAULT_FINGERPRINT_FILE)
+
+    group = parser.getgroup("diagnostics")
+    group.addoption("--capture-steps", type=int, default=0, metavar="N",
+                    help="Keep the last N step snapshots in memory; write them only on failure.")
+    group.addoption("--screencast", type=float, default=0, metavar="SECONDS",
+                    help="Keep the last SECONDS of a low-resolution screencast; encode it only on failure.")
+
+    group = parser.getgroup("profiling")
+    group.addoption("--profile", action="store_true", default=False,
+                    help="Count and time every WebDriver command per page method and step.")
+    group.addoption("--profile-dir", default=os.path.join("reports", "profile"),
+                    help="Where per-test profile reports (JSON/HTML) are written.")
+    group.addoption("--perf-metrics", action="store_true", default=False,
+                    help="Store navigation timing, paint/LCP and CDP metrics per page in a SQLite trend store.")
+    group.addoption("--perf-db", default=DEFAULT_PERF_DB)
+
+
+@pytest.fixture(scope="session")
+def lean_profile(request):
+    """Resource-blocking profile with --lean, a stats-only baseline with --network-stats."""
+    config = request.config
+    if config.getoption("--lean"):
+        profile = LeanProfile()
+        profile.blocked_urls += config.getoption("--block-url")
+    elif config.getoption("--network-stats"):
+        profile = LeanProfile.baseline()
+    else:
+        yield None
+        return
+
+    BasePage.lean_profile = profile
+    yield profile
+    BasePage.lean_profile = None
+
+    stats = profile.summary()
+    print(f"\n  Network: {stats['requests_completed']} request(s), "
+          f"{stats['bytes_transferred'] / 1024:.0f} KB transferred, "
+          f"{stats['requests_blocked']} blocked {stats['blocked_by_type']}")
+
+
+REMOTE_SCHEDULER = pytest.StashKey[RemoteScheduler]()
+DRIVER_POOL = pytest.StashKey[DriverPool]()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, lean_profile):
+    """Session-wide pool of warm Chrome sessions, local or spread over --remote-url endpoints."""
+    config = request.config
+    scheduler = config.stash.get(REMOTE_SCHEDULER, None)
+    if scheduler is not None:
+        scheduler.options_factory = partial(
+            build_chrome_options,
+            headless=config.getoption("--headless"),
+            capture_network=bool(config.getoption("--record")),
+            lean_profile=lean_profile,
+        )
+        factory = scheduler.create_driver
+    else:
+        factory = partial(
+            create_chrome_driver,
+            headless=config.getoption("--headless"),
+            # Resolve once per session; the manifest makes this a file lookup
+            driver_path=resolve_chromedriver(),
+            capture_network=bool(config.getoption("--record")),
+            lean_profile=lean_profile,
+        )
+    pool = DriverPool(
+        factory=factory,
+        size=config.getoption("--pool-size"),
+        max_reuse=config.getoption("--max-reuse"),
+        prewarm=config.getoption("--prewarm"),
+        on_evict=scheduler.forget if scheduler is not None else None,
+    )
+    # Page stability is summarized for browser runs only; drop waits from unit tests before it
+    config.stash[DRIVER_POOL] = pool
+    stability.history.clear()
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def network_recorder(request, lean_profile):
+    """Archive recorder, active only with --record."""
+    archive_dir = request.config.getoption("--record")
+    if not archive_dir:
+        yield None
+        return
+
+    # The recorder drains the performance log during the test; share each batch with the lean profile
+    recorder = NetworkRecorder(archive_dir, log_consumers=[lean_profile.collect] if lean_profile else [])
+
+    yield recorder
+
+    recorder.save()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def replay_server(request):
+    """With --replay, serve the archive locally and point the page objects at it."""
+    archive_dir = request.config.getoption("--replay")
+    if not archive_dir:
+        yield None
+        return
+
+    server = ReplayServer(archive_dir).start()
+    live_url = HomePage.URL
+    HomePage.URL = server.local_url(live_url)
+    print(f"\n  Replaying {archive_dir} at {server.base_url}")
+
+    yield server
+
+    HomePage.URL = live_url
+    server.stop()
+    print(f"\n  Replay: {server.hits} hit(s), {server.misses} miss(es)")
+
+
+@pytest.fixture(scope="session")
+def lever_client(request):
+    """Lever postings API client in --verify-mode api, otherwise None."""
+    if request.config.getoption("--verify-mode") != "api":
+        return None
+    return LeverPostingsClient(request.config.getoption("--lever-api"))
+
+
+@pytest.fixture(scope="session")
+def apply_checker(request):
+    """Apply link checker in --apply-mode links, otherwise None."""
+    if request.config.getoption("--apply-mode") != "links":
+        return None
+    return ApplyLinkChecker(concurrency=request.config.getoption("--link-concurrency"))
+
+
+@pytest.fixture(scope="session")
+def fingerprinter(request, replay_server):
+    """Fetches the content fingerprints of marked journeys (from the archive with --replay)."""
+    board_url = DEFAULT_BOARD_URL
+    if replay_server is not None:
+        board_url = replay_server.local_url(board_url)
+    return ContentFingerprinter(
+        board_url,
+        client=LeverPostingsClient(request.config.getoption("--lever-api")),
+    )
+
+
+@pytest.fixture(scope="session")
+def fingerprint_store(request):
+    return FingerprintStore(request.config.getoption("--fingerprint-file"))
+
+
+@pytest.fixture(autouse=True)
+def journey(request):
+    """
+    Incremental selection for tests marked @pytest.mark.journey(location, department).
+    With --incremental, a journey whose fingerprints match its last passing
+    run is skipped, or with --unchanged smoke returned as {"smoke": True, ...}.
+    Passing full runs record their fingerprints (see pytest_runtest_makereport).
+    """
+    config = request.config
+    marker = request.node.get_closest_marker("journey")
+    if marker is None or not (config.getoption("--incremental") or config.getoption("--force-full")):
+        return None
+
+    store = request.getfixturevalue("fingerprint_store")
+    location, department = marker.args
+    key = store.key(location, department)
+    fingerprint = request.getfixturevalue("fingerprinter").fingerprint(location, department)
+    changed = store.changed_parts(key, fingerprint)
+
+    info = {"key": key, "fingerprint": fingerprint, "store": store, "smoke": False}
+    request.node.journey = info
+    if changed or config.getoption("--force-full"):
+        print(f"\n  Journey '{key}': running in full (changed: {', '.join(changed) or 'forced'})")
+        return info
+
+    if config.getoption("--unchanged") == "skip":
+        pytest.skip(f"Journey '{key}' unchanged since its last passing run.")
+    print(f"\n  Journey '{key}': unchanged, smoke check only")
+    info["smoke"] = True
+    return info
 
 
 @pytest.fixture(scope="function")
-def driver():
-    """Start a fresh Chrome browser for each test, quit when done."""
-    chrome_options = Options()
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-popup-blocking")
-    chrome_options.add_argument("--disable-infobars")
-    chrome_options.add_argument("--disable-extensions")
+def driver(request, driver_pool, network_recorder, lean_profile):
+    """Borrow a clean Chrome session from the pool, return it when done."""
+    driver = driver_pool.acquire()
+
+    # Cleanups run in reverse order and all of them run even if one raises,
+    # so the session always goes back to the pool (freeing a remote slot too)
+    with contextlib.ExitStack() as cleanup:
+        cleanup.callback(driver_pool.release, driver)
+
+        if request.config.getoption("--profile"):
+            profiler = CommandProfiler(driver).attach()
+            add_step_listener(profiler.on_step)
+            cleanup.callback(_finish_profile, request, profiler)
 
-    # Uncomment for headless mode (CI/CD):
-    # chrome_options.add_argument("--headless")
-    # chrome_options.add_argument("--no-sandbox")
-    # chrome_options.add_argument("--disable-dev-shm-usage")
+        if request.config.getoption("--capture-steps"):
+            step_capture = StepCapture(driver, size=request.config.getoption("--capture-steps"))
+            add_step_listener(step_capture.on_step)
+            cleanup.callback(remove_step_listener, step_capture.on_step)
+            request.node.step_capture = step_capture
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+        if request.config.getoption("--screencast"):
+            try:
+                screencast = ScreencastRecorder(driver, seconds=request.config.getoption("--screencast")).start()
+            except (CDPError, OSError, KeyError, TimeoutError, WebDriverException) as e:
+                print(f"\n  Screencast unavailable: {e}")
+            else:
+                add_step_listener(screencast.on_step)
+                cleanup.callback(screencast.stop)
+                cleanup.callback(remove_step_listener, screencast.on_step)
+                request.node.screencast = screencast
+
+        if network_recorder is not None or lean_profile:
+            cleanup.callback(_collect_network, driver, network_recorder, lean_profile)
+
+        if network_recorder is None:
+            yield driver
+        else:
+            yield EventFiringWebDriver(driver, RecordingListener(network_recorder))
+
+
+def _collect_network(driver, network_recorder, lean_profile):
+    """Drain the performance log once; the recorder passes the entries on to the lean profile."""
+    if network_recorder is not None:
+        network_recorder.capture(driver)
+    elif lean_profile:
+        lean_profile.collect(driver)
+
+
+def _finish_profile(request, profiler):
+    remove_step_listener(profiler.on_step)
+    profiler.detach()
+    path = profiler.write_report(request.config.getoption("--profile-dir"), request.node.name)
+    print(f"\n  Profile saved: {path}")
 
-    yield driver
 
-    driver.quit()
+def pytest_collection_modifyitems(config, items):
+    """
+    With --remote-url and pytest-rerunfailures installed (pytest_configure warns
+    when it isn't), re-run browser tests that failed because their endpoint went
+    away. The rerun gets a fresh session: the dead one fails its reset and is
+    evicted, and the scheduler skips its node.
+    """
+    if REMOTE_SCHEDULER not in config.stash or not config.pluginmanager.hasplugin("rerunfailures"):
+        return
+    requeue = pytest.mark.flaky(reruns=config.getoption("--requeue"), only_rerun=list(NODE_LOST_ERRORS))
+    for item in items:
+        if "driver" in getattr(item, "fixturenames", ()):
+            item.add_marker(requeue)
 
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Take a screenshot automatically when a test fails."""
+    """Record passing journey fingerprints; take a screenshot automatically when a test fails."""
     outcome = yield
     report = outcome.get_result()
 
+    journey = getattr(item, "journey", None)
+    if report.when == "call" and report.passed and journey and not journey["smoke"]:
+        journey["store"].record_pass(journey["key"], journey["fingerprint"])
+
     if report.when == "call" and report.failed:
         driver = item.funcargs.get("driver", None)
+        step_capture = getattr(item, "step_capture", None)
+        screencast = getattr(item, "screencast", None)
+
+        if screencast:
+            # Encoded in a separate process; the extension depends on whether ffmpeg is available
+            path = screencast.flush("screenshots", item.name)
+            if path:
+                print(f"\n  Screencast encoding: {path}.{'mp4' if screencast.ffmpeg else 'html'}")
 
-        if driver:
+        if driver and step_capture:
+            # Final snapshot joins the buffered steps; files are written in the background
+            step_capture.snapshot("failure")
+            folder = step_capture.flush("screenshots", item.name)
+            print(f"\n  Step snapshots saved: {folder}")
+
+        elif driver:
             screenshot_dir = "screenshots"
             os.makedirs(screenshot_dir, exist_ok=True)
 
@@ -57,6 +388,69 @@ def pytest_runtest_makereport(item, call):
                 print(f"\n  Could not save screenshot: {e}")
 
 
+def pytest_sessionfinish(session, exitstatus):
+    """Let background snapshot writes and screencast encodes finish before the process exits."""
+    wait_for_pending_writes()
+    wait_for_encoders()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report page stabilization times, screencast overhead, stored page metrics and element cache effectiveness."""
+    waits = stability.summary()
+    if waits and DRIVER_POOL in config.stash:
+        terminalreporter.write_line(
+            f"Page stability: {waits['waits']} wait(s), {waits['total_time']:.2f}s total, "
+            f"slowest {waits['slowest']:.2f}s ({waits['slowest_label']}), "
+            f"{waits['unstable']} not idle at timeout"
+        )
+    screencasts = ScreencastRecorder.totals
+    if config.getoption("--screencast") and screencasts["recordings"]:
+        duration = screencasts["duration"] or 1
+        terminalreporter.write_line(
+            f"Screencast: {screencasts['frames']} frame(s) over {screencasts['duration']:.1f}s, "
+            f"frame decoding + handling {screencasts['reader_cpu']:.2f}s CPU "
+            f"({screencasts['reader_cpu'] / duration:.1%}, handler {screencasts['handler_cpu']:.2f}s), "
+            f"peak buffer {screencasts['peak_buffer_bytes'] / 1024:.0f} KB, "
+            f"{screencasts['encodes']} encode(s)"
+        )
+    if BasePage.perf_store is not None:
+        terminalreporter.write_line(
+            f"Perf metrics: {BasePage.perf_store.samples} page sample(s) stored in "
+            f"{BasePage.perf_store.path} (run {BasePage.perf_store.run_id}); "
+            f"trends: python -m utils.perf_metrics"
+        )
+    if config.getoption("--element-cache"):
+        totals = ElementCache.totals
+        terminalreporter.write_line(
+            f"Element cache: {totals['hits']} hit(s), {totals['misses']} miss(es), "
+            f"{totals['invalidations']} invalidation(s)"
+        )
+
+
 def pytest_configure(config):
     """Ensure the screenshots directory exists at startup."""
     os.makedirs("screenshots", exist_ok=True)
+    config.addinivalue_line(
+        "markers", "journey(location, department): journey inputs fingerprinted by --incremental"
+    )
+    BasePage.WAIT_ENGINE = config.getoption("--wait-engine")
+    BasePage.CACHE_ELEMENTS = config.getoption("--element-cache")
+    CareersPage.FILTERS_VIA_URL = config.getoption("--filters-via-url")
+    if config.getoption("--checkpoints"):
+        BasePage.checkpoints = CheckpointStore(
+            config.getoption("--checkpoint-file"),
+            ttl=config.getoption("--checkpoint-ttl"),
+        )
+    if config.getoption("--perf-metrics"):
+        BasePage.perf_store = PerfStore(config.getoption("--perf-db"))
+    if config.getoption("--remote-url"):
+        config.stash[REMOTE_SCHEDULER] = RemoteScheduler(
+            config.getoption("--remote-url"),
+            options_factory=build_chrome_options,
+            max_sessions=config.getoption("--remote-max-sessions"),
+            retries=config.getoption("--requeue"),
+        )
+        if config.getoption("--requeue") and not config.pluginmanager.hasplugin("rerunfailures"):
+            config.issue_config_time_warning(pytest.PytestConfigWarning(
+                "--requeue only retries session starts: install pytest-rerunfailures "
+                "to also re-run tests whose endpoint died."), stacklevel=2)
@@ -0,0 +1,165 @@
+"""
+Unit tests for the CDP connection, async tabs and AsyncCareersPage
+against a fake DevTools socket (no browser needed).
+"""
+
+import asyncio
+import contextlib
+import json
+import queue
+
+from pages.async_careers_page import AsyncCareersPage
+from pages.careers_page import CareersPage
+from utils.async_tabs import AsyncBrowser, script_expression
+from utils.cdp import CDPConnection
+from utils.stability import WAIT_STABLE_JS
+
+
+class FakeSocket:
+    """Answers every command from handler(message) and can push events."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.inbox = queue.Queue()
+        self.sent = []
+
+    def send(self, raw):
+        message = json.loads(raw)
+        self.sent.append(message)
+        reply = {"id": message["id"], "result": self.handler(message)}
+        if message.get("sessionId"):
+            reply["sessionId"] = message["sessionId"]
+        self.inbox.put(json.dumps(reply))
+        if message["method"] == "Page.navigate":
+            self.push("Page.loadEventFired", {}, message.get("sessionId"))
+
+    def push(self, method, params, session_id=None):
+        event = {"method": method, "params": params}
+        if session_id:
+            event["sessionId"] = session_id
+        self.inbox.put(json.dumps(event))
+
+    def recv(self):
+        raw = self.inbox.get()
+        if raw is None:
+            raise ConnectionError("closed")
+        return raw
+
+    def close(self):
+        self.inbox.put(None)
+
+
+def browser_handler(message):
+    method = message["method"]
+    if method == "Target.createTarget":
+        return {"targetId": f"T{message['id']}"}
+    if method == "Target.attachToTarget":
+        return {"sessionId": f"S-{message['params']['targetId']}"}
+    if method == "Runtime.evaluate":
+        return {"result": {"value": message.get("sessionId")}}
+    return {}
+
+
+class FakeTab:
+    """Returns board postings for EXTRACT_POSTINGS_JS calls, by (start, count)."""
+
+    def __init__(self, postings):
+        self.postings = postings
+        self.calls = 0
+
+    async def call(self, script, *args, async_script=False):
+        self.calls += 1
+        start, count = args[-2], args[-1]
+        return self.postings[start:] if count < 0 else self.postings[start:start + count]
+
+
+class FakeFilterTab:
+    """Selects every dropdown option and records which scripts ran."""
+
+    def __init__(self):
+        self.scripts = []
+
+    @contextlib.asynccontextmanager
+    async def settles(self):
+        yield
+
+    async def call(self, script, *args, async_script=False):
+        self.scripts.append(script)
+        if script == CareersPage.SELECT_FILTER_JS:
+            return {"status": "selected", "label": args[-1]}
+        return {"stable": True, "waiting_for": []}
+
+
+class TestAsyncTabs:
+
+    def test_tabs_run_concurrently_on_their_own_sessions(self):
+        socket = FakeSocket(browser_handler)
+        connection = CDPConnection("ws://fake", connect=lambda url, **kwargs: socket)
+        browser = AsyncBrowser(connection, max_tabs=2)
+
+        async def visit(url):
+            async with browser.tab(url) as tab:
+                return tab.session_id, await tab.evaluate("1")
+
+        async def main():
+            return await asyncio.gather(*(visit(f"http://board/{n}") for n in range(3)))
+
+        try:
+            results = asyncio.run(main())
+        finally:
+            browser.close()
+
+        assert len({session for session, _ in results}) == 3
+        assert all(session == value for session, value in results)
+        navigations = [m for m in socket.sent if m["method"] == "Page.navigate"]
+        assert sorted(m["params"]["url"] for m in navigations) == [f"http://board/{n}" for n in range(3)]
+        assert sum(1 for m in socket.sent if m["method"] == "Target.closeTarget") == 3
+
+    def test_script_expression_passes_args_and_done_callback(self):
+        sync = script_expression("return arguments[0] + arguments[1];", [1, 2])
+        assert sync.endswith(".apply(null, [1, 2])")
+
+        async_script = script_expression("arguments[arguments.length - 1](arguments[0]);", ["x"],
+                                         async_script=True)
+        assert async_script.startswith("new Promise(function (done)")
+        assert '["x"].concat([done])' in async_script
+
+    def test_async_careers_page_verifies_postings_in_chunks(self):
+        postings = [
+            {"index": i, "id": str(i), "title": f"QA {i}", "location": "Istanbul, Turkiye",
+             "group": "Quality Assurance", "apply_href": f"https://jobs.lever.co/x/{i}/apply"}
+            for i in range(5)
+        ]
+        postings[3]["location"] = "London, UK"
+        tab = FakeTab(postings)
+        page = AsyncCareersPage(tab)
+        page.CHUNK_SIZE = 2
+
+        summary = asyncio.run(page.verify_postings("Istanbul, Turkiye", "Quality Assurance"))
+
+        assert summary["scanned"] == 5
+        assert [p["index"] for p in summary["mismatches"]] == [3]
+        assert summary["passed"] is False
+        assert tab.calls == 3
+
+    def test_async_filters_wait_for_the_board_to_settle(self, monkeypatch):
+        monkeypatch.setattr(CareersPage, "FILTERS_VIA_URL", False)
+        tab = FakeFilterTab()
+
+        asyncio.run(AsyncCareersPage(tab).apply_filters())
+
+        assert tab.scripts == [CareersPage.SELECT_FILTER_JS, WAIT_STABLE_JS] * 2
+
+    def test_reader_cpu_is_counted_per_event_method(self):
+        socket = FakeSocket(browser_handler)
+        connection = CDPConnection("ws://fake", connect=lambda url, **kwargs: socket)
+        frames = []
+        connection.on("Page.screencastFrame", frames.append, "S-1")
+
+        socket.push("Page.screencastFrame", {"data": "anBlZw==", "sessionId": 1}, "S-1")
+        # The reader handles messages in order, so the event is counted once this reply arrives
+        connection.execute("Browser.getVersion")
+        connection.close()
+
+        assert len(frames) == 1
+        assert set(connection.event_cpu) == {"Page.screencastFrame"}
@@ -0,0 +1,30 @@
+"""
+Unit tests for the benchmark statistics and baseline comparison (no browser needed).
+"""
+
+from benchmarks.run_benchmarks import compare, percentile
+
+
+class TestBenchmarks:
+
+    def test_percentile_uses_nearest_rank(self):
+        values = [0.5, 0.1, 0.4, 0.2, 0.3]
+        assert percentile(values, 50) == 0.3
+        assert percentile(values, 95) == 0.5
+        assert percentile([], 50) is None
+
+    def test_compare_flags_slowdowns_and_extra_commands(self):
+        baseline = {
+            "extract_postings@100": {"p50": 0.100, "p95": 0.120, "commands": 1},
+            "apply_filters@100": {"p50": 0.500, "p95": 0.600, "commands": 6},
+        }
+        results = {
+            "extract_postings@100": {"p50": 0.110, "p95": 0.200, "commands": 1},  # within 20%
+            "apply_filters@100": {"p50": 0.700, "p95": 0.800, "commands": 7},
+            "iter_postings@100": {"p50": 9.0, "p95": 9.0, "commands": 99},       # no baseline yet
+        }
+
+        regressions = compare(results, baseline, threshold=0.2)
+
+        assert len(regressions) == 2
+        assert all(r.startswith("apply_filters@100") for r in regressions)
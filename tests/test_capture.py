@@ -0,0 +1,47 @@
+"""
+Unit tests for the step capture ring buffer (no browser needed).
+"""
+
+import base64
+import json
+
+from utils.capture import StepCapture, wait_for_pending_writes
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.url = "https://insiderone.com/"
+
+    def execute_script(self, script, *args):
+        return {"url": self.url, "outline": "body\n  footer"}
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {"data": base64.b64encode(b"jpeg-bytes").decode()}
+
+
+class TestStepCapture:
+
+    def test_buffer_keeps_only_last_n_snapshots(self):
+        capture = StepCapture(FakeDriver(), size=2)
+        for number in range(1, 5):
+            capture.on_step(number, f"step {number}")
+
+        assert [s["label"] for s in capture.buffer] == ["before step 3 - step 3", "before step 4 - step 4"]
+
+    def test_flush_writes_snapshots_in_background(self, tmp_path):
+        driver = FakeDriver()
+        capture = StepCapture(driver, size=3)
+        capture.on_step(1, "Opening homepage")
+        driver.url = "https://insiderone.com/careers/"
+        capture.snapshot("failure")
+
+        folder = capture.flush(str(tmp_path), "test_insider_qa_jobs_istanbul")
+        wait_for_pending_writes()
+
+        with open(f"{folder}/steps.json") as f:
+            steps = json.load(f)
+        assert [s["url"] for s in steps] == ["https://insiderone.com/", "https://insiderone.com/careers/"]
+        with open(f"{folder}/{steps[1]['screenshot']}", "rb") as f:
+            assert f.read() == b"jpeg-bytes"
+        assert len(capture.buffer) == 0
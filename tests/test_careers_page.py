@@ -0,0 +1,179 @@
+"""
+Unit tests for CareersPage helpers that run without a browser.
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+from pages.careers_page import CareersPage
+from utils.stability import WAIT_STABLE_JS
+
+
+class FakeDriver:
+
+    def __init__(self, url):
+        self.current_url = url
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        return "complete"
+
+    def execute_async_script(self, script, *args):
+        return {"stable": True, "waiting_for": []}
+
+
+class FakeBoardDriver:
+    """Serves EXTRACT_POSTINGS_JS calls from an in-memory board."""
+
+    def __init__(self, postings):
+        self.postings = postings
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        start, count = args[-2], args[-1]
+        self.calls.append((start, count))
+        return self.postings[start:] if count < 0 else self.postings[start:start + count]
+
+
+class FakeCountDriver:
+    """Counts postings in-page; has no find_elements, so no WebElements can be made."""
+
+    def __init__(self, count):
+        self.count = count
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return self.count
+
+
+class FakeFilterDriver:
+    """
+    Answers SELECT_FILTER_JS the way the in-page script does for a board
+    with the given dropdowns; picking an option re-renders the board,
+    which settles on the next stability wait.
+    """
+
+    def __init__(self, dropdowns):
+        self.dropdowns = dropdowns
+        self.labels = {index: label for index, (label, _) in dropdowns.items()}
+        self.rendering = False
+        self.calls = []
+
+    def execute_async_script(self, script, *args):
+        if script == WAIT_STABLE_JS:
+            self.calls.append(("stable", self.rendering))
+            self.rendering = False
+            return {"stable": True, "waiting_for": []}
+
+        assert script == CareersPage.SELECT_FILTER_JS
+        self.calls.append(("select",) + args)
+        index, wanted = args[3], args[4].strip().lower()
+        if index not in self.dropdowns:
+            return {"status": "no_filter", "count": len(self.dropdowns)}
+        if wanted in self.labels[index].lower():
+            return {"status": "already_selected", "label": self.labels[index]}
+
+        options = self.dropdowns[index][1]
+        target = (next((o for o in options if o.lower() == wanted), None)
+                  or next((o for o in options if wanted in o.lower()), None))
+        if target is None:
+            return {"status": "not_found", "options": options}
+        self.labels[index] = target
+        self.rendering = True
+        return {"status": "selected", "label": target}
+
+
+def posting(index, location, group="Quality Assurance"):
+    return {
+        "index": index,
+        "title": f"QA Engineer {index}",
+        "location": location,
+        "group": group,
+        "apply_href": f"https://jobs.lever.co/insiderone/{index}/apply",
+    }
+
+
+class TestCareersPageHelpers:
+
+    def test_location_match_is_case_insensitive(self):
+        postings = [
+            posting(0, "Istanbul, Turkiye"),
+            posting(1, "ISTANBUL, TURKIYE / Hybrid"),
+            posting(2, "London, UK"),
+            posting(3, None),
+        ]
+
+        matches = [CareersPage.location_matches(p, "Istanbul, Turkiye") for p in postings]
+
+        assert matches == [True, True, False, False]
+
+    def test_locators_convert_to_css(self):
+        assert CareersPage.to_css_selector(CareersPage.JOB_ITEM) == ".posting"
+        assert CareersPage.to_css_selector(CareersPage.APPLY_BTN) == "a.posting-btn-submit"
+        assert CareersPage.to_css_selector((By.ID, "wt-cli-accept-all-btn")) == "#wt-cli-accept-all-btn"
+
+    def test_filters_via_url_replace_team_and_keep_other_params(self, monkeypatch):
+        monkeypatch.setattr(CareersPage, "FILTERS_VIA_URL", True)
+        driver = FakeDriver("https://jobs.lever.co/insiderone?team=Software%20Development&commitment=Full-time")
+
+        CareersPage(driver).apply_filters("Istanbul, Turkiye", "Quality Assurance")
+
+        assert driver.visited == [
+            "https://jobs.lever.co/insiderone"
+            "?team=Quality%20Assurance&commitment=Full-time&location=Istanbul%2C%20Turkiye"
+        ]
+
+    def test_iter_postings_pages_through_the_board_in_chunks(self):
+        board = [posting(i, "Istanbul, Turkiye") for i in range(25)]
+        driver = FakeBoardDriver(board)
+
+        streamed = list(CareersPage(driver).iter_postings(chunk_size=10))
+
+        assert [p["index"] for p in streamed] == list(range(25))
+        assert driver.calls == [(0, 10), (10, 10), (20, 10)]
+
+    def test_job_count_is_read_in_page(self):
+        driver = FakeCountDriver(3)
+        careers_page = CareersPage(driver)
+
+        assert careers_page.is_job_list_displayed()
+        assert careers_page.get_job_count() == 3
+        assert driver.scripts == [(CareersPage.COUNT_JS, (".posting",))] * 2
+
+    def test_verify_streams_and_reports_mismatches(self):
+        board = [posting(i, "Istanbul, Turkiye") for i in range(5)] + [posting(5, "London, UK")]
+        careers_page = CareersPage(FakeBoardDriver(board))
+        careers_page.CHUNK_SIZE = 4
+
+        assert not careers_page.verify_all_jobs_match_filters(screenshot_dir=None)
+        assert careers_page.verify_all_jobs_match_filters(
+            expected_location="", expected_department="quality", screenshot_dir=None)
+
+    def test_dropdown_filters_select_in_page_and_wait_for_the_re_render(self):
+        driver = FakeFilterDriver({
+            1: ("Location", ["Istanbul, Turkiye", "London, UK"]),
+            2: ("Quality Assurance", ["Quality Assurance", "Sales"]),
+        })
+
+        CareersPage(driver).apply_filters("istanbul", "Quality Assurance")
+
+        selectors = ("div.filter-button-wrapper", "div.filter-button", "div.filter-popup")
+        assert driver.calls == [
+            ("select",) + selectors + (1, "istanbul"),
+            ("stable", True),
+            ("select",) + selectors + (2, "Quality Assurance"),
+        ]
+        assert driver.labels[1] == "Istanbul, Turkiye" and not driver.rendering
+
+    def test_missing_dropdown_raises_and_unknown_option_is_reported(self, capsys):
+        careers_page = CareersPage(FakeFilterDriver({1: ("Location", ["London, UK"])}))
+
+        careers_page._select_lever_filter(1, "Istanbul, Turkiye")
+        assert "Available options: ['London, UK']" in capsys.readouterr().out
+
+        with pytest.raises(Exception, match=r"Lever filter \[2\] not found \(1 filter"):
+            careers_page._select_lever_filter(2, "Quality Assurance")
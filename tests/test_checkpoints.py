@@ -0,0 +1,60 @@
+"""
+Unit tests for journey checkpoints (no browser needed).
+"""
+
+import time
+
+from utils.checkpoints import CheckpointStore
+
+
+class FakeDriver:
+
+    def __init__(self, url="https://jobs.lever.co/insiderone?team=Software%20Development"):
+        self.current_url = url
+        self.cookies = [{"name": "lever-referer", "value": "insiderone.com", "domain": "jobs.lever.co"}]
+        self.storage = {"consent": "yes"}
+        self.visited = []
+        self.added_cookies = []
+        self.written_storage = None
+
+    def get_cookies(self):
+        return self.cookies
+
+    def execute_script(self, script, *args):
+        if args:
+            self.written_storage = args[0]
+            return None
+        return self.storage
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def add_cookie(self, cookie):
+        self.added_cookies.append(cookie)
+
+
+class TestCheckpointStore:
+
+    def test_checkpoint_round_trip(self, tmp_path):
+        path = str(tmp_path / "checkpoints.json")
+        CheckpointStore(path).save("lever_board", FakeDriver())
+
+        driver = FakeDriver(url="about:blank")
+        assert CheckpointStore(path).restore("lever_board", driver)
+
+        assert driver.visited == [
+            "https://jobs.lever.co/",
+            "https://jobs.lever.co/insiderone?team=Software%20Development",
+        ]
+        assert driver.added_cookies[0]["name"] == "lever-referer"
+        assert driver.written_storage == {"consent": "yes"}
+
+    def test_expired_checkpoint_is_ignored(self, tmp_path):
+        store = CheckpointStore(str(tmp_path / "checkpoints.json"), ttl=60)
+        store.save("careers", FakeDriver())
+        store._checkpoints["careers"]["saved_at"] = time.time() - 120
+
+        driver = FakeDriver()
+        assert store.get("careers") is None
+        assert not store.restore("careers", driver)
+        assert driver.visited == []
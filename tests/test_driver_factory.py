@@ -0,0 +1,35 @@
+"""
+Unit tests for ChromeDriver resolution (no browser needed).
+"""
+
+import utils.driver_factory as driver_factory
+
+
+class FakeManager:
+    installs = 0
+
+    def __init__(self, path):
+        self.path = path
+
+    def install(self):
+        FakeManager.installs += 1
+        return self.path
+
+
+class TestResolveChromedriver:
+
+    def test_driver_path_is_cached_per_chrome_version(self, tmp_path, monkeypatch):
+        binary = tmp_path / "chromedriver"
+        binary.write_text("")
+        manifest = str(tmp_path / "cache" / "driver_manifest.json")
+        FakeManager.installs = 0
+        monkeypatch.setattr(driver_factory, "ChromeDriverManager", lambda: FakeManager(str(binary)))
+        monkeypatch.setattr(driver_factory, "detect_chrome_version", lambda: "131.0.6778.85")
+
+        assert driver_factory.resolve_chromedriver(manifest) == str(binary)
+        assert driver_factory.resolve_chromedriver(manifest) == str(binary)
+        assert FakeManager.installs == 1
+
+        monkeypatch.setattr(driver_factory, "detect_chrome_version", lambda: "132.0.6834.57")
+        driver_factory.resolve_chromedriver(manifest)
+        assert FakeManager.installs == 2
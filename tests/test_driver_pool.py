@@ -0,0 +1,123 @@
+"""
+Unit tests for the driver pool (no browser needed).
+"""
+
+from selenium.common.exceptions import WebDriverException
+from utils.driver_pool import DriverPool
+
+
+class FakeSwitchTo:
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.switch_to = FakeSwitchTo(self)
+        self.healthy = True
+        self.quit_called = False
+        self.visited = []
+        # handle -> navigation history of that tab
+        self.tabs = {"main": []}
+        self.current_window_handle = "main"
+        self.cdp_calls = []
+
+    @property
+    def window_handles(self):
+        if not self.healthy:
+            raise WebDriverException("session deleted")
+        return list(self.tabs)
+
+    def close(self):
+        del self.tabs[self.current_window_handle]
+
+    def execute_script(self, script, *args):
+        return None
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, params))
+        if cmd == "Page.getNavigationHistory":
+            return {"entries": [{"url": url} for url in self.tabs[self.current_window_handle]]}
+        return {}
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestDriverPool:
+
+    def test_session_is_reused_and_reset(self):
+        pool = DriverPool(factory=FakeDriver, size=1, max_reuse=5)
+        first = pool.acquire()
+        pool.release(first)
+
+        assert pool.acquire() is first
+        assert first.visited == ["about:blank"]
+        assert pool.created == 1
+
+    def test_reset_clears_storage_of_every_visited_origin(self):
+        driver = FakeDriver()
+        driver.tabs = {"main": ["about:blank", "https://insiderone.com/careers/"],
+                       "lever": ["https://jobs.lever.co/insiderone/abc/apply"]}
+
+        assert DriverPool(factory=FakeDriver).reset(driver)
+
+        cleared = [params["origin"] for cmd, params in driver.cdp_calls if cmd == "Storage.clearDataForOrigin"]
+        assert cleared == ["*", "https://insiderone.com", "https://jobs.lever.co"]
+        assert list(driver.tabs) == ["main"] and driver.visited == ["about:blank"]
+
+    def test_unhealthy_session_is_evicted(self):
+        pool = DriverPool(factory=FakeDriver, size=1, max_reuse=5)
+        first = pool.acquire()
+        pool.release(first)
+        first.healthy = False
+
+        second = pool.acquire()
+        assert second is not first
+        assert first.quit_called
+
+    def test_session_is_quit_after_max_reuse(self):
+        pool = DriverPool(factory=FakeDriver, size=1, max_reuse=2)
+        first = pool.acquire()
+        pool.release(first)
+        pool.acquire()
+        pool.release(first)
+
+        assert first.quit_called
+        assert pool.acquire() is not first
+
+    def test_prewarmed_spare_replaces_evicted_session(self):
+        pool = DriverPool(factory=FakeDriver, size=1, max_reuse=1, prewarm=True)
+        first = pool.acquire()
+        pool.release(first)
+
+        second = pool.acquire()
+        assert first.quit_called
+        assert second is not first
+
+        next_spare = pool._spare.result()
+        assert next_spare is not second
+        assert pool.created == 3
+        pool.close()
+        assert next_spare.quit_called
+
+    def test_dead_spare_is_replaced_with_a_new_session(self):
+        pool = DriverPool(factory=FakeDriver, size=1, prewarm=True)
+        pool.acquire()
+        spare = pool._spare.result()
+        spare.healthy = False
+
+        driver = pool.acquire()
+
+        assert driver is not spare
+        assert driver.healthy
+        assert spare.quit_called
+        assert pool.evicted == 1
@@ -0,0 +1,110 @@
+"""
+Unit tests for the BasePage element cache (no browser needed).
+"""
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from pages.base_page import BasePage
+from pages.careers_page import CareersPage
+from utils.element_cache import DOCUMENT_IDENTITY_JS
+
+
+class FakeElement:
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.stale = False
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale")
+        return f"posting {self.generation}"
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.lookups = 0
+        self.scripts = 0
+        self.document = ["doc-1", "https://jobs.lever.co/insiderone"]
+
+    def find_elements(self, by, value):
+        self.lookups += 1
+        return [FakeElement(self.lookups)]
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        if script == DOCUMENT_IDENTITY_JS:
+            return self.document
+        return None
+
+
+@pytest.fixture
+def cached_pages(monkeypatch):
+    monkeypatch.setattr(BasePage, "CACHE_ELEMENTS", True)
+    driver = FakeDriver()
+    return driver, CareersPage(driver), BasePage(driver)
+
+
+class TestElementCache:
+
+    def test_repeated_lookups_hit_the_cache(self, cached_pages):
+        driver, careers_page, _ = cached_pages
+
+        careers_page.get_all_jobs()
+        careers_page.get_all_jobs()
+        careers_page.get_all_jobs()
+
+        assert driver.lookups == 1
+        assert careers_page.element_cache.stats["hits"] == 2
+
+    def test_hits_after_the_first_issue_no_driver_commands(self, cached_pages):
+        driver, careers_page, _ = cached_pages
+        careers_page.get_all_jobs()
+        careers_page.get_all_jobs()
+        commands = driver.lookups + driver.scripts
+
+        careers_page.get_all_jobs()
+        careers_page.get_all_jobs()
+
+        assert driver.lookups + driver.scripts == commands
+        assert careers_page.element_cache.stats["hits"] == 3
+
+    def test_navigation_from_another_page_invalidates(self, cached_pages):
+        driver, careers_page, other_page = cached_pages
+        careers_page.get_all_jobs()
+
+        other_page.js_click(None)
+        careers_page.get_all_jobs()
+
+        assert driver.lookups == 2
+
+    def test_navigation_after_the_click_invalidates(self, cached_pages):
+        driver, careers_page, _ = cached_pages
+        careers_page.js_click(None)
+        careers_page.get_all_jobs()
+
+        # The click's navigation lands after the generation was bumped
+        driver.document = ["doc-2", "https://jobs.lever.co/insiderone/abc/apply"]
+        careers_page.get_all_jobs()
+
+        assert driver.lookups == 2
+
+    def test_stale_element_is_looked_up_again(self, cached_pages):
+        driver, careers_page, _ = cached_pages
+        careers_page.get_all_jobs()[0].stale = True
+
+        text = careers_page.with_elements(careers_page.JOB_ITEM, lambda jobs: jobs[0].text)
+
+        assert text == "posting 2"
+        assert driver.lookups == 2
+
+    def test_cache_is_off_by_default(self):
+        driver = FakeDriver()
+        careers_page = CareersPage(driver)
+        careers_page.get_all_jobs()
+        careers_page.get_all_jobs()
+
+        assert careers_page.element_cache is None
+        assert driver.lookups == 2
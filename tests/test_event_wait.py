@@ -0,0 +1,60 @@
+"""
+Unit tests for the event-driven wait engine (no browser needed).
+"""
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+from utils.event_wait import RECHECK_MS, EventDrivenWait, locator_event
+
+
+class FakeDriver:
+
+    def __init__(self, script_error=None):
+        self.script_error = script_error
+        self.scripts = []
+        self.ready = False
+
+    def execute_async_script(self, script, *args):
+        self.scripts.append(args)
+        if self.script_error:
+            raise self.script_error
+        self.ready = True
+        return True
+
+
+class TestEventDrivenWait:
+
+    def test_resolves_after_single_observer_call(self):
+        driver = FakeDriver()
+        wait = EventDrivenWait(driver, 5)
+
+        result = wait.until(lambda d: d.ready, event=("visible", By.ID, "foo"))
+
+        assert result is True
+        assert driver.scripts == [("visible", By.ID, "foo", 5000, RECHECK_MS)]
+
+    def test_falls_back_to_polling_when_script_fails(self):
+        driver = FakeDriver(script_error=JavascriptException("document unloaded"))
+        calls = []
+
+        def condition(d):
+            calls.append(1)
+            return len(calls) >= 2
+
+        assert EventDrivenWait(driver, 2, poll_frequency=0.01).until(
+            condition, event=("url_contains", None, "careers")
+        )
+        assert len(calls) == 2
+
+    def test_times_out_when_condition_never_holds(self):
+        driver = FakeDriver(script_error=JavascriptException("no document"))
+
+        with pytest.raises(TimeoutException):
+            EventDrivenWait(driver, 0.05, poll_frequency=0.01).until(
+                lambda d: False, event=("present", By.CSS_SELECTOR, ".posting")
+            )
+
+    def test_unsupported_locator_has_no_event(self):
+        assert locator_event("visible", (By.LINK_TEXT, "Apply")) is None
+        assert locator_event("visible", (By.CLASS_NAME, "posting")) == ("visible", By.CLASS_NAME, "posting")
@@ -0,0 +1,61 @@
+"""
+Unit tests for content fingerprints against the local stand-in server.
+"""
+
+from utils.fingerprints import ContentFingerprinter, FingerprintStore
+from utils.lever_api import LeverPostingsClient
+from utils.standin_server import StandInServer, make_posting
+
+
+def fingerprinter_for(server):
+    return ContentFingerprinter(server.board_url, client=LeverPostingsClient(server.api_url))
+
+
+class TestFingerprints:
+
+    def test_only_the_affected_journey_changes(self, tmp_path):
+        store = FingerprintStore(str(tmp_path / "fingerprints.json"))
+        with StandInServer() as server:
+            server.add_synthetic_postings(50)
+            first = fingerprinter_for(server)
+            qa = first.fingerprint("Istanbul, Turkiye", "Quality Assurance")
+            sales = first.fingerprint("London, UK", "Sales")
+            assert all(qa.values())
+            store.record_pass(store.key("Istanbul, Turkiye", "Quality Assurance"), qa)
+            store.record_pass(store.key("London, UK", "Sales"), sales)
+
+            server.postings.append(make_posting("QA Lead", "Istanbul, Turkiye", "Quality Assurance",
+                                                base_url=f"{server.base_url}/jobs.lever.co"))
+            second = fingerprinter_for(server)
+            qa_now = second.fingerprint("Istanbul, Turkiye", "Quality Assurance")
+            sales_now = second.fingerprint("London, UK", "Sales")
+
+        reloaded = FingerprintStore(store.path)
+        qa_key = store.key("Istanbul, Turkiye", "Quality Assurance")
+        assert reloaded.changed_parts(qa_key, qa_now) == ["postings"]
+        assert reloaded.changed_parts(store.key("London, UK", "Sales"), sales_now) == []
+        assert reloaded.changed_parts("Singapore|Product", sales_now) == ["teams", "filter_options", "postings"]
+
+    def test_unreachable_content_always_counts_as_changed(self, tmp_path):
+        store = FingerprintStore(str(tmp_path / "fingerprints.json"))
+        fingerprinter = ContentFingerprinter(
+            "http://127.0.0.1:9/jobs.lever.co/x",
+            client=LeverPostingsClient("http://127.0.0.1:9/v0/postings", timeout=1),
+            timeout=1,
+        )
+        fingerprint = fingerprinter.fingerprint("Istanbul, Turkiye", "Quality Assurance")
+        store.record_pass("k", fingerprint)
+
+        assert fingerprint == {"teams": None, "filter_options": None, "postings": None}
+        assert store.changed_parts("k", fingerprint) == ["teams", "filter_options", "postings"]
+
+    def test_non_lever_board_always_counts_as_changed(self):
+        fingerprinter = ContentFingerprinter(
+            "http://127.0.0.1:9/careers/",
+            client=LeverPostingsClient("http://127.0.0.1:9/v0/postings", timeout=1),
+            timeout=1,
+        )
+
+        assert fingerprinter.fingerprint("Istanbul, Turkiye", "Quality Assurance") == {
+            "teams": None, "filter_options": None, "postings": None,
+        }
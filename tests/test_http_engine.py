@@ -0,0 +1,64 @@
+"""
+Unit tests for the HTTP engine: locator evaluation on sample HTML and the
+static checks against the local stand-in server (no browser needed).
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.careers_page import CareersPage
+from pages.home_page import HomePage
+from utils.http_engine import HttpPage, UnsupportedLocator, run_static_checks
+from utils.standin_server import StandInServer
+
+SAMPLE_HTML = """<!DOCTYPE html>
+<html><head><title>Careers | Insider One</title><meta charset="utf-8"></head>
+<body>
+  <a href="#open-roles" class="btn">Explore open roles</a>
+  <div class="filter-button-wrapper"><div class="filter-button">Location</div></div>
+  <div class="postings-group">
+    <div class="posting-category-title">Quality Assurance</div>
+    <div class="posting" data-qa-posting-id="1">
+      <h5 data-qa="posting-name">QA Engineer</h5><br>
+      <span class="sort-by-location">Istanbul, Turkiye</span>
+      <a class="posting-btn-submit" href="https://jobs.lever.co/insiderone/1/apply">Apply</a>
+    </div>
+  </div>
+  <footer><p>Join us</p><a href="/careers/">We're hiring</a></footer>
+</body></html>"""
+
+
+class TestHttpEngine:
+
+    def test_page_object_locators_resolve_on_sample_html(self):
+        page = HttpPage("https://insiderone.com/careers/", SAMPLE_HTML)
+
+        assert page.title == "Careers | Insider One"
+        assert page.find(HomePage.WE_ARE_HIRING_LINK).get_attribute("href") == "/careers/"
+        assert page.is_present(CareersPage.EXPLORE_OPEN_ROLES_BTN)
+        assert not page.is_present(CareersPage.SOFTWARE_DEV_LINK)
+        assert len(page.find_all(CareersPage.FILTER_WRAPPER)) == 1
+        assert page.find(CareersPage.JOB_TITLE).text == "QA Engineer"
+        assert page.find(CareersPage.JOB_LOCATION).text == "Istanbul, Turkiye"
+        assert page.find_all(CareersPage.APPLY_BTN)[0].text == "Apply"
+        assert page.find((By.CSS_SELECTOR, ".posting a.posting-btn-submit")) is not None
+        assert not page.is_present((By.XPATH, "//header//a[contains(text(), \"We're hiring\")]"))
+
+    def test_unsupported_locators_are_rejected(self):
+        page = HttpPage("about:blank", SAMPLE_HTML)
+        with pytest.raises(UnsupportedLocator):
+            page.find((By.XPATH, "//a[position() = 1]"))
+        with pytest.raises(UnsupportedLocator):
+            page.find((By.CSS_SELECTOR, "div > a"))
+
+    def test_static_checks_pass_and_escalate_the_javascript_steps(self):
+        with StandInServer() as server:
+            report = run_static_checks(server.home_url)
+
+        assert report["passed"]
+        assert [s["step"] for s in report["steps"]] == [1, 2, 3]
+        assert report["careers_url"] == server.home_url + "careers/"
+        # The stand-in injects the team links with JavaScript, like the live site
+        assert report["board_url"] is None
+        assert report["needs_browser"][0].startswith("5:")
+        assert report["duration"] < 1
@@ -0,0 +1,110 @@
+"""
+Unit tests for the lean browser profile (no browser needed).
+"""
+
+import json
+
+from selenium.webdriver.chrome.options import Options
+from pages.base_page import BasePage
+from utils.lean_profile import LeanProfile
+from utils.record_replay import NetworkRecorder
+
+
+def perf_log(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class FakeSwitchTo:
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+
+    def __init__(self, logs):
+        self.logs = logs
+        self.cdp = []
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.switch_to = FakeSwitchTo(self)
+
+    def get_log(self, log_type):
+        logs, self.logs = self.logs, []
+        return logs
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params, self.current_window_handle))
+        return {}
+
+
+class TestLeanProfile:
+
+    def test_options_use_eager_loading_and_block_images(self):
+        options = LeanProfile().apply_options(Options())
+
+        assert options.page_load_strategy == "eager"
+        assert options.experimental_options["prefs"]["profile.managed_default_content_settings.images"] == 2
+
+    def test_blocklist_includes_resource_type_patterns(self):
+        driver = FakeDriver([])
+        LeanProfile(blocked_urls=["*hotjar.com*"], blocked_types=("font",)).apply_driver(driver)
+
+        urls = driver.cdp[-1][1]["urls"]
+        assert driver.cdp[-1][0] == "Network.setBlockedURLs"
+        assert urls[:5] == ["*hotjar.com*", "*.woff", "*.woff?*", "*.woff2", "*.woff2?*"]
+        assert len(urls) == 11 and "*.ttf*" not in urls
+
+    def test_stats_count_blocked_and_transferred_requests(self):
+        profile = LeanProfile()
+        profile.collect(FakeDriver([
+            perf_log("Network.requestWillBeSent", requestId="1", type="Document"),
+            perf_log("Network.loadingFinished", requestId="1", encodedDataLength=2048),
+            perf_log("Network.requestWillBeSent", requestId="2", type="Font"),
+            perf_log("Network.loadingFailed", requestId="2", blockedReason="inspector"),
+        ]))
+
+        assert profile.summary() == {
+            "requests_blocked": 1,
+            "requests_completed": 1,
+            "bytes_transferred": 2048,
+            "blocked_by_type": {"Font": 1},
+        }
+
+    def test_recorder_shares_the_drained_log_with_the_profile(self, tmp_path):
+        profile = LeanProfile()
+        recorder = NetworkRecorder(str(tmp_path), log_consumers=[profile.collect])
+        driver = FakeDriver([
+            perf_log("Network.requestWillBeSent", requestId="1", type="Script",
+                     request={"method": "GET", "url": "https://insiderone.com/app.js"}),
+            perf_log("Network.loadingFinished", requestId="1", encodedDataLength=512),
+        ])
+
+        recorder.capture(driver)
+        profile.collect(driver)
+
+        assert profile.summary()["requests_completed"] == 1
+        assert profile.summary()["bytes_transferred"] == 512
+
+    def test_baseline_blocks_nothing(self):
+        driver = FakeDriver([])
+        profile = LeanProfile.baseline()
+        profile.apply_driver(driver)
+
+        assert driver.cdp == []
+        assert profile.apply_options(Options()).page_load_strategy == "normal"
+
+    def test_blocklist_is_reapplied_to_new_tabs(self, monkeypatch):
+        profile = LeanProfile()
+        driver = FakeDriver([])
+        profile.apply_driver(driver)
+        monkeypatch.setattr(BasePage, "lean_profile", profile)
+
+        driver.window_handles.append("popup")
+        BasePage(driver).switch_to_new_tab()
+
+        blocked_tabs = [tab for cmd, _, tab in driver.cdp if cmd == "Network.setBlockedURLs"]
+        assert blocked_tabs == ["main", "popup"]
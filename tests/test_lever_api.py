@@ -0,0 +1,37 @@
+"""
+Unit tests for the Lever postings client against the local stand-in server.
+"""
+
+import pytest
+from utils.lever_api import (LeverPostingsClient, company_from_board_url,
+                             posting_id_from_url)
+from utils.standin_server import StandInServer, make_posting
+
+
+@pytest.fixture
+def postings():
+    return [
+        make_posting("QA Engineer", "Istanbul, Turkiye", "Quality Assurance"),
+        make_posting("Senior QA Engineer", "Istanbul, Turkiye", "Quality Assurance"),
+        make_posting("QA Engineer", "London, UK", "Quality Assurance"),
+        make_posting("Backend Engineer", "Istanbul, Turkiye", "Software Development"),
+    ]
+
+
+class TestLeverPostingsClient:
+
+    def test_expected_postings_apply_location_and_team(self, postings):
+        with StandInServer(postings) as server:
+            client = LeverPostingsClient(server.api_url)
+            expected = client.expected_postings("insiderone", "istanbul, turkiye", "Quality Assurance")
+
+        assert [r["title"] for r in expected] == ["QA Engineer", "Senior QA Engineer"]
+        assert expected[0]["id"] == postings[0]["id"]
+        assert expected[0]["apply_href"].endswith("/apply")
+
+    def test_board_url_helpers(self, postings):
+        assert company_from_board_url(
+            "https://jobs.lever.co/insiderone?team=Software%20Development") == "insiderone"
+        assert company_from_board_url(
+            "http://127.0.0.1:8000/jobs.lever.co/insiderone/") == "insiderone"
+        assert posting_id_from_url(postings[0]["applyUrl"]) == postings[0]["id"]
@@ -0,0 +1,46 @@
+"""
+Unit tests for the apply link checker against the local stand-in server.
+"""
+
+from utils.link_checker import ApplyLinkChecker, ConnectionPool
+from utils.standin_server import StandInServer
+
+
+class TestApplyLinkChecker:
+
+    def test_valid_links_pass_and_broken_ones_are_reported(self):
+        with StandInServer() as server:
+            server.add_synthetic_postings(20)
+            hrefs = [p["applyUrl"] for p in server.postings]
+            missing = f"{server.board_url}/00000000-0000-0000-0000-000000000000/apply"
+            elsewhere = f"{server.base_url}/insiderone.com/"
+            results = ApplyLinkChecker(concurrency=4).check_all(hrefs + [missing, elsewhere])
+
+        assert all(r["ok"] for r in results[:20])
+        assert results[20]["status"] == 404 and not results[20]["ok"]
+        assert results[21]["error"].startswith("Landed outside Lever")
+        assert server.requests == 22
+
+    def test_redirects_are_followed_to_the_form(self):
+        with StandInServer() as server:
+            server.add_synthetic_postings(1)
+            apply_url = server.postings[0]["applyUrl"]
+            server.redirects["/short/1"] = apply_url.replace(server.base_url, "")
+            server.redirects["/short/loop"] = "/short/loop"
+
+            ok, loop = ApplyLinkChecker(max_redirects=3).check_all(
+                [f"{server.base_url}/short/1", f"{server.base_url}/short/loop"]
+            )
+
+        assert ok["ok"] and ok["url"] == apply_url
+        assert not loop["ok"] and "redirects" in loop["error"]
+
+    def test_connections_are_reused(self):
+        pool = ConnectionPool()
+        origin = ("http", "127.0.0.1", 80)
+        connection = pool.take(origin)
+        pool.give_back(origin, connection)
+
+        assert pool.take(origin) is connection
+        assert pool.take(origin) is not connection
+        assert pool.opened == 2
@@ -0,0 +1,108 @@
+"""
+Unit tests for the matrix runner's scheduling and reporting (no browser needed).
+"""
+
+import datetime
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pages.base_page import BasePage
+from utils import matrix_runner
+from utils.checkpoints import CheckpointStore
+from utils.fingerprints import FingerprintStore
+from utils.matrix_runner import (
+    load_matrix, record_passes, run_matrix, select_changed_pairs, walk_to_lever_board,
+)
+
+BOARD_URL = "https://jobs.lever.co/insiderone?team=Software%20Development"
+
+
+def fake_run_pair(location, department, driver_path=None, screenshot_dir="screenshots", checkpoints=None):
+    """Passes Istanbul, fails London, crashes the 'worker' for anything else."""
+    if location == "Istanbul, Turkiye":
+        return {"location": location, "department": department, "passed": True,
+                "error": None, "screenshot": None, "duration": 0.1}
+    if location == "London, UK":
+        return {"location": location, "department": department, "passed": False,
+                "error": "AssertionError: No job listings are displayed.",
+                "screenshot": f"{screenshot_dir}/FAIL.png", "duration": 0.2}
+    raise RuntimeError("Chrome failed to start")
+
+
+class FakeFingerprinter:
+
+    def __init__(self, fingerprints):
+        self.fingerprints = fingerprints
+
+    def fingerprint(self, location, department):
+        return self.fingerprints[(location, department)]
+
+
+class FakeDriver:
+    """Just enough of a WebDriver to restore a checkpoint."""
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+    def add_cookie(self, cookie):
+        pass
+
+    def execute_script(self, script, *args):
+        return None
+
+
+class TestMatrixRunner:
+
+    def test_load_matrix_reads_pairs(self, tmp_path):
+        path = tmp_path / "matrix.json"
+        path.write_text(json.dumps([["Istanbul, Turkiye", "Quality Assurance"], ["London, UK", "Sales"]]))
+        assert load_matrix(str(path)) == [("Istanbul, Turkiye", "Quality Assurance"), ("London, UK", "Sales")]
+
+    def test_run_matrix_merges_results_and_worker_crashes(self, monkeypatch):
+        monkeypatch.setattr(matrix_runner, "resolve_chromedriver", lambda: "/fake/chromedriver")
+        monkeypatch.setattr(matrix_runner, "ProcessPoolExecutor", ThreadPoolExecutor)
+        monkeypatch.setattr(matrix_runner, "run_pair", fake_run_pair)
+
+        pairs = [("London, UK", "Sales"), ("Singapore", "Product"), ("Istanbul, Turkiye", "Quality Assurance")]
+        before = datetime.datetime.now().replace(microsecond=0)
+        report = run_matrix(pairs, workers=2)
+
+        assert before <= datetime.datetime.fromisoformat(report["started_at"]) <= datetime.datetime.now()
+
+        assert (report["mode"], report["workers"]) == ("processes", 2)
+        assert (report["total"], report["passed"], report["failed"]) == (3, 1, 2)
+        assert [r["location"] for r in report["results"]] == ["Istanbul, Turkiye", "London, UK", "Singapore"]
+        crashed = report["results"][2]
+        assert crashed["error"] == "RuntimeError: Chrome failed to start"
+        assert crashed["duration"] is None
+
+    def test_only_changed_pairs_run_and_passes_are_recorded(self, tmp_path):
+        store = FingerprintStore(str(tmp_path / "fingerprints.json"))
+        qa, sales = ("Istanbul, Turkiye", "Quality Assurance"), ("London, UK", "Sales")
+        fingerprinter = FakeFingerprinter({qa: {"postings": "a"}, sales: {"postings": "b"}})
+        store.record_pass(store.key(*qa), {"postings": "a"})
+
+        to_run, skipped, fingerprints = select_changed_pairs([qa, sales], store, fingerprinter)
+        assert (to_run, skipped) == ([sales], [qa])
+        assert select_changed_pairs([qa, sales], store, fingerprinter, force=True)[0] == [qa, sales]
+
+        report = {"results": [{"location": sales[0], "department": sales[1], "passed": True}]}
+        record_passes(report, store, fingerprints)
+        assert FingerprintStore(store.path).changed_parts(store.key(*sales), {"postings": "b"}) == []
+
+    def test_walk_resumes_on_the_board_from_a_fresh_checkpoint(self, tmp_path, monkeypatch):
+        store = CheckpointStore(str(tmp_path / "checkpoints.json"))
+        store._checkpoints["lever_board"] = {"url": BOARD_URL, "cookies": [], "local_storage": {},
+                                             "saved_at": time.time()}
+        monkeypatch.setattr(BasePage, "checkpoints", store)
+
+        driver = FakeDriver()
+        careers_page = walk_to_lever_board(driver)
+        assert careers_page.get_url() == BOARD_URL
+        assert driver.visited == ["https://jobs.lever.co/", BOARD_URL]
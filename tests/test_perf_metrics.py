@@ -0,0 +1,119 @@
+"""
+Unit tests for page performance metrics and the SQLite trend store (no browser needed).
+"""
+
+from selenium.common.exceptions import WebDriverException
+
+from pages.home_page import HomePage
+from utils.perf_metrics import PerfStore, collect_metrics, find_slowdowns, main
+
+
+class FakeDriver:
+    """Answers the metrics script and CDP Performance commands with canned values."""
+
+    current_url = "https://insiderone.com/"
+
+    def __init__(self, timings=None, fail_script=False):
+        self.current_window_handle = "main"
+        self.timings = timings or {"ttfb": 120.0, "load": 850.5, "first_contentful_paint": 400.0, "lcp": None}
+        self.fail_script = fail_script
+        self.script_duration = 0.25
+        self.cdp_calls = []
+
+    def execute_async_script(self, script, *args):
+        if self.fail_script:
+            raise WebDriverException("javascript error")
+        return dict(self.timings)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, self.current_window_handle))
+        if cmd == "Performance.getMetrics":
+            return {"metrics": [{"name": "ScriptDuration", "value": self.script_duration},
+                                {"name": "Nodes", "value": 812},
+                                {"name": "Timestamp", "value": 1234.5}]}
+        return {}
+
+
+class TestPerfMetrics:
+
+    def test_collects_page_timings_and_cdp_metrics(self):
+        driver = FakeDriver()
+        metrics = collect_metrics(driver)
+        assert metrics == {"ttfb": 120.0, "load": 850.5, "first_contentful_paint": 400.0,
+                           "script_duration": 250.0, "nodes": 812.0}
+
+        collect_metrics(driver)
+        assert driver.cdp_calls.count(("Performance.enable", "main")) == 1
+
+        # CDP metrics still arrive when the page script fails
+        assert collect_metrics(FakeDriver(fail_script=True)) == {"script_duration": 250.0, "nodes": 812.0}
+
+    def test_cumulative_counters_are_stored_per_page(self, tmp_path):
+        store = PerfStore(str(tmp_path / "perf.sqlite"), run_id="run-1")
+        driver = FakeDriver()
+        store.mark(driver)
+        assert driver.cdp_calls[0] == ("Performance.enable", "main")
+
+        driver.script_duration = 0.4
+        store.record("home", driver)
+        driver.script_duration = 0.45
+        store.record("careers", driver)
+        # The renderer was swapped (cross-site navigation): its counters restart
+        driver.script_duration = 0.1
+        store.record("lever_board", driver)
+
+        trends = store.trends()
+        assert [trends[(page, "script_duration")][0][1] for page in ("home", "careers", "lever_board")] \
+            == [150.0, 50.0, 100.0]
+        assert trends[("careers", "nodes")][0][1] == 812.0
+
+    def test_counters_are_enabled_and_tracked_per_tab(self, tmp_path):
+        store = PerfStore(str(tmp_path / "perf.sqlite"), run_id="run-1")
+        driver = FakeDriver()
+        store.mark(driver)
+        driver.script_duration = 0.4
+
+        # A popup is a new target: enabled again and not measured against the first tab
+        driver.current_window_handle = "popup"
+        store.record("apply_form", driver)
+        driver.current_window_handle = "main"
+        store.record("lever_board", driver)
+
+        enabled = [tab for cmd, tab in driver.cdp_calls if cmd == "Performance.enable"]
+        assert enabled == ["main", "popup"]
+        trends = store.trends()
+        assert trends[("apply_form", "script_duration")][0][1] == 400.0
+        assert trends[("lever_board", "script_duration")][0][1] == 150.0
+
+    def test_page_objects_record_into_the_store(self, tmp_path):
+        store = PerfStore(str(tmp_path / "perf.sqlite"), run_id="run-1")
+        page = HomePage(FakeDriver())
+        try:
+            HomePage.perf_store = store
+            page.record_performance("home")
+        finally:
+            HomePage.perf_store = None
+        page.record_performance("home")
+
+        trends = store.trends()
+        assert store.samples == 1
+        assert trends[("home", "load")] == [("run-1", 850.5, 850.5, 1)]
+
+    def test_trends_flag_a_slower_latest_run(self, tmp_path, capsys):
+        path = str(tmp_path / "perf.sqlite")
+        for run, loads in enumerate([[800, 820], [790, 810, 900], [805], [1300, 1250]]):
+            store = PerfStore(path, run_id=f"run-{run}")
+            for load in loads:
+                store.append("lever_board", None, {"load": load, "nodes": load * 10},
+                             recorded_at=1000 + run)
+
+        trends = PerfStore(path).trends(runs=10, page="lever_board")
+        assert [p50 for _, p50, _, _ in trends[("lever_board", "load")]] == [800, 810, 805, 1250]
+        assert trends[("lever_board", "load")][1][2] == 900
+
+        slowdowns = find_slowdowns(trends)
+        assert [(s["page"], s["metric"], s["baseline"]) for s in slowdowns] == [("lever_board", "load", 805)]
+        assert find_slowdowns(trends, threshold=1.0) == []
+
+        assert main(["--db", path, "--fail-on-slowdown"]) == 1
+        assert "SLOWER: lever_board load" in capsys.readouterr().out
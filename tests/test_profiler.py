@@ -0,0 +1,83 @@
+"""
+Unit tests for the WebDriver command profiler (no browser needed).
+"""
+
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+from pages.base_page import BasePage
+from utils.profiler import CommandProfiler
+
+
+class FakeDriver:
+
+    def __init__(self):
+        self.polls = 0
+
+    def execute(self, driver_command, params=None):
+        self.polls += 1
+        return {"value": self.polls >= 3}
+
+
+class FakeIdlingDriver:
+    """Answers stability waits after the page has been busy for a while."""
+
+    def execute(self, driver_command, params=None):
+        time.sleep(0.05)
+        return {"value": {"stable": True, "waiting_for": []}}
+
+    def execute_async_script(self, script, *args):
+        return self.execute("executeAsyncScript", {"script": script, "args": list(args)})["value"]
+
+
+class FakePage(BasePage):
+
+    def load(self):
+        self.driver.execute("get", {"url": "about:blank"})
+
+    def wait_until_ready(self):
+        WebDriverWait(self.driver, 5, poll_frequency=0.01).until(
+            lambda d: d.execute("executeScript")["value"]
+        )
+
+
+class TestCommandProfiler:
+
+    def test_commands_are_grouped_by_page_method_and_step(self):
+        driver = FakeDriver()
+        page = FakePage(driver)
+        profiler = CommandProfiler(driver).attach()
+        try:
+            profiler.on_step(1, "Opening page")
+            page.load()
+            profiler.on_step(2, "Waiting")
+            page.wait_until_ready()
+        finally:
+            profiler.detach()
+
+        report = profiler.report()
+        assert report["total"]["commands"] == 3
+        assert report["by_method"]["FakePage.load"]["by_command"] == {"get": 1}
+        assert report["by_method"]["FakePage.wait_until_ready"]["commands"] == 2
+        assert report["by_step"]["Step 2 - Waiting"]["wait_time"] > 0
+
+    def test_detach_restores_driver_and_wait(self):
+        driver = FakeDriver()
+        original_until = WebDriverWait.until
+        CommandProfiler(driver).attach().detach()
+
+        assert "execute" not in driver.__dict__
+        assert WebDriverWait.until is original_until
+
+    def test_in_page_stability_wait_counts_as_wait_time(self):
+        driver = FakeIdlingDriver()
+        profiler = CommandProfiler(driver).attach()
+        try:
+            FakePage(driver).wait_for_page_stable()
+        finally:
+            profiler.detach()
+
+        bucket = profiler.report()["by_method"]["FakePage.wait_for_page_stable"]
+        assert bucket["by_command"] == {"executeAsyncScript": 1}
+        assert bucket["wait_time"] >= 0.05
+        assert bucket["command_time"] == 0
@@ -0,0 +1,71 @@
+"""
+Unit tests for the replay server (no browser needed).
+"""
+
+import hashlib
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+from utils.record_replay import ReplayServer
+
+
+def write_archive(archive_dir, responses):
+    bodies_dir = archive_dir / "bodies"
+    bodies_dir.mkdir(parents=True)
+    index = []
+    for url, status, content_type, body, location in responses:
+        digest = hashlib.sha1(body).hexdigest()
+        (bodies_dir / digest).write_bytes(body)
+        index.append({"method": "GET", "url": url, "status": status,
+                      "content_type": content_type, "location": location, "body": digest})
+    (archive_dir / "index.json").write_text(json.dumps(index))
+
+
+@pytest.fixture
+def server(tmp_path):
+    write_archive(tmp_path, [
+        ("https://insiderone.com/", 200, "text/html",
+         b'<a href="https://insiderone.com/careers/">careers</a>', None),
+        ("https://insiderone.com/careers/", 200, "text/html",
+         b'<a href="https://jobs.lever.co/insiderone?team=Software%20Development">SD</a>', None),
+        ("https://jobs.lever.co/insiderone?team=Software%20Development", 200, "text/html",
+         b"<div class='posting'></div>", None),
+        ("https://insiderone.com/old-careers", 301, "text/html", b"", "/careers/"),
+    ])
+    server = ReplayServer(str(tmp_path)).start()
+    yield server
+    server.stop()
+
+
+def fetch(url, referer=None):
+    request = urllib.request.Request(url, headers={"Referer": referer} if referer else {})
+    with urllib.request.urlopen(request) as response:
+        return response.geturl(), response.read().decode()
+
+
+class TestReplayServer:
+
+    def test_links_to_recorded_hosts_are_rewritten(self, server):
+        _, body = fetch(server.local_url("https://insiderone.com/careers/"))
+
+        assert f'{server.base_url}/jobs.lever.co/insiderone?team=Software%20Development' in body
+
+    def test_query_string_and_redirect_are_served(self, server):
+        url, body = fetch(server.local_url("https://insiderone.com/old-careers"))
+
+        assert url.endswith("/insiderone.com/careers/")
+        assert "Software%20Development" in body
+
+    def test_root_relative_path_resolves_via_referer(self, server):
+        _, body = fetch(f"{server.base_url}/careers/",
+                        referer=server.local_url("https://insiderone.com/"))
+
+        assert "Software%20Development" in body
+        assert server.hits == 1
+
+    def test_unknown_url_is_a_miss(self, server):
+        with pytest.raises(urllib.error.HTTPError):
+            fetch(server.local_url("https://insiderone.com/missing"))
+        assert server.misses == 1
@@ -0,0 +1,145 @@
+"""
+Unit tests for the remote WebDriver scheduler against local /status servers (no browser needed).
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from selenium.common.exceptions import InvalidArgumentException, SessionNotCreatedException
+
+from utils.driver_pool import DriverPool
+from utils.remote_scheduler import NoHealthyNode, RemoteScheduler
+
+
+class StatusServer:
+    """Serves a fixed WebDriver /status payload on a free local port."""
+
+    def __init__(self, value):
+        self.value = value
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps({"value": server.value}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def grid_status(busy, slots):
+    return {"ready": True, "nodes": [{"availability": "UP", "slots": [
+        {"session": {"sessionId": str(i)} if i < busy else None} for i in range(slots)]}]}
+
+
+class FakeRemote:
+    """Stands in for webdriver.Remote; refuses sessions on executors in refuse, can't reach those in lost."""
+
+    refuse = set()
+    lost = set()
+
+    def __init__(self, command_executor, options):
+        if command_executor in self.refuse:
+            raise SessionNotCreatedException("no free slots")
+        if command_executor in self.lost:
+            raise ConnectionRefusedError("[Errno 111] Connection refused")
+        if options.get("bad"):
+            raise InvalidArgumentException("invalid argument: unrecognized capability")
+        self.command_executor = command_executor
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestRemoteScheduler:
+
+    def test_sessions_go_to_the_least_loaded_node(self):
+        with StatusServer(grid_status(busy=3, slots=4)) as grid, \
+                StatusServer({"ready": True, "message": "ChromeDriver ready"}) as standalone:
+            scheduler = RemoteScheduler([grid.url, standalone.url], options_factory=dict,
+                                        max_sessions=2, driver_class=FakeRemote)
+            grid_node, standalone_node = scheduler.nodes
+
+            first, second, third = (scheduler.create_driver() for _ in range(3))
+            assert [scheduler.node_for(d) for d in (first, second, third)] == \
+                [standalone_node, standalone_node, grid_node]
+            # One keep-alive connection per endpoint, shared by its sessions
+            assert first.command_executor is second.command_executor is standalone_node.connection
+
+            pool = DriverPool(factory=scheduler.create_driver, on_evict=scheduler.forget)
+            pool._evict(second)
+            assert standalone_node.active == 1
+            assert scheduler.node_for(pool.acquire()) is standalone_node
+
+    def test_dead_and_refusing_nodes_are_skipped(self):
+        with StatusServer({"ready": True}) as refusing, StatusServer({"ready": True}) as lost, \
+                StatusServer({"ready": True}) as healthy:
+            dead = StatusServer({"ready": True})
+            dead.httpd.server_close()
+            scheduler = RemoteScheduler([dead.url, refusing.url, lost.url, healthy.url],
+                                        options_factory=dict, driver_class=FakeRemote)
+            dead_node, refusing_node, lost_node, healthy_node = scheduler.nodes
+            FakeRemote.refuse = {refusing_node.connection}
+            FakeRemote.lost = {lost_node.connection}
+            try:
+                driver = scheduler.create_driver()
+                assert scheduler.node_for(driver) is healthy_node
+                # A refusal only skips the node for that start; a lost connection takes it down
+                assert refusing_node.healthy and refusing_node.active == 0
+                assert not dead_node.healthy and not lost_node.healthy
+                with pytest.raises(NoHealthyNode):
+                    scheduler.create_driver()
+            finally:
+                FakeRemote.refuse = set()
+                FakeRemote.lost = set()
+
+    def test_option_errors_are_raised_without_marking_the_node_down(self):
+        with StatusServer({"ready": True}) as node:
+            scheduler = RemoteScheduler([node.url], options_factory=lambda: {"bad": True},
+                                        driver_class=FakeRemote)
+
+            with pytest.raises(InvalidArgumentException):
+                scheduler.create_driver()
+            assert scheduler.nodes[0].healthy and scheduler.nodes[0].active == 0
+
+    def test_session_start_is_requeued_until_a_node_frees_up(self, monkeypatch):
+        with StatusServer(grid_status(busy=1, slots=1)) as grid:
+            scheduler = RemoteScheduler([grid.url], options_factory=dict, status_ttl=0,
+                                        retries=2, driver_class=FakeRemote)
+            waits = []
+
+            def running_session_finishes(seconds):
+                waits.append(seconds)
+                grid.value = grid_status(busy=0, slots=1)
+
+            monkeypatch.setattr("utils.remote_scheduler.time.sleep", running_session_finishes)
+            driver = scheduler.create_driver()
+
+            assert scheduler.node_for(driver) is scheduler.nodes[0]
+            assert waits == [0]
+
+            scheduler.retries = 0
+            grid.value = grid_status(busy=1, slots=1)
+            with pytest.raises(NoHealthyNode):
+                scheduler.create_driver()
@@ -0,0 +1,115 @@
+"""
+Unit tests for the rolling screencast recorder (no browser needed).
+"""
+
+import base64
+import os
+from collections import Counter
+from concurrent.futures import Future
+
+from utils.screencast import ScreencastRecorder, encode_frames, wait_for_encoders
+
+
+class FakeConnection:
+    """Records CDP commands and lets the test push screencastFrame events."""
+
+    def __init__(self):
+        self.sent = []
+        self.listeners = {}
+        self.closed = False
+        self.sessions = 0
+        self.event_cpu = Counter()
+
+    def send(self, method, params=None, session_id=None):
+        self.sent.append((method, params, session_id))
+        future = Future()
+        if method == "Target.attachToTarget":
+            self.sessions += 1
+            future.set_result({"sessionId": f"S{self.sessions}"})
+        else:
+            future.set_result({})
+        return future
+
+    def execute(self, method, params=None, session_id=None, timeout=30):
+        return self.send(method, params, session_id).result(timeout)
+
+    def on(self, method, callback, session_id=None):
+        self.listeners[(session_id, method)] = callback
+
+    def off(self, method, callback, session_id=None):
+        self.listeners.pop((session_id, method), None)
+
+    def close(self):
+        self.closed = True
+
+    def frame(self, session_id, timestamp, data=b"jpeg", callback=None):
+        callback = callback or self.listeners.get((session_id, "Page.screencastFrame"))
+        if callback:
+            self.event_cpu["Page.screencastFrame"] += 0.001
+            callback({"data": base64.b64encode(data).decode(), "sessionId": timestamp * 10,
+                      "metadata": {"timestamp": timestamp}})
+
+
+class FakeDriver:
+    current_window_handle = "TAB1"
+
+
+class TestScreencast:
+
+    def test_buffer_keeps_only_the_last_seconds_and_follows_tabs(self):
+        driver, connection = FakeDriver(), FakeConnection()
+        recorder = ScreencastRecorder(driver, seconds=5).start(connection)
+        assert ("Target.attachToTarget", {"targetId": "TAB1", "flatten": True}, None) in connection.sent
+
+        for second in range(20):
+            connection.frame("S1", 1000 + second)
+        assert [ts for ts, _ in recorder.frames] == list(range(1014, 1020))
+        acks = [m for m in connection.sent if m[0] == "Page.screencastFrameAck"]
+        assert len(acks) == 20 and acks[-1][2] == "S1"
+
+        driver.current_window_handle = "TAB2"
+        recorder.on_step(10, "Verifying Lever redirect")
+        assert ("Page.stopScreencast", None, "S1") in connection.sent
+        connection.frame("S2", 1020)
+        assert recorder.frames[-1][0] == 1020
+
+        recorder.stop()
+        stats = recorder.stats()
+        assert connection.closed
+        assert stats["frames_received"] == 21 and stats["frames_buffered"] == 6
+        assert stats["reader_cpu"] == 0.021
+        assert stats["peak_buffer_bytes"] == stats["buffer_bytes"] == 6 * len(base64.b64encode(b"jpeg"))
+        assert ScreencastRecorder.totals["recordings"] >= 1
+
+    def test_frame_in_flight_during_a_tab_switch_is_acked_on_its_own_session(self):
+        driver, connection = FakeDriver(), FakeConnection()
+        recorder = ScreencastRecorder(driver, seconds=5).start(connection)
+        in_flight = connection.listeners[("S1", "Page.screencastFrame")]
+
+        driver.current_window_handle = "TAB2"
+        recorder.on_step(10, "Verifying Lever redirect")
+        connection.frame("S1", 1000, callback=in_flight)
+
+        acks = [m for m in connection.sent if m[0] == "Page.screencastFrameAck"]
+        assert acks == [("Page.screencastFrameAck", {"sessionId": 10000}, "S1")]
+        recorder.stop()
+
+    def test_failure_flush_encodes_a_flipbook_in_the_background(self, tmp_path):
+        connection = FakeConnection()
+        recorder = ScreencastRecorder(FakeDriver(), seconds=5).start(connection)
+        recorder.ffmpeg = None
+        for second in range(3):
+            connection.frame("S1", 1000 + second, data=f"frame {second}".encode())
+
+        base_path = recorder.flush(str(tmp_path), "test_insider::qa jobs")
+        assert not recorder.frames and recorder.buffer_bytes == 0
+        wait_for_encoders()
+
+        html = (tmp_path / f"{os.path.basename(base_path)}.html").read_text(encoding="utf-8")
+        assert base64.b64encode(b"frame 2").decode() in html
+        assert recorder.flush(str(tmp_path), "empty") is None
+
+    def test_encode_frames_falls_back_when_ffmpeg_fails(self, tmp_path):
+        frames = [(1.0, base64.b64encode(b"jpeg").decode())]
+        path = encode_frames(frames, str(tmp_path / "out"), ffmpeg=str(tmp_path / "missing-ffmpeg"))
+        assert path.endswith("out.html")
@@ -0,0 +1,59 @@
+"""
+Unit tests for the page stability engine (no browser needed).
+"""
+
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+from pages.base_page import BasePage
+from utils import stability
+
+
+class FakeDriver:
+    """Answers the stability script with queued results (exceptions are raised)."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.cdp_calls = []
+        self.script_args = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append(cmd)
+        return {}
+
+    def execute_async_script(self, script, *args):
+        self.script_args.append(args)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestStability:
+
+    def test_wait_retries_after_navigation_and_records_the_wait(self):
+        driver = FakeDriver(
+            JavascriptException("document unloaded while waiting for result"),
+            {"stable": True, "waiting_for": []},
+        )
+        stability.history.clear()
+
+        entry = stability.wait_until_stable(driver, timeout=5, quiet_ms=50, label="Page.step")
+        stability.wait_until_stable(driver.__class__({"stable": True, "waiting_for": []}), label="other")
+
+        assert entry["stable"] and entry["label"] == "Page.step"
+        assert len(driver.script_args) == 2 and driver.script_args[0][0] == 50
+        assert driver.script_args[0][2:] == (list(stability.FIRST_PARTY_HOSTS), stability.LONG_REQUEST_MS)
+        assert driver.cdp_calls == ["Page.addScriptToEvaluateOnNewDocument"]
+        assert stability.summary()["waits"] == 2
+
+    def test_busy_page_is_reported_or_raises_when_strict(self, capsys):
+        busy = {"stable": False, "waiting_for": ["network", "dom"]}
+        page = BasePage(FakeDriver(busy, busy))
+
+        page.wait_for_page_stable(timeout=1)
+        assert "waiting for: network, dom" in capsys.readouterr().out
+        assert stability.history[-1]["label"] == "BasePage.test_busy_page_is_reported_or_raises_when_strict"
+
+        with pytest.raises(TimeoutException):
+            page.wait_for_page_stable(timeout=1, strict=True)
@@ -0,0 +1 @@
+# Utilities Module
@@ -0,0 +1,187 @@
+"""
+Async Tabs - drives many tabs of one Chrome session concurrently from
+asyncio, over a single CDP connection.
+
+Scripts written for execute_script / execute_async_script (reading
+`arguments`, async ones calling the last argument when done) run
+unchanged through AsyncTab.call, so async page objects can share the
+in-page scripts of the synchronous ones.
+"""
+
+import asyncio
+import base64
+import contextlib
+import json
+
+from selenium.common.exceptions import TimeoutException
+
+from utils.cdp import CDPConnection, CDPError, browser_ws_url
+
+
+def _resolve(future, value):
+    if not future.done():
+        future.set_result(value)
+
+
+def script_expression(script, args, async_script=False):
+    """Wrap a WebDriver-style script body into a Runtime.evaluate expression."""
+    arguments = json.dumps(list(args))
+    if async_script:
+        return (f"new Promise(function (done) {{ (function () {{ {script} }})"
+                f".apply(null, {arguments}.concat([done])); }})")
+    return f"(function () {{ {script} }}).apply(null, {arguments})"
+
+
+class AsyncTab:
+    """One browser tab, attached as a flat CDP session."""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    async def send(self, method, params=None):
+        return await asyncio.wrap_future(self.connection.send(method, params, self.session_id))
+
+    def wait_for_event(self, method):
+        """Return an asyncio future resolved with the params of the next method event."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def callback(params):
+            loop.call_soon_threadsafe(_resolve, future, params)
+
+        self.connection.on(method, callback, self.session_id)
+        future.add_done_callback(lambda _: self.connection.off(method, callback, self.session_id))
+        return future
+
+    # --- Navigation ---
+
+    async def goto(self, url, timeout=30):
+        """Navigate and wait for the load event."""
+        loaded = self.wait_for_event("Page.loadEventFired")
+        try:
+            result = await self.send("Page.navigate", {"url": url})
+            if result.get("errorText"):
+                raise CDPError(f"Navigation to {url} failed: {result['errorText']}")
+            await asyncio.wait_for(loaded, timeout)
+        finally:
+            loaded.cancel()
+
+    @contextlib.asynccontextmanager
+    async def settles(self, grace=0.5, timeout=30):
+        """
+        Wrap an action that may navigate (e.g. clicking a link in-page).
+        If a load starts within grace seconds, wait for it to finish.
+        """
+        started = self.wait_for_event("Page.frameStartedLoading")
+        loaded = self.wait_for_event("Page.loadEventFired")
+        try:
+            yield
+            try:
+                await asyncio.wait_for(asyncio.shield(started), grace)
+            except asyncio.TimeoutError:
+                return
+            await asyncio.wait_for(loaded, timeout)
+        finally:
+            started.cancel()
+            loaded.cancel()
+
+    async def url(self):
+        return await self.evaluate("window.location.href")
+
+    # --- Scripts ---
+
+    async def evaluate(self, expression):
+        """Evaluate expression in the page and return its JSON value (promises are awaited)."""
+        result = await self.send("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": True,
+        })
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            message = details.get("exception", {}).get("description") or details.get("text")
+            raise CDPError(f"Script failed: {message}")
+        return result["result"].get("value")
+
+    async def call(self, script, *args, async_script=False):
+        """Run a WebDriver-style script with JSON-serializable args."""
+        return await self.evaluate(script_expression(script, args, async_script))
+
+    async def wait_for(self, expression, timeout=10, interval=0.1):
+        """Poll until expression is truthy in the page; returns its value."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            try:
+                value = await self.evaluate(expression)
+                if value:
+                    return value
+            except CDPError:
+                # Context destroyed mid-navigation; try again on the new page
+                pass
+            if loop.time() >= deadline:
+                raise TimeoutException(f"Timed out after {timeout}s waiting for: {expression}")
+            await asyncio.sleep(interval)
+
+    # --- Output ---
+
+    async def screenshot(self, filename):
+        result = await self.send("Page.captureScreenshot", {"format": "png"})
+        with open(filename, "wb") as f:
+            f.write(base64.b64decode(result["data"]))
+        return filename
+
+
+class AsyncBrowser:
+    """Opens and closes AsyncTabs in one Chrome session, at most max_tabs at a time."""
+
+    def __init__(self, connection, max_tabs=4):
+        self.connection = connection
+        self.max_tabs = max_tabs
+        self._slots = None
+
+    @classmethod
+    def from_driver(cls, driver, max_tabs=4):
+        """Connect to the browser behind a local Selenium Chrome session."""
+        return cls(CDPConnection(browser_ws_url(driver)), max_tabs)
+
+    async def send(self, method, params=None):
+        return await asyncio.wrap_future(self.connection.send(method, params))
+
+    async def new_tab(self, url=None):
+        target = await self.send("Target.createTarget", {"url": "about:blank"})
+        session = await self.send("Target.attachToTarget",
+                                  {"targetId": target["targetId"], "flatten": True})
+        tab = AsyncTab(self.connection, target["targetId"], session["sessionId"])
+        await tab.send("Page.enable")
+        # Background tabs get their timers throttled; make each one act focused
+        try:
+            await tab.send("Emulation.setFocusEmulationEnabled", {"enabled": True})
+        except CDPError:
+            pass
+        if url:
+            await tab.goto(url)
+        return tab
+
+    async def close_tab(self, tab):
+        try:
+            await self.send("Target.closeTarget", {"targetId": tab.target_id})
+        except CDPError:
+            pass
+
+    @contextlib.asynccontextmanager
+    async def tab(self, url=None):
+        """Open a tab for the duration of the block, waiting for a free slot first."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_tabs)
+        async with self._slots:
+            tab = await self.new_tab(url)
+            try:
+                yield tab
+            finally:
+                await self.close_tab(tab)
+
+    def close(self):
+        self.connection.close()
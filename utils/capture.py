@@ -0,0 +1,116 @@
+"""
+Step capture - keeps the last N step snapshots (JPEG screenshot, URL,
+DOM outline) in memory and only writes them to disk when a test fails.
+
+Snapshots are stored as the base64 strings the browser returns; decoding
+and file writes happen on a background thread at flush time, so passing
+tests pay only for the capture round trips.
+"""
+
+import base64
+import datetime
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+
+# Compact tag#id.class tree of the visible page, a few levels deep
+DOM_OUTLINE_JS = """
+    var maxDepth = arguments[0], maxLines = arguments[1], lines = [];
+    function walk(el, depth) {
+        if (lines.length >= maxLines || depth > maxDepth) return;
+        var name = el.tagName.toLowerCase();
+        if (el.id) name += '#' + el.id;
+        if (typeof el.className === 'string' && el.className.trim()) {
+            name += '.' + el.className.trim().split(/\\s+/).slice(0, 3).join('.');
+        }
+        lines.push(new Array(depth + 1).join('  ') + name);
+        for (var i = 0; i < el.children.length; i++) walk(el.children[i], depth + 1);
+    }
+    if (document.body) walk(document.body, 0);
+    return {url: window.location.href, outline: lines.join('\\n')};
+"""
+
+_pending = []
+
+
+def wait_for_pending_writes(timeout=30):
+    """Block until background flushes finish (call before the process exits)."""
+    for thread in list(_pending):
+        thread.join(timeout)
+    _pending[:] = [t for t in _pending if t.is_alive()]
+
+
+class StepCapture:
+    """Ring buffer of step snapshots for one driver session."""
+
+    def __init__(self, driver, size=5, quality=40, outline_depth=6, outline_lines=300):
+        self.driver = driver
+        self.quality = quality
+        self.outline_depth = outline_depth
+        self.outline_lines = outline_lines
+        self.buffer = deque(maxlen=size)
+
+    def on_step(self, number, title):
+        """Step listener: snapshot the state the previous step left behind."""
+        self.snapshot(f"before step {number} - {title}")
+
+    def snapshot(self, label):
+        """Capture a screenshot, URL and DOM outline into the buffer."""
+        snapshot = {"label": label, "time": time.time(), "image": None, "format": None,
+                    "url": None, "outline": None}
+        try:
+            page = self.driver.execute_script(DOM_OUTLINE_JS, self.outline_depth, self.outline_lines)
+            snapshot["url"], snapshot["outline"] = page["url"], page["outline"]
+        except WebDriverException:
+            pass
+        snapshot["image"], snapshot["format"] = self._screenshot()
+        self.buffer.append(snapshot)
+
+    def flush(self, directory, name):
+        """Write the buffered snapshots on a background thread; returns the target folder."""
+        snapshots = list(self.buffer)
+        self.buffer.clear()
+        if not snapshots:
+            return None
+
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        folder = os.path.join(directory, f"FAIL_{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}_{timestamp}")
+        thread = threading.Thread(target=self._write, args=(folder, snapshots), daemon=True)
+        thread.start()
+        _pending.append(thread)
+        return folder
+
+    # --- Internals ---
+
+    def _screenshot(self):
+        try:
+            result = self.driver.execute_cdp_cmd(
+                "Page.captureScreenshot", {"format": "jpeg", "quality": self.quality}
+            )
+            return result["data"], "jpg"
+        except (AttributeError, WebDriverException):
+            pass
+        try:
+            return self.driver.get_screenshot_as_base64(), "png"
+        except WebDriverException:
+            return None, None
+
+    @staticmethod
+    def _write(folder, snapshots):
+        os.makedirs(folder, exist_ok=True)
+        index = []
+        for number, snapshot in enumerate(snapshots, 1):
+            entry = {k: snapshot[k] for k in ("label", "time", "url", "outline")}
+            if snapshot["image"]:
+                filename = f"{number:02d}.{snapshot['format']}"
+                with open(os.path.join(folder, filename), "wb") as f:
+                    f.write(base64.b64decode(snapshot["image"]))
+                entry["screenshot"] = filename
+            index.append(entry)
+        with open(os.path.join(folder, "steps.json"), "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
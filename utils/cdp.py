@@ -0,0 +1,147 @@
+"""
+CDP Connection - a Chrome DevTools Protocol client over the browser's
+websocket. One connection carries every tab through flat sessions
+(Target.attachToTarget with flatten=True), so tabs can be driven
+concurrently without a WebDriver round trip per command.
+
+A reader thread owns the socket: command results resolve the
+concurrent.futures.Future returned by send(), and events are handed
+to listeners registered with on(). The reader's CPU time per event
+method (JSON decoding plus listeners) is kept in event_cpu.
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from urllib.request import urlopen
+
+import websocket
+
+
+class CDPError(Exception):
+    """A CDP command failed or the connection was lost."""
+
+
+def browser_ws_url(driver, timeout=10):
+    """Return the browser-level DevTools websocket URL of a local Chrome session."""
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    with urlopen(f"http://{address}/json/version", timeout=timeout) as response:
+        return json.load(response)["webSocketDebuggerUrl"]
+
+
+class CDPConnection:
+    """One DevTools websocket shared by any number of target sessions."""
+
+    def __init__(self, ws_url, connect=websocket.create_connection):
+        # Chrome rejects websocket clients that send an Origin header
+        self._ws = connect(ws_url, suppress_origin=True)
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = {}
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self.closed = False
+        # Event method -> reader thread CPU seconds spent decoding and dispatching it
+        self.event_cpu = Counter()
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    # --- Commands ---
+
+    def send(self, method, params=None, session_id=None):
+        """Send a command; returns a Future that resolves to its result dict."""
+        message_id = next(self._ids)
+        future = Future()
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        with self._lock:
+            if self.closed:
+                future.set_exception(CDPError("Connection closed."))
+                return future
+            self._pending[message_id] = future
+        try:
+            with self._send_lock:
+                self._ws.send(json.dumps(message))
+        except Exception as e:
+            with self._lock:
+                self._pending.pop(message_id, None)
+            future.set_exception(CDPError(f"{method} could not be sent: {e}"))
+        return future
+
+    def execute(self, method, params=None, session_id=None, timeout=30):
+        """Send a command and block for its result."""
+        return self.send(method, params, session_id).result(timeout)
+
+    # --- Events ---
+
+    def on(self, method, callback, session_id=None):
+        """Call callback(params) for every method event of session_id (None = browser)."""
+        with self._lock:
+            self._listeners.setdefault((session_id, method), []).append(callback)
+
+    def off(self, method, callback, session_id=None):
+        with self._lock:
+            callbacks = self._listeners.get((session_id, method), [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    # --- Lifecycle ---
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+        self._fail_pending()
+
+    def _read_loop(self):
+        while not self.closed:
+            try:
+                raw = self._ws.recv()
+            except Exception:
+                break
+            if raw:
+                started = time.thread_time()
+                message = json.loads(raw)
+                self._dispatch(message)
+                if "method" in message:
+                    self.event_cpu[message["method"]] += time.thread_time() - started
+        with self._lock:
+            self.closed = True
+        self._fail_pending()
+
+    def _dispatch(self, message):
+        if "id" in message:
+            with self._lock:
+                future = self._pending.pop(message["id"], None)
+            if future is None:
+                return
+            if "error" in message:
+                error = message["error"]
+                future.set_exception(CDPError(f"{error.get('message')} ({error.get('code')})"))
+            else:
+                future.set_result(message.get("result", {}))
+            return
+
+        with self._lock:
+            callbacks = list(self._listeners.get((message.get("sessionId"), message.get("method")), []))
+        for callback in callbacks:
+            try:
+                callback(message.get("params", {}))
+            except Exception:
+                # A broken listener must not stop the reader thread
+                pass
+
+    def _fail_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(CDPError("Connection closed."))
@@ -0,0 +1,123 @@
+"""
+Journey checkpoints - snapshots of browser state (URL, cookies, local
+storage) saved by the page objects once the journey reaches the Lever
+board, so later runs (matrix workers, retries) can deep-link straight to
+it instead of replaying steps 1-5.
+
+Checkpoints live in a JSON file and expire after a configurable TTL.
+"""
+
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+DEFAULT_CHECKPOINT_FILE = os.path.join(".cache", "checkpoints.json")
+
+READ_LOCAL_STORAGE_JS = """
+    var data = {};
+    try {
+        for (var i = 0; i < window.localStorage.length; i++) {
+            var key = window.localStorage.key(i);
+            data[key] = window.localStorage.getItem(key);
+        }
+    } catch (e) {}
+    return data;
+"""
+
+WRITE_LOCAL_STORAGE_JS = """
+    var data = arguments[0];
+    try {
+        Object.keys(data).forEach(function (key) { window.localStorage.setItem(key, data[key]); });
+    } catch (e) {}
+"""
+
+
+class CheckpointStore:
+    """On-disk store of named journey checkpoints."""
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_FILE, ttl=3600):
+        self.path = path
+        self.ttl = ttl
+        self._checkpoints = self._load()
+
+    # --- Save / restore ---
+
+    def save(self, name, driver):
+        """Record the current URL, cookies and local storage under name."""
+        try:
+            checkpoint = {
+                "url": driver.current_url,
+                "cookies": driver.get_cookies(),
+                "local_storage": driver.execute_script(READ_LOCAL_STORAGE_JS) or {},
+                "saved_at": time.time(),
+            }
+        except WebDriverException as e:
+            print(f"  Could not save checkpoint '{name}': {e}")
+            return
+        self._checkpoints[name] = checkpoint
+        self._write()
+
+    def get(self, name):
+        """Return the checkpoint if it exists and hasn't expired, else None."""
+        checkpoint = self._checkpoints.get(name)
+        if checkpoint and time.time() - checkpoint["saved_at"] <= self.ttl:
+            return checkpoint
+        return None
+
+    def restore(self, name, driver):
+        """
+        Load a checkpoint into the browser: open its origin, restore cookies
+        and local storage, then navigate to the saved URL.
+        Returns False if there is no fresh checkpoint or restoring failed.
+        """
+        checkpoint = self.get(name)
+        if checkpoint is None:
+            return False
+
+        parts = urlsplit(checkpoint["url"])
+        try:
+            driver.get(f"{parts.scheme}://{parts.netloc}/")
+            for cookie in checkpoint["cookies"]:
+                try:
+                    driver.add_cookie(cookie)
+                except WebDriverException:
+                    # Cookie for another domain/path; the page will set it again
+                    pass
+            driver.execute_script(WRITE_LOCAL_STORAGE_JS, checkpoint["local_storage"])
+            driver.get(checkpoint["url"])
+        except WebDriverException as e:
+            print(f"  Could not restore checkpoint '{name}': {e}")
+            return False
+
+        print(f"  Resumed from checkpoint '{name}': {checkpoint['url']}")
+        return True
+
+    def clear(self, name=None):
+        """Drop one checkpoint, or all of them."""
+        if name is None:
+            self._checkpoints.clear()
+        else:
+            self._checkpoints.pop(name, None)
+        self._write()
+
+    # --- Internals ---
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Matrix workers share the file; never let a reader see half a write
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._checkpoints, f, indent=2)
+        os.replace(tmp_path, self.path)
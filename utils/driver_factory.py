@@ -0,0 +1,96 @@
+"""
+Driver Factory - builds Chrome options and starts WebDriver sessions.
+Keeps browser setup in one place so fixtures and runners share it.
+"""
+
+import json
+import os
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+from utils.record_replay import enable_network_capture
+
+DRIVER_MANIFEST = os.path.join(".cache", "driver_manifest.json")
+
+
+def build_chrome_options(headless=False, capture_network=False, lean_profile=None):
+    """Return the Chrome options used by the test suite."""
+    chrome_options = Options()
+    chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-extensions")
+
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--window-size=1920,1080")
+
+    if capture_network:
+        enable_network_capture(chrome_options)
+
+    if lean_profile is not None:
+        lean_profile.apply_options(chrome_options)
+
+    return chrome_options
+
+
+def detect_chrome_version():
+    """Return the installed Chrome version string, or None if it can't be read."""
+    try:
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def resolve_chromedriver(manifest_path=DRIVER_MANIFEST):
+    """
+    Return the path of a ChromeDriver binary matching the installed Chrome.
+    Resolved paths are kept in an on-disk manifest keyed by Chrome version,
+    so ChromeDriverManager (version lookup, possible download) only runs
+    when Chrome itself changes.
+    """
+    version = detect_chrome_version()
+    manifest = _read_manifest(manifest_path)
+
+    cached = manifest.get(version) if version else None
+    if cached and os.path.isfile(cached):
+        return cached
+
+    path = ChromeDriverManager().install()
+    if version:
+        manifest[version] = path
+        _write_manifest(manifest_path, manifest)
+    return path
+
+
+def _read_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(path, manifest):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def create_chrome_driver(headless=False, driver_path=None, capture_network=False,
+                         lean_profile=None):
+    """Start a new local Chrome session."""
+    service = Service(driver_path or resolve_chromedriver())
+    options = build_chrome_options(headless, capture_network=capture_network,
+                                   lean_profile=lean_profile)
+    driver = webdriver.Chrome(service=service, options=options)
+
+    if lean_profile is not None:
+        lean_profile.apply_driver(driver)
+    return driver
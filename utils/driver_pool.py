@@ -0,0 +1,176 @@
+"""
+Driver Pool - keeps warm browser sessions and hands them out per test.
+Sessions are reset between tests and evicted when unhealthy or worn out.
+With prewarm, the next session is started in the background while the
+current test runs, so a new session is ready when one gets evicted.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """Pool of reusable WebDriver sessions."""
+
+    def __init__(self, factory, size=1, max_reuse=20, prewarm=False, on_evict=None):
+        self.factory = factory
+        self.on_evict = on_evict
+        self.size = size
+        self.max_reuse = max_reuse
+        self.prewarm = prewarm
+        self._idle = deque()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._spare = None
+        self._executor = ThreadPoolExecutor(max_workers=1) if prewarm else None
+        self.created = 0
+        self.evicted = 0
+
+    # --- Acquire / release ---
+
+    def acquire(self):
+        """Return a healthy idle session, the pre-warmed spare, or a new one."""
+        while True:
+            with self._lock:
+                driver = self._idle.popleft() if self._idle else None
+            if driver is None:
+                driver = self._take_spare()
+                if driver is not None and not self.is_healthy(driver):
+                    # The spare may have died while it sat waiting
+                    self._evict(driver)
+                    driver = None
+                driver = driver or self._create()
+                break
+            if self.is_healthy(driver):
+                break
+            self._evict(driver)
+
+        self._schedule_spare()
+        return driver
+
+    def release(self, driver):
+        """Reset the session and return it to the pool (or quit it)."""
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+
+        if uses >= self.max_reuse or not self.reset(driver):
+            self._evict(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+        self._evict(driver)
+
+    def close(self):
+        """Quit every idle session and the pre-warmed spare."""
+        with self._lock:
+            drivers = list(self._idle)
+            self._idle.clear()
+        spare = self._take_spare()
+        if spare is not None:
+            drivers.append(spare)
+        for driver in drivers:
+            self._evict(driver)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    # --- Session state ---
+
+    def is_healthy(self, driver):
+        """Return True if the session still answers commands."""
+        try:
+            return len(driver.window_handles) > 0
+        except WebDriverException:
+            return False
+
+    def reset(self, driver):
+        """
+        Bring a session back to a blank state: extra tabs closed,
+        cookies and storage of every visited origin cleared, main tab on
+        about:blank. Returns False if the session could not be reset.
+        """
+        try:
+            handles = driver.window_handles
+            origins = set()
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                origins |= self._visited_origins(driver)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            origins |= self._visited_origins(driver)
+
+            try:
+                # "*" covers every origin; the visited ones are named in case it isn't honoured
+                for origin in ["*"] + sorted(origins):
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                           {"origin": origin, "storageTypes": "all"})
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except (AttributeError, WebDriverException):
+                # No CDP (remote or non-Chrome): storage is per origin, clear the current page's
+                driver.execute_script(
+                    "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+                )
+                driver.delete_all_cookies()
+
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _visited_origins(driver):
+        """Origins in the current tab's navigation history (empty without CDP)."""
+        try:
+            entries = driver.execute_cdp_cmd("Page.getNavigationHistory", {})["entries"]
+        except (AttributeError, KeyError, WebDriverException):
+            return set()
+        origins = set()
+        for entry in entries:
+            parts = urlsplit(entry.get("url", ""))
+            if parts.scheme in ("http", "https"):
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
+
+    # --- Internals ---
+
+    def _create(self):
+        driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.created += 1
+        return driver
+
+    def _schedule_spare(self):
+        """Start the next session in the background if nothing is waiting idle."""
+        if not self.prewarm or self._spare is not None:
+            return
+        with self._lock:
+            if self._idle:
+                return
+        self._spare = self._executor.submit(self._create)
+
+    def _take_spare(self):
+        spare, self._spare = self._spare, None
+        if spare is None:
+            return None
+        try:
+            return spare.result()
+        except Exception as e:
+            print(f"  Pre-warmed browser failed to start: {e}")
+            return None
+
+    def _evict(self, driver):
+        self._uses.pop(id(driver), None)
+        self.evicted += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if self.on_evict is not None:
+            self.on_evict(driver)
@@ -0,0 +1,120 @@
+"""
+Element cache - per-page cache of located elements, keyed by locator.
+
+Entries are tagged with the driver's navigation generation and the
+document they were found in. Page object actions that may navigate or
+re-render (click, js_click, go_to, tab switches, ...) bump the generation
+for that driver, invalidating every page's entries at once. Since those
+actions bump before a click-triggered navigation actually happens, the
+first hit of each generation also reads the document's identity and URL
+(one script call, cheaper than a find plus wait) and compares it with the
+document the entry was found in. Later hits of that generation trust the
+result and cost no driver commands at all.
+"""
+
+import weakref
+from collections import Counter
+
+from selenium.common.exceptions import WebDriverException
+
+_generations = weakref.WeakKeyDictionary()
+
+# driver -> (generation, document) confirmed by the first hit of that generation
+_verified_documents = weakref.WeakKeyDictionary()
+
+# Tags the document on first read; a new document (navigation, reload) has no tag yet
+DOCUMENT_IDENTITY_JS = """
+    if (!document.__elementCacheId) {
+        document.__elementCacheId = Date.now() + '-' + Math.random();
+    }
+    return [document.__elementCacheId, window.location.href];
+"""
+
+
+def bump_generation(driver):
+    """Mark the page state of driver as changed."""
+    try:
+        _generations[driver] = _generations.get(driver, 0) + 1
+    except TypeError:
+        # Driver can't be weakly referenced; caching is simply never valid
+        pass
+
+
+def current_generation(driver):
+    try:
+        return _generations.get(driver, 0)
+    except TypeError:
+        return None
+
+
+class ElementCache:
+    """Locator -> elements cache for one page object."""
+
+    # Hit/miss counters across all pages in the run
+    totals = Counter()
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._entries = {}
+        # State seen by the last miss per key: elements found after it belong to it
+        self._miss_states = {}
+        self.stats = Counter()
+
+    def get(self, key):
+        """Return cached elements for key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None and self._is_current(entry[0]):
+            self._count("hits")
+            return entry[1]
+        self._miss_states[key] = self._page_state()
+        self._count("misses")
+        return None
+
+    def put(self, key, elements):
+        state = self._miss_states.pop(key) if key in self._miss_states else self._page_state()
+        if state is None:
+            # Page state unknown (mid-navigation, no weakref): don't cache
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (state, elements)
+
+    def invalidate(self, key=None):
+        """Drop one entry (e.g. after a stale element), or all of them."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+        self._count("invalidations")
+
+    def _is_current(self, state):
+        """True if state is the driver's generation and its document, checked once per generation."""
+        generation = current_generation(self.driver)
+        if generation is None or state[0] != generation:
+            return False
+        verified = _verified_documents.get(self.driver)
+        if verified is None or verified[0] != generation:
+            verified = self._page_state()
+            if verified is None:
+                return False
+            _verified_documents[self.driver] = verified
+        return verified == state
+
+    def _page_state(self):
+        """(generation, [document id, URL]) of the driver, or None if unknown."""
+        generation = current_generation(self.driver)
+        if generation is None:
+            return None
+        try:
+            document = self.driver.execute_script(DOCUMENT_IDENTITY_JS)
+        except WebDriverException:
+            return None
+        state = generation, tuple(document or ())
+        verified = _verified_documents.get(self.driver)
+        if verified is not None and verified[0] == generation:
+            # A miss that sees a newer document than the confirmed one updates it
+            _verified_documents[self.driver] = state
+        return state
+
+    def _count(self, name):
+        self.stats[name] += 1
+        ElementCache.totals[name] += 1
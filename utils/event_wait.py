@@ -0,0 +1,140 @@
+"""
+Event-driven waits - resolve a wait from inside the page the moment the
+condition becomes true, instead of polling every 500 ms over HTTP.
+
+A MutationObserver, popstate/hashchange listeners and wrapped
+history.pushState/replaceState re-check the condition in the browser,
+backed by a short interval for changes no event reports (CSS
+transitions, layout), and answer a single execute_async_script call.
+The Python condition is then evaluated once to return the real result;
+if script injection fails (e.g. the page navigates mid-wait) the wait
+falls back to regular WebDriverWait polling.
+"""
+
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Stay under ChromeDriver's default 30 s script timeout; polling covers the rest
+MAX_SCRIPT_WAIT = 25
+
+# In-page re-check period for conditions that change without a DOM mutation
+RECHECK_MS = 100
+
+WAIT_SCRIPT = """
+var kind = arguments[0], by = arguments[1], value = arguments[2], timeoutMs = arguments[3],
+    recheckMs = arguments[4];
+var done = arguments[arguments.length - 1];
+
+function find(all) {
+    if (by === 'xpath') {
+        var type = all ? XPathResult.ORDERED_NODE_SNAPSHOT_TYPE : XPathResult.FIRST_ORDERED_NODE_TYPE;
+        var result = document.evaluate(value, document, null, type, null);
+        if (!all) return result.singleNodeValue;
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+        return nodes;
+    }
+    var selector = by === 'id' ? '#' + CSS.escape(value)
+                 : by === 'class name' ? '.' + CSS.escape(value)
+                 : value;
+    return all ? Array.prototype.slice.call(document.querySelectorAll(selector))
+               : document.querySelector(selector);
+}
+
+function visible(el) {
+    if (!el || !el.getClientRects().length) return false;
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+
+function check() {
+    switch (kind) {
+        case 'present': return !!find(false);
+        case 'all_present': return find(true).length > 0;
+        case 'visible': return visible(find(false));
+        case 'clickable': var el = find(false); return visible(el) && !el.disabled;
+        case 'url_contains': return window.location.href.indexOf(value) !== -1;
+        case 'title_contains': return document.title.indexOf(value) !== -1;
+    }
+    return false;
+}
+
+if (check()) { done(true); return; }
+
+var finished = false, observer, timer, interval;
+var pushState = history.pushState, replaceState = history.replaceState;
+function onChange() { if (!finished && check()) finish(true); }
+
+// SPA route changes don't fire popstate; check right after the app calls history
+function wrapHistory(original) {
+    return function () {
+        var result = original.apply(this, arguments);
+        setTimeout(onChange, 0);
+        return result;
+    };
+}
+var wrappedPush = wrapHistory(pushState), wrappedReplace = wrapHistory(replaceState);
+
+function finish(result) {
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(interval);
+    window.removeEventListener('popstate', onChange);
+    window.removeEventListener('hashchange', onChange);
+    // Only restore what is still ours; the page may have wrapped history since
+    if (history.pushState === wrappedPush) history.pushState = pushState;
+    if (history.replaceState === wrappedReplace) history.replaceState = replaceState;
+    done(result);
+}
+
+observer = new MutationObserver(onChange);
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+window.addEventListener('popstate', onChange);
+window.addEventListener('hashchange', onChange);
+history.pushState = wrappedPush;
+history.replaceState = wrappedReplace;
+interval = setInterval(onChange, recheckMs);
+timer = setTimeout(function () { finish(false); }, timeoutMs);
+"""
+
+
+class EventDrivenWait(WebDriverWait):
+    """WebDriverWait that can resolve from an in-page observer."""
+
+    def until(self, method, message="", event=None):
+        """
+        Wait for method(driver) to be truthy, like WebDriverWait.until.
+        event is (kind, by, value) describing the same condition for the
+        in-page observer; without it this is a plain polling wait.
+        """
+        if event is None:
+            return super().until(method, message)
+
+        started = time.monotonic()
+        kind, by, value = event
+        script_wait = min(self._timeout, MAX_SCRIPT_WAIT)
+        try:
+            self._driver.execute_async_script(WAIT_SCRIPT, kind, by, value, int(script_wait * 1000), RECHECK_MS)
+        except WebDriverException:
+            # Injection not possible (navigation, no document yet): poll instead
+            pass
+
+        # Evaluate the real condition; poll for whatever time is left
+        remaining = max(self._timeout - (time.monotonic() - started), 0)
+        return WebDriverWait(
+            self._driver, remaining,
+            poll_frequency=self._poll,
+            ignored_exceptions=self._ignored_exceptions,
+        ).until(method, message)
+
+
+def locator_event(kind, locator):
+    """Build the event spec for a locator-based wait."""
+    by, value = locator
+    if by not in (By.XPATH, By.CSS_SELECTOR, By.ID, By.CLASS_NAME, By.TAG_NAME):
+        return None
+    return kind, by, value
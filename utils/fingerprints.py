@@ -0,0 +1,165 @@
+"""
+Content fingerprints - cheap hashes of the content a journey depends on,
+so incremental runs can skip journeys whose inputs haven't changed since
+they last passed.
+
+A (location, department) journey depends on:
+    teams            the teams with open postings (the Software Development
+                     link filters the board by one), from Lever's API
+    filter_options   the option lists of the Lever board's filter dropdowns
+    postings         the postings matching the pair, from Lever's API
+
+Everything is fetched over plain HTTP, without a browser. The careers
+page itself can't be: its team links are rendered by JavaScript. A part
+that can't be fetched is None and always counts as changed.
+"""
+
+import hashlib
+import json
+import os
+import time
+import urllib.request
+from html.parser import HTMLParser
+
+from utils.lever_api import LeverPostingsClient, company_from_board_url
+
+DEFAULT_FINGERPRINT_FILE = os.path.join(".cache", "fingerprints.json")
+DEFAULT_BOARD_URL = "https://jobs.lever.co/insiderone"
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "source", "track", "wbr"}
+
+
+def digest(value):
+    """Short stable hash of any JSON-serializable value."""
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class FilterOptionsParser(HTMLParser):
+    """Collects the option texts of each Lever filter dropdown, in page order."""
+
+    def __init__(self):
+        super().__init__()
+        self.filters = []
+        self._stack = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            return
+        classes = (dict(attrs).get("class") or "").split()
+        if "filter-button-wrapper" in classes:
+            self.filters.append([])
+        self._stack.append("filter-popup" in classes)
+
+    def handle_endtag(self, tag):
+        if tag not in VOID_TAGS and self._stack:
+            self._stack.pop()
+
+    def handle_data(self, data):
+        text = data.strip()
+        if text and self.filters and any(self._stack):
+            self.filters[-1].append(text)
+
+
+class ContentFingerprinter:
+    """Fetches and hashes the journey inputs; shared pieces are fetched once."""
+
+    def __init__(self, board_url=DEFAULT_BOARD_URL, client=None, timeout=10):
+        self.board_url = board_url
+        self.client = client or LeverPostingsClient()
+        self.timeout = timeout
+        self._cache = {}
+
+    def fingerprint(self, location, department):
+        """Return {part: hash or None} for one journey."""
+        postings = teams = self._all_postings()
+        if postings is not None:
+            teams = sorted({p.get("categories", {}).get("team") or "" for p in postings})
+            matching = LeverPostingsClient.filter_postings(postings, location, department)
+            postings = sorted(
+                [p.get("id"), p.get("text"), p.get("categories", {}).get("location"), p.get("applyUrl")]
+                for p in matching
+            )
+        filter_options = self._filter_options()
+        return {
+            "teams": self._hash(teams),
+            "filter_options": self._hash(filter_options),
+            "postings": self._hash(postings),
+        }
+
+    # --- Sources ---
+
+    def _filter_options(self):
+        if "filter_options" not in self._cache:
+            html = self._get(self.board_url)
+            options = None
+            if html is not None:
+                parser = FilterOptionsParser()
+                parser.feed(html)
+                options = parser.filters or None
+            self._cache["filter_options"] = options
+        return self._cache["filter_options"]
+
+    def _all_postings(self):
+        if "postings" not in self._cache:
+            company = company_from_board_url(self.board_url)
+            if company is None:
+                # Not a Lever board: nothing to fingerprint, so always changed
+                print(f"  Fingerprint: {self.board_url} is not a jobs.lever.co board")
+                self._cache["postings"] = None
+                return None
+            try:
+                self._cache["postings"] = self.client.fetch_postings(company)
+            except (OSError, ValueError) as e:
+                print(f"  Fingerprint: could not fetch postings - {e}")
+                self._cache["postings"] = None
+        return self._cache["postings"]
+
+    def _get(self, url):
+        try:
+            request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read().decode("utf-8", errors="replace")
+        except (OSError, ValueError) as e:
+            print(f"  Fingerprint: could not fetch {url} - {e}")
+            return None
+
+    @staticmethod
+    def _hash(value):
+        return None if value is None else digest(value)
+
+
+class FingerprintStore:
+    """On-disk fingerprints of each journey's last passing run."""
+
+    def __init__(self, path=DEFAULT_FINGERPRINT_FILE):
+        self.path = path
+        self._runs = self._load()
+
+    @staticmethod
+    def key(location, department):
+        return f"{location}|{department}"
+
+    def changed_parts(self, key, fingerprint):
+        """Parts that differ from the last passing run (all of them if there is none)."""
+        last = self._runs.get(key)
+        if last is None:
+            return list(fingerprint)
+        return [part for part, value in fingerprint.items()
+                if value is None or last["fingerprint"].get(part) != value]
+
+    def record_pass(self, key, fingerprint):
+        self._runs[key] = {"fingerprint": fingerprint, "passed_at": time.time()}
+        self._write()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self._runs, f, indent=2)
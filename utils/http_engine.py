@@ -0,0 +1,341 @@
+"""
+HTTP Engine - runs the static navigation checks of the journey with a
+plain HTTP fetch and an HTML parser, and only starts Chrome for the
+steps that need JavaScript.
+
+Pages are parsed into a small element tree and queried with the same
+locators as HomePage / CareersPage, through a subset of XPath
+(//tag[contains(@attr|text(), '...')], @attr='...') and CSS
+(tag#id.class[attr='...'] with descendant combinators). A locator
+outside that subset raises UnsupportedLocator.
+
+Usage:
+    python -m utils.http_engine                    # steps 1-3 (and 5 if server-rendered) over HTTP
+    python -m utils.http_engine --escalate         # continue the JavaScript steps in headless Chrome
+"""
+
+import argparse
+import re
+import sys
+import time
+import urllib.request
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from selenium.webdriver.common.by import By
+
+from pages.home_page import HomePage
+from pages.careers_page import CareersPage
+from utils.driver_factory import create_chrome_driver
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "source", "track", "wbr"}
+
+XPATH_STEP = re.compile(r"(//|/)([\w-]+|\*)((?:\[[^\]]*\])*)")
+XPATH_PREDICATE = re.compile(
+    r"""\[\s*(?:contains\(\s*(?P<cfield>@[\w-]+|text\(\))\s*,\s*(?P<cq>['"])(?P<cvalue>.*?)(?P=cq)\s*\)"""
+    r"""|(?P<efield>@[\w-]+|text\(\))\s*=\s*(?P<eq>['"])(?P<evalue>.*?)(?P=eq))\s*\]"""
+)
+CSS_COMPOUND = re.compile(r"([\w-]+|\*)?((?:[#.][\w-]+|\[[\w-]+(?:=(['\"]?)[^\]]*?\3)?\])*)$")
+CSS_PART = re.compile(r"""#([\w-]+)|\.([\w-]+)|\[([\w-]+)(?:=(['"]?)(.*?)\4)?\]""")
+
+
+class UnsupportedLocator(ValueError):
+    """The locator needs a real browser (or a richer evaluator)."""
+
+
+# --- Element tree ---
+
+class Node:
+    """An element of the parsed page."""
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.parent = parent
+        self.children = []
+        self.text_parts = []
+
+    @property
+    def own_text(self):
+        """The element's direct text (XPath text())."""
+        return "".join(self.text_parts)
+
+    @property
+    def text(self):
+        """All text below the element, like WebElement.text without layout."""
+        return "".join(self.text_parts + [child.text for child in self.children]).strip()
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+
+class TreeBuilder(HTMLParser):
+
+    def __init__(self):
+        super().__init__()
+        self.root = Node("#document")
+        self._current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {k: v or "" for k, v in attrs}, self._current)
+        self._current.children.append(node)
+        if tag not in VOID_TAGS:
+            self._current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self._current.children.append(Node(tag, {k: v or "" for k, v in attrs}, self._current))
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open element; stray end tags are ignored
+        node = self._current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self._current = node.parent
+
+    def handle_data(self, data):
+        self._current.text_parts.append(data)
+
+
+def parse_html(html):
+    builder = TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# --- Locators ---
+
+def find_all(root, locator):
+    """Evaluate a Selenium (By, value) locator against a parsed tree."""
+    by, value = locator
+    if by == By.XPATH:
+        return _xpath(root, value)
+    if by == By.ID:
+        return _css(root, f"#{value}")
+    if by == By.CLASS_NAME:
+        return _css(root, f".{value}")
+    if by in (By.CSS_SELECTOR, By.TAG_NAME):
+        return _css(root, value)
+    raise UnsupportedLocator(f"Locator {locator} is not supported by the HTTP engine.")
+
+
+def _unique(nodes):
+    seen, result = set(), []
+    for node in nodes:
+        if id(node) not in seen:
+            seen.add(id(node))
+            result.append(node)
+    return result
+
+
+def _xpath(root, expression):
+    steps = list(XPATH_STEP.finditer(expression))
+    if not steps or "".join(m.group(0) for m in steps) != expression:
+        raise UnsupportedLocator(f"XPath outside the supported subset: {expression}")
+
+    context = [root]
+    for match in steps:
+        axis, tag, predicates = match.groups()
+        tests = _xpath_predicates(predicates, expression)
+        candidates = []
+        for node in context:
+            candidates.extend(node.descendants() if axis == "//" else node.children)
+        context = _unique(
+            n for n in candidates
+            if (tag == "*" or n.tag == tag) and all(test(n) for test in tests)
+        )
+    return context
+
+
+def _xpath_predicates(predicates, expression):
+    tests, position = [], 0
+    for match in XPATH_PREDICATE.finditer(predicates):
+        if match.start() != position:
+            break
+        position = match.end()
+        if match.group("cfield"):
+            field, value, contains = match.group("cfield"), match.group("cvalue"), True
+        else:
+            field, value, contains = match.group("efield"), match.group("evalue"), False
+        tests.append(_field_test(field, value, contains))
+    if position != len(predicates):
+        raise UnsupportedLocator(f"XPath predicate outside the supported subset: {expression}")
+    return tests
+
+
+def _field_test(field, value, contains):
+    def read(node):
+        return node.own_text if field == "text()" else node.attrs.get(field[1:])
+
+    def test(node):
+        actual = read(node)
+        if actual is None:
+            return False
+        return value in actual if contains else actual == value
+    return test
+
+
+def _css(root, selector):
+    context = [root]
+    for compound in selector.split():
+        match = CSS_COMPOUND.match(compound)
+        if not match or not compound:
+            raise UnsupportedLocator(f"CSS selector outside the supported subset: {selector}")
+        tag, rest = match.group(1), match.group(2)
+        tests = [_css_test(part) for part in CSS_PART.finditer(rest)]
+        context = _unique(
+            n for node in context for n in node.descendants()
+            if (tag in (None, "*") or n.tag == tag) and all(test(n) for test in tests)
+        )
+    return context
+
+
+def _css_test(part):
+    element_id, class_name, attr, _, value = part.groups()
+    if element_id:
+        return lambda n: n.attrs.get("id") == element_id
+    if class_name:
+        return lambda n: class_name in (n.attrs.get("class") or "").split()
+    if value is None:
+        return lambda n: attr in n.attrs
+    return lambda n: n.attrs.get(attr) == value
+
+
+# --- Pages ---
+
+class HttpPage:
+    """A fetched, parsed page that answers locator queries without a browser."""
+
+    def __init__(self, url, html, status=200):
+        self.url = url
+        self.status = status
+        self.root = parse_html(html)
+
+    @classmethod
+    def fetch(cls, url, timeout=10):
+        request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            html = response.read().decode("utf-8", errors="replace")
+            return cls(response.geturl(), html, response.status)
+
+    @property
+    def title(self):
+        titles = find_all(self.root, (By.TAG_NAME, "title"))
+        return titles[0].text if titles else ""
+
+    def find_all(self, locator):
+        return find_all(self.root, locator)
+
+    def find(self, locator):
+        matches = self.find_all(locator)
+        return matches[0] if matches else None
+
+    def is_present(self, locator):
+        return self.find(locator) is not None
+
+
+# --- Static journey ---
+
+def run_static_checks(home_url=None, timeout=10):
+    """
+    Run the journey steps that only need server-rendered HTML. Stops at the
+    first failure. Returns a report with per-step results, the steps that
+    still need a browser, and the URLs reached.
+    """
+    started = time.perf_counter()
+    report = {"steps": [], "needs_browser": [], "careers_url": None, "board_url": None}
+
+    def record(number, name, ok, detail):
+        report["steps"].append({"step": number, "name": name, "ok": ok, "detail": detail})
+        return ok
+
+    def finish():
+        report["passed"] = all(s["ok"] for s in report["steps"])
+        report["duration"] = round(time.perf_counter() - started, 3)
+        return report
+
+    try:
+        home = HttpPage.fetch(home_url or HomePage.URL, timeout)
+        if not record(1, "Homepage", HomePage.looks_like_home(home.url, home.title),
+                      f"{home.url} ({home.title!r})"):
+            return finish()
+
+        link = home.find(HomePage.WE_ARE_HIRING_LINK)
+        if link is None or not link.get_attribute("href"):
+            record(2, "We're hiring", False, "Footer link not found in the homepage HTML.")
+            return finish()
+        careers = HttpPage.fetch(urljoin(home.url, link.get_attribute("href")), timeout)
+        report["careers_url"] = careers.url
+        if not record(2, "We're hiring", CareersPage.is_careers_url(careers.url), careers.url):
+            return finish()
+
+        if not record(3, "Explore open roles", careers.is_present(CareersPage.EXPLORE_OPEN_ROLES_BTN),
+                      "Button present in the careers HTML."):
+            return finish()
+    except OSError as e:
+        record(len(report["steps"]) + 1, "Fetch", False, f"{type(e).__name__}: {e}")
+        return finish()
+
+    # Step 4 only scrolls to the teams section; step 5 is static when the link is server-rendered
+    sd_link = careers.find(CareersPage.SOFTWARE_DEV_LINK)
+    if sd_link is not None:
+        report["board_url"] = urljoin(careers.url, sd_link.get_attribute("href"))
+        record(5, "Software Development", True, report["board_url"])
+    else:
+        report["needs_browser"].append("5: Software Development link is rendered by JavaScript")
+    report["needs_browser"].append("6-7: Lever filter dropdowns and job list")
+    return finish()
+
+
+def escalate(report, headless=True):
+    """Continue from where the static checks stopped, in a real browser (steps 4-7)."""
+    driver = create_chrome_driver(headless=headless)
+    try:
+        careers_page = CareersPage(driver)
+        if report["board_url"]:
+            careers_page.go_to(report["board_url"])
+        else:
+            careers_page.go_to(report["careers_url"])
+            careers_page.click_explore_open_roles()
+            careers_page.click_software_development_block()
+        careers_page.apply_filters()
+        return careers_page.is_job_list_displayed()
+    finally:
+        driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the journey's static checks over plain HTTP.")
+    parser.add_argument("--home-url", default=HomePage.URL)
+    parser.add_argument("--escalate", action="store_true",
+                        help="Run the JavaScript-dependent steps in headless Chrome afterwards.")
+    args = parser.parse_args(argv)
+
+    report = run_static_checks(args.home_url)
+    for result in report["steps"]:
+        status = "OK" if result["ok"] else "FAIL"
+        print(f"  [Step {result['step']}] {result['name']}: {status} - {result['detail']}")
+    print(f"Static checks {'passed' if report['passed'] else 'failed'} in {report['duration']}s")
+
+    if not report["passed"]:
+        return 1
+    for reason in report["needs_browser"]:
+        print(f"  Needs a browser: {reason}")
+    if args.escalate:
+        print("Escalating to Chrome...")
+        if not escalate(report):
+            print("  FAIL: no job listings after filtering.")
+            return 1
+        print("  OK - job listings displayed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
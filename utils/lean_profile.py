@@ -0,0 +1,140 @@
+"""
+Lean browser profile - blocks resources the tests never assert on
+(images, fonts, media, analytics, chat widgets) and switches Chrome to
+the 'eager' page-load strategy.
+
+URL patterns are blocked through CDP (Network.setBlockedURLs). The
+blocklist is per tab, so it is installed on the session's first tab at
+startup and again on every tab the page objects switch to
+(BasePage.switch_to_new_tab). Resource
+types are mapped to URL patterns by file extension, and images are also
+disabled through Chrome's content settings so extension-less images are
+covered. Blocked and transferred requests are read back from Chrome's
+performance log to report what the profile saved.
+"""
+
+import json
+from collections import Counter
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.record_replay import drain_performance_log, enable_network_capture
+
+# Third parties loaded by insiderone.com and jobs.lever.co that no test looks at
+DEFAULT_BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googleadservices.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*snap.licdn.com*",
+    "*px.ads.linkedin.com*",
+    "*bat.bing.com*",
+    "*clarity.ms*",
+    "*hotjar.com*",
+    "*hs-scripts.com*",
+    "*hs-analytics.net*",
+    "*hsforms.net*",
+    "*intercom.io*",
+    "*intercomcdn.com*",
+    "*drift.com*",
+    "*driftt.com*",
+    "*zdassets.com*",
+    "*youtube.com/embed*",
+    "*player.vimeo.com*",
+    "*wistia*",
+]
+
+
+def _extension_patterns(*extensions):
+    """
+    Patterns anchored to the end of the path, with or without a query string:
+    "*.mov*" would also block /movies/ or /jobs.movable.js.
+    """
+    return [pattern for ext in extensions for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+
+RESOURCE_TYPE_PATTERNS = {
+    "image": _extension_patterns("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico"),
+    "font": _extension_patterns("woff", "woff2", "ttf", "otf", "eot"),
+    "media": _extension_patterns("mp4", "webm", "mov", "mp3", "ogg", "m3u8"),
+}
+
+DEFAULT_BLOCKED_TYPES = ("image", "font", "media")
+
+
+class LeanProfile:
+    """Blocklist + page-load settings applied to every Chrome session."""
+
+    def __init__(self, blocked_urls=None, blocked_types=DEFAULT_BLOCKED_TYPES, eager=True):
+        self.blocked_urls = list(DEFAULT_BLOCKED_URLS if blocked_urls is None else blocked_urls)
+        self.blocked_types = tuple(blocked_types)
+        self.eager = eager
+        self.stats = Counter()
+        self.blocked_by_type = Counter()
+
+    @classmethod
+    def baseline(cls):
+        """A profile that blocks nothing, to measure a normal run for comparison."""
+        return cls(blocked_urls=[], blocked_types=(), eager=False)
+
+    @property
+    def patterns(self):
+        patterns = list(self.blocked_urls)
+        for resource_type in self.blocked_types:
+            patterns += RESOURCE_TYPE_PATTERNS.get(resource_type, [])
+        return patterns
+
+    # --- Browser setup ---
+
+    def apply_options(self, options):
+        """Configure Chrome options before the session starts."""
+        if self.eager:
+            options.page_load_strategy = "eager"
+        if "image" in self.blocked_types:
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        enable_network_capture(options)
+        return options
+
+    def apply_driver(self, driver):
+        """Install the URL blocklist on the session's current tab."""
+        if not self.patterns:
+            return driver
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+        except (AttributeError, WebDriverException) as e:
+            print(f"  Lean profile: could not install blocklist - {e}")
+        return driver
+
+    # --- Stats ---
+
+    def collect(self, driver, logs=None):
+        """Add blocked/transferred counts from logs (default: drain the performance log) to the run stats."""
+        if logs is None:
+            logs = drain_performance_log(driver)
+
+        types = {}
+        for log in logs:
+            message = json.loads(log["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+
+            if method == "Network.requestWillBeSent":
+                types[params["requestId"]] = params.get("type", "Other")
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                self.stats["requests_blocked"] += 1
+                self.blocked_by_type[params.get("type") or types.get(params["requestId"], "Other")] += 1
+            elif method == "Network.loadingFinished":
+                self.stats["requests_completed"] += 1
+                self.stats["bytes_transferred"] += int(params.get("encodedDataLength", 0))
+
+    def summary(self):
+        return {
+            "requests_blocked": self.stats["requests_blocked"],
+            "requests_completed": self.stats["requests_completed"],
+            "bytes_transferred": self.stats["bytes_transferred"],
+            "blocked_by_type": dict(self.blocked_by_type.most_common()),
+        }
@@ -0,0 +1,75 @@
+"""
+Lever API - reads a board's postings from Lever's public JSON endpoint
+(or a local stand-in serving the same schema) so job listings can be
+verified against an authoritative expected set.
+
+Endpoint: GET <base_url>/<company>?mode=json
+"""
+
+import json
+import re
+import urllib.parse
+import urllib.request
+
+LEVER_API_URL = "https://api.lever.co/v0/postings"
+
+POSTING_ID_PATTERN = re.compile(r"lever\.co/[^/?#]+/([0-9a-f-]{36})")
+
+
+class LeverPostingsClient:
+    """Minimal client for Lever's postings API."""
+
+    def __init__(self, base_url=LEVER_API_URL, timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def fetch_postings(self, company):
+        """Return the raw posting objects for a company's board."""
+        url = f"{self.base_url}/{urllib.parse.quote(company)}?mode=json"
+        with urllib.request.urlopen(url, timeout=self.timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    def expected_postings(self, company, location=None, team=None):
+        """Fetch the board and return records matching the filters."""
+        postings = self.filter_postings(self.fetch_postings(company), location, team)
+        return [self.to_record(p) for p in postings]
+
+    # --- Helpers ---
+
+    @staticmethod
+    def filter_postings(postings, location=None, team=None):
+        """Apply the location/team filters the way the board's dropdowns do."""
+        def matches(posting):
+            categories = posting.get("categories", {})
+            locations = categories.get("allLocations") or [categories.get("location") or ""]
+            if location and not any(location.lower() in loc.lower() for loc in locations):
+                return False
+            if team and team.lower() != (categories.get("team") or "").lower():
+                return False
+            return True
+
+        return [p for p in postings if matches(p)]
+
+    @staticmethod
+    def to_record(posting):
+        """Convert an API posting to the record shape used by CareersPage.extract_postings()."""
+        categories = posting.get("categories", {})
+        return {
+            "id": posting.get("id"),
+            "title": posting.get("text"),
+            "location": categories.get("location"),
+            "group": categories.get("team"),
+            "apply_href": posting.get("applyUrl"),
+        }
+
+
+def company_from_board_url(url):
+    """Extract the company slug from a jobs.lever.co board URL."""
+    match = re.search(r"jobs\.lever\.co/([^/?#]+)", url)
+    return urllib.parse.unquote(match.group(1)) if match else None
+
+
+def posting_id_from_url(url):
+    """Extract the posting id from a hosted or apply URL."""
+    match = POSTING_ID_PATTERN.search(url or "")
+    return match.group(1) if match else None
@@ -0,0 +1,138 @@
+"""
+Apply link checker - validates many Lever apply links concurrently over
+HTTP, without clicking through them in the browser.
+
+Requests run on asyncio with a concurrency cap. Each request is a
+blocking http.client call in a worker thread, on a keep-alive
+connection borrowed from a per-host pool, so a board full of links
+costs a handful of TCP/TLS handshakes. Redirects are followed manually
+so the final URL is known.
+"""
+
+import asyncio
+import http.client
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+APPLICATION_FORM_PATTERN = re.compile(
+    r"""<form[^>]*(?:id|class)=["'][^"']*application-form""", re.IGNORECASE
+)
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class ConnectionPool:
+    """Idle keep-alive connections per (scheme, host, port)."""
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def take(self, origin, fresh=False):
+        with self._lock:
+            idle = self._idle.get(origin)
+            if idle and not fresh:
+                return idle.pop()
+            self.opened += 1
+        scheme, host, port = origin
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, port, timeout=self.timeout)
+
+    def give_back(self, origin, connection):
+        with self._lock:
+            self._idle.setdefault(origin, []).append(connection)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+class ApplyLinkChecker:
+    """Checks that apply links answer 200 and land on a Lever application form."""
+
+    def __init__(self, concurrency=8, timeout=10, max_redirects=5):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+
+    def check_all(self, hrefs):
+        """Check every href; returns one result dict per href, in order."""
+        return asyncio.run(self.check_all_async(hrefs))
+
+    async def check_all_async(self, hrefs):
+        pool = ConnectionPool(self.timeout)
+        slots = asyncio.Semaphore(self.concurrency)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            try:
+                return await asyncio.gather(*(self._check(href, pool, slots, executor) for href in hrefs))
+            finally:
+                pool.close()
+
+    async def _check(self, href, pool, slots, executor):
+        result = {"href": href, "url": href, "status": None, "ok": False, "error": None}
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        async with slots:
+            try:
+                url = href
+                for _ in range(self.max_redirects + 1):
+                    status, location, body = await loop.run_in_executor(executor, self._get, pool, url)
+                    result["url"], result["status"] = url, status
+                    if status in REDIRECT_STATUSES and location:
+                        url = urljoin(url, location)
+                        continue
+                    break
+                else:
+                    raise ValueError(f"More than {self.max_redirects} redirects")
+
+                if status != 200:
+                    result["error"] = f"HTTP {status}"
+                elif "lever.co" not in url:
+                    result["error"] = f"Landed outside Lever: {url}"
+                elif not APPLICATION_FORM_PATTERN.search(body):
+                    result["error"] = "No application form on the page"
+                else:
+                    result["ok"] = True
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+
+        result["elapsed"] = round(time.perf_counter() - started, 3)
+        return result
+
+    @staticmethod
+    def _get(pool, url):
+        """Blocking GET on a pooled connection; returns (status, location, body)."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL: {url}")
+        origin = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+
+        # A pooled connection may have been closed by the server; retry once on a fresh one
+        for attempt in range(2):
+            connection = pool.take(origin, fresh=attempt > 0)
+            try:
+                connection.request("GET", path, headers={"User-Agent": "Mozilla/5.0"})
+                response = connection.getresponse()
+                body = response.read().decode("utf-8", errors="replace")
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                pool.give_back(origin, connection)
+            return response.status, response.getheader("Location"), body
@@ -0,0 +1,359 @@
+"""
+Matrix Runner - runs the careers journey for many (location, department)
+pairs in parallel, one headless Chrome per worker process.
+
+Usage:
+    python -m utils.matrix_runner --pair "Istanbul, Turkiye|Quality Assurance"
+    python -m utils.matrix_runner --matrix matrix.json --workers 4
+    python -m utils.matrix_runner --matrix matrix.json --tabs 8
+
+The matrix file is a JSON list of [location, department] pairs.
+With --tabs, one browser walks to the Lever board once and the pairs are
+checked concurrently in tabs of that browser instead of separate processes.
+With --incremental, pairs whose content fingerprints match their last
+passing run are skipped (--force-full runs everything and re-records).
+With --checkpoints, workers resume on the Lever board from a fresh
+checkpoint (saved by any earlier full walk, including a pytest run with
+--checkpoints) and only walk steps 1-5 when none exists.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from pages.base_page import BasePage
+from pages.home_page import HomePage
+from pages.careers_page import CareersPage
+from pages.async_careers_page import AsyncCareersPage
+from utils.async_tabs import AsyncBrowser
+from utils.checkpoints import DEFAULT_CHECKPOINT_FILE, CheckpointStore
+from utils.driver_factory import create_chrome_driver, resolve_chromedriver
+from utils.fingerprints import ContentFingerprinter, FingerprintStore
+from utils.lever_api import LEVER_API_URL, LeverPostingsClient
+
+DEFAULT_MATRIX = [
+    ("Istanbul, Turkiye", "Quality Assurance"),
+]
+
+
+def walk_to_lever_board(driver):
+    """
+    Walk from the homepage to the Lever board and return the CareersPage.
+    Resumes from the 'lever_board' checkpoint instead when one is fresh.
+    """
+    home_page = HomePage(driver)
+    careers_page = CareersPage(driver)
+
+    if careers_page.resume_from("lever_board") and "lever.co" in careers_page.get_url():
+        return careers_page
+
+    home_page.open()
+    assert home_page.is_home_page_opened(), "Homepage did not load correctly."
+
+    home_page.click_we_are_hiring()
+    assert careers_page.is_careers_page_opened(), "Careers page did not open."
+
+    assert careers_page.is_explore_open_roles_visible(), "'Explore open roles' button not found."
+    careers_page.click_explore_open_roles()
+    careers_page.click_software_development_block()
+    return careers_page
+
+
+def run_journey(driver, location, department):
+    """
+    Walk the journey from the homepage to the Lever application form
+    for one filter pair. Raises AssertionError on the first failed check.
+    """
+    careers_page = walk_to_lever_board(driver)
+
+    careers_page.apply_filters(location=location, department=department)
+    assert careers_page.is_job_list_displayed(), "No job listings are displayed."
+    assert careers_page.verify_all_jobs_match_filters(
+        expected_location=location,
+        expected_department=department
+    ), "Some job listings do not match the applied filters."
+
+    careers_page.click_apply_on_first_job()
+    assert careers_page.is_lever_application_form_opened(), \
+        "Did not redirect to Lever application form."
+
+
+def run_pair(location, department, driver_path=None, screenshot_dir="screenshots", checkpoints=None):
+    """Worker entry point: run one pair in its own headless browser."""
+    if checkpoints is not None:
+        # Class attributes set in the parent don't reach spawned workers
+        BasePage.checkpoints = checkpoints
+    result = {
+        "location": location,
+        "department": department,
+        "passed": False,
+        "error": None,
+        "screenshot": None,
+    }
+    started = time.perf_counter()
+    driver = create_chrome_driver(headless=True, driver_path=driver_path)
+
+    try:
+        run_journey(driver, location, department)
+        result["passed"] = True
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["screenshot"] = _save_failure_screenshot(
+            driver, screenshot_dir, f"{location}_{department}"
+        )
+    finally:
+        driver.quit()
+
+    result["duration"] = round(time.perf_counter() - started, 2)
+    return result
+
+
+def run_matrix(pairs, workers=None, screenshot_dir="screenshots", checkpoints=None):
+    """Fan the pairs out to a process pool and return the merged report."""
+    workers = workers or os.cpu_count() or 1
+    # Resolve the driver once so workers don't race on the download cache
+    driver_path = resolve_chromedriver()
+    started_at = datetime.datetime.now()
+    started = time.perf_counter()
+    results = []
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(pairs))) as pool:
+        futures = {
+            pool.submit(run_pair, location, department, driver_path, screenshot_dir, checkpoints):
+                (location, department)
+            for location, department in pairs
+        }
+        for future in as_completed(futures):
+            location, department = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself crashed (e.g. Chrome failed to start)
+                result = {
+                    "location": location,
+                    "department": department,
+                    "passed": False,
+                    "error": f"{type(e).__name__}: {e}",
+                    "screenshot": None,
+                    "duration": None,
+                }
+            status = "PASS" if result["passed"] else "FAIL"
+            print(f"  [{status}] {location} | {department}")
+            results.append(result)
+
+    return _build_report(results, started_at, started, workers)
+
+
+# --- Tabs mode ---
+
+async def check_pair_in_tab(browser, board_url, location, department, screenshot_dir="screenshots"):
+    """Filter and verify one pair in its own tab of browser."""
+    result = {
+        "location": location,
+        "department": department,
+        "passed": False,
+        "error": None,
+        "screenshot": None,
+    }
+    started = time.perf_counter()
+
+    async with browser.tab(board_url) as tab:
+        page = AsyncCareersPage(tab)
+        try:
+            await page.apply_filters(location=location, department=department)
+            summary = await page.verify_postings(location, department)
+            assert summary["scanned"], "No job listings are displayed."
+            assert summary["passed"], (
+                f"{len(summary['mismatches'])} listing(s) do not match the applied filters "
+                f"(groups: {summary['groups']})."
+            )
+            assert "lever.co" in (summary["apply_hrefs"] or [""])[0], \
+                "First job posting has no Lever apply link."
+            result["passed"] = True
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+            result["screenshot"] = await _save_tab_screenshot(
+                tab, screenshot_dir, f"{location}_{department}"
+            )
+
+    result["duration"] = round(time.perf_counter() - started, 2)
+    status = "PASS" if result["passed"] else "FAIL"
+    print(f"  [{status}] {location} | {department}")
+    return result
+
+
+async def _check_pairs(browser, board_url, pairs, screenshot_dir):
+    return await asyncio.gather(*(
+        check_pair_in_tab(browser, board_url, location, department, screenshot_dir)
+        for location, department in pairs
+    ))
+
+
+def run_matrix_in_tabs(pairs, tabs=4, screenshot_dir="screenshots", board_url=None):
+    """
+    Check all pairs from one headless Chrome, at most `tabs` tabs at a time.
+    The Lever board is reached once (or taken from board_url); every pair
+    then starts from that board in a fresh tab.
+    """
+    started_at = datetime.datetime.now()
+    started = time.perf_counter()
+    driver = create_chrome_driver(headless=True)
+    try:
+        if board_url is None:
+            board_url = walk_to_lever_board(driver).get_url()
+        browser = AsyncBrowser.from_driver(driver, max_tabs=tabs)
+        try:
+            results = asyncio.run(_check_pairs(browser, board_url, pairs, screenshot_dir))
+        finally:
+            browser.close()
+    finally:
+        driver.quit()
+
+    return _build_report(list(results), started_at, started, tabs, mode="tabs")
+
+
+def _build_report(results, started_at, started, workers, mode="processes"):
+    """Merged report; started_at is the wall-clock start, started the perf_counter one."""
+    results.sort(key=lambda r: (r["location"], r["department"]))
+    return {
+        "started_at": started_at.isoformat(timespec="seconds"),
+        "mode": mode,
+        "workers": workers,
+        "duration": round(time.perf_counter() - started, 2),
+        "total": len(results),
+        "passed": sum(1 for r in results if r["passed"]),
+        "failed": sum(1 for r in results if not r["passed"]),
+        "results": results,
+    }
+
+
+def select_changed_pairs(pairs, store, fingerprinter, force=False):
+    """
+    Split pairs into those to run and those unchanged since their last pass.
+    Returns (to_run, skipped, fingerprints by pair).
+    """
+    to_run, skipped, fingerprints = [], [], {}
+    for location, department in pairs:
+        fingerprint = fingerprinter.fingerprint(location, department)
+        fingerprints[(location, department)] = fingerprint
+        changed = store.changed_parts(store.key(location, department), fingerprint)
+        if changed or force:
+            to_run.append((location, department))
+        else:
+            skipped.append((location, department))
+            print(f"  [SKIP] {location} | {department} (unchanged)")
+    return to_run, skipped, fingerprints
+
+
+def record_passes(report, store, fingerprints):
+    for result in report["results"]:
+        if result["passed"]:
+            pair = (result["location"], result["department"])
+            store.record_pass(store.key(*pair), fingerprints[pair])
+
+
+def load_matrix(path):
+    """Read a JSON list of [location, department] pairs."""
+    with open(path, encoding="utf-8") as f:
+        return [tuple(pair) for pair in json.load(f)]
+
+
+def _failure_screenshot_path(screenshot_dir, label):
+    os.makedirs(screenshot_dir, exist_ok=True)
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    safe_label = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")
+    return f"{screenshot_dir}/FAIL_matrix_{safe_label}_{timestamp}.png"
+
+
+def _save_failure_screenshot(driver, screenshot_dir, label):
+    filename = _failure_screenshot_path(screenshot_dir, label)
+    try:
+        driver.save_screenshot(filename)
+        return filename
+    except Exception:
+        return None
+
+
+async def _save_tab_screenshot(tab, screenshot_dir, label):
+    filename = _failure_screenshot_path(screenshot_dir, label)
+    try:
+        return await tab.screenshot(filename)
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the careers journey across a filter matrix.")
+    parser.add_argument("--matrix", help="JSON file with [location, department] pairs.")
+    parser.add_argument("--pair", action="append", default=[],
+                        help="A 'location|department' pair; may be repeated.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count).")
+    parser.add_argument("--tabs", type=int, default=None,
+                        help="Check pairs in this many concurrent tabs of one browser.")
+    parser.add_argument("--board-url", default=None,
+                        help="With --tabs, start from this Lever board instead of walking steps 1-5.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Skip pairs whose content is unchanged since their last passing run.")
+    parser.add_argument("--force-full", action="store_true",
+                        help="Run every pair, still recording fingerprints for --incremental.")
+    parser.add_argument("--checkpoints", action="store_true",
+                        help="Resume from a fresh Lever board checkpoint instead of walking steps 1-5.")
+    parser.add_argument("--checkpoint-ttl", type=int, default=3600,
+                        help="Seconds before a saved checkpoint expires.")
+    parser.add_argument("--checkpoint-file", default=DEFAULT_CHECKPOINT_FILE)
+    parser.add_argument("--lever-api", default=LEVER_API_URL)
+    parser.add_argument("--report", default="matrix_report.json",
+                        help="Where to write the merged JSON report.")
+    parser.add_argument("--screenshot-dir", default="screenshots")
+    args = parser.parse_args(argv)
+
+    pairs = load_matrix(args.matrix) if args.matrix else []
+    pairs += [tuple(p.split("|", 1)) for p in args.pair]
+    pairs = pairs or DEFAULT_MATRIX
+
+    store = fingerprints = None
+    skipped = []
+    if args.incremental or args.force_full:
+        store = FingerprintStore()
+        fingerprinter = ContentFingerprinter(client=LeverPostingsClient(args.lever_api))
+        pairs, skipped, fingerprints = select_changed_pairs(pairs, store, fingerprinter,
+                                                            force=args.force_full)
+
+    checkpoints = None
+    if args.checkpoints:
+        checkpoints = CheckpointStore(args.checkpoint_file, ttl=args.checkpoint_ttl)
+        BasePage.checkpoints = checkpoints
+
+    print(f"Running {len(pairs)} filter pair(s)...")
+    if not pairs:
+        report = _build_report([], datetime.datetime.now(), time.perf_counter(), 0)
+    elif args.tabs:
+        report = run_matrix_in_tabs(pairs, tabs=args.tabs, screenshot_dir=args.screenshot_dir,
+                                    board_url=args.board_url)
+    else:
+        report = run_matrix(pairs, workers=args.workers, screenshot_dir=args.screenshot_dir,
+                            checkpoints=checkpoints)
+
+    if store is not None:
+        record_passes(report, store, fingerprints)
+    report["skipped"] = [list(pair) for pair in skipped]
+
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n{report['passed']}/{report['total']} passed in {report['duration']}s")
+    if skipped:
+        print(f"{len(skipped)} unchanged pair(s) skipped")
+    print(f"Report saved: {args.report}")
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+Performance metrics - browser-side timings for each page-object
+navigation, appended to a local SQLite time series, with a CLI that
+shows per-page percentile trends across runs and flags slowdowns.
+
+Collected per navigation:
+    Navigation Timing   ttfb, dom_content_loaded, load, transfer_size
+    Paint               first_paint, first_contentful_paint, lcp
+    CDP Performance     script_duration, layout_duration, task_duration,
+                        js_heap_used, nodes, layout_count
+
+The CDP duration and count metrics are cumulative, so they are stored as
+the delta from a snapshot taken before the navigation (PerfStore.mark,
+called by the page objects before they navigate or click) or, failing
+that, from the previous recorded page. Heap size and node count are
+current values and are stored as-is. The CDP domain and its counters
+belong to one tab, so both the enabled state and the snapshots are kept
+per (driver, window handle).
+
+Usage:
+    python -m utils.perf_metrics                       # trends for every page
+    python -m utils.perf_metrics --page lever_board --runs 20 --threshold 0.25
+"""
+
+import argparse
+import datetime
+import math
+import os
+import sqlite3
+import statistics
+import sys
+import time
+import weakref
+
+from selenium.common.exceptions import WebDriverException
+
+DEFAULT_PERF_DB = os.path.join("reports", "perf_metrics.sqlite")
+
+# Waits for the load event (up to 10 s), then reads the buffered paint and LCP entries
+COLLECT_JS = """
+var done = arguments[arguments.length - 1];
+function read() {
+    var metrics = {};
+    var nav = performance.getEntriesByType('navigation')[0];
+    if (nav) {
+        metrics.ttfb = nav.responseStart;
+        metrics.dom_content_loaded = nav.domContentLoadedEventEnd;
+        metrics.load = nav.loadEventEnd;
+        metrics.transfer_size = nav.transferSize;
+    }
+    performance.getEntriesByType('paint').forEach(function (entry) {
+        metrics[entry.name.replace(/-/g, '_')] = entry.startTime;
+    });
+    try {
+        var observer = new PerformanceObserver(function (list) {
+            var entries = list.getEntries();
+            if (entries.length) metrics.lcp = entries[entries.length - 1].startTime;
+        });
+        observer.observe({type: 'largest-contentful-paint', buffered: true});
+        setTimeout(function () { observer.disconnect(); done(metrics); }, 0);
+    } catch (e) {
+        done(metrics);
+    }
+}
+if (document.readyState === 'complete') { setTimeout(read, 0); }
+else {
+    var timer = setTimeout(read, 10000);
+    window.addEventListener('load', function () { clearTimeout(timer); setTimeout(read, 0); });
+}
+"""
+
+# CDP Performance.getMetrics name -> (stored name, scale)
+CDP_METRICS = {
+    "ScriptDuration": ("script_duration", 1000),
+    "LayoutDuration": ("layout_duration", 1000),
+    "TaskDuration": ("task_duration", 1000),
+    "JSHeapUsedSize": ("js_heap_used", 1),
+    "Nodes": ("nodes", 1),
+    "LayoutCount": ("layout_count", 1),
+}
+
+# CDP counters that only grow while the renderer lives; stored as per-page deltas
+CUMULATIVE_METRICS = ("script_duration", "layout_duration", "task_duration", "layout_count")
+
+# Metrics in milliseconds, where a rising value is a slowdown
+TIMING_METRICS = ("ttfb", "dom_content_loaded", "load", "first_paint", "first_contentful_paint",
+                  "lcp", "script_duration", "layout_duration", "task_duration")
+
+# driver -> window handles whose tab has the Performance domain enabled
+_enabled = weakref.WeakKeyDictionary()
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of values (pct in 0-100)."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def current_tab(driver):
+    """Window handle CDP commands of driver go to, or None if unknown."""
+    try:
+        return driver.current_window_handle
+    except (AttributeError, WebDriverException):
+        return None
+
+
+def enable_performance_domain(driver):
+    """Start CDP performance counters for driver's current tab (once per tab)."""
+    try:
+        tabs = _enabled.setdefault(driver, set())
+        tab = current_tab(driver)
+        if tab in tabs:
+            return
+        driver.execute_cdp_cmd("Performance.enable", {})
+        tabs.add(tab)
+    except (AttributeError, TypeError, WebDriverException):
+        pass
+
+
+def read_cdp_metrics(driver):
+    """Current CDP Performance counters of driver, or {} without CDP."""
+    enable_performance_domain(driver)
+    metrics = {}
+    try:
+        for entry in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]:
+            if entry["name"] in CDP_METRICS:
+                name, scale = CDP_METRICS[entry["name"]]
+                metrics[name] = entry["value"] * scale
+    except (AttributeError, KeyError, WebDriverException):
+        pass
+    return metrics
+
+
+def collect_metrics(driver, baseline=None):
+    """
+    Return {metric: value} for the current page; missing sources are skipped.
+    Cumulative CDP counters are reported relative to baseline (an earlier
+    read_cdp_metrics) when given.
+    """
+    metrics = {}
+    try:
+        metrics.update(driver.execute_async_script(COLLECT_JS) or {})
+    except WebDriverException as e:
+        print(f"  Perf metrics: page timings unavailable - {e.msg}")
+
+    counters = read_cdp_metrics(driver)
+    for name, value in counters.items():
+        # A counter below its baseline was reset by a renderer swap (cross-site navigation)
+        if baseline and name in CUMULATIVE_METRICS and value >= baseline.get(name, value + 1):
+            value -= baseline[name]
+        metrics[name] = value
+
+    return {name: round(float(value), 3) for name, value in metrics.items() if value is not None}
+
+
+class PerfStore:
+    """SQLite time series of page metrics; one run_id per test session."""
+
+    def __init__(self, path=DEFAULT_PERF_DB, run_id=None):
+        self.path = path
+        self.run_id = run_id or datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        self.samples = 0
+        # driver -> {window handle: CDP counters at the last mark or record of that tab}
+        self._baselines = weakref.WeakKeyDictionary()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS metrics (
+                run_id TEXT, recorded_at REAL, page TEXT, url TEXT, metric TEXT, value REAL)""")
+            db.execute("CREATE INDEX IF NOT EXISTS metrics_page ON metrics (page, metric, run_id)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path)
+
+    def mark(self, driver):
+        """Snapshot the CDP counters of driver's current tab before a navigation (enables them on first use)."""
+        try:
+            self._baselines.setdefault(driver, {})[current_tab(driver)] = read_cdp_metrics(driver)
+        except TypeError:
+            pass
+
+    def record(self, page, driver):
+        """Collect the current page's metrics and append them under page."""
+        try:
+            baseline = self._baselines.get(driver, {}).get(current_tab(driver))
+        except TypeError:
+            baseline = None
+        metrics = collect_metrics(driver, baseline)
+        # Until the next mark, the next page is measured from here
+        self.mark(driver)
+        try:
+            url = driver.current_url
+        except WebDriverException:
+            url = None
+        self.append(page, url, metrics)
+        return metrics
+
+    def append(self, page, url, metrics, recorded_at=None):
+        recorded_at = recorded_at or time.time()
+        with self._connect() as db:
+            db.executemany(
+                "INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?)",
+                [(self.run_id, recorded_at, page, url, name, value) for name, value in metrics.items()],
+            )
+        self.samples += 1
+
+    # --- Queries ---
+
+    def runs(self, limit=10):
+        """The most recent run ids, oldest first."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT run_id FROM metrics GROUP BY run_id ORDER BY MIN(recorded_at) DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def trends(self, runs=10, page=None, metric=None):
+        """{(page, metric): [(run_id, p50, p95, samples), ...]} over the last runs."""
+        run_ids = self.runs(runs)
+        if not run_ids:
+            return {}
+        query = (f"SELECT page, metric, run_id, value FROM metrics "
+                 f"WHERE run_id IN ({','.join('?' * len(run_ids))})")
+        params = list(run_ids)
+        if page:
+            query += " AND page = ?"
+            params.append(page)
+        if metric:
+            query += " AND metric = ?"
+            params.append(metric)
+
+        values = {}
+        with self._connect() as db:
+            for row_page, row_metric, run_id, value in db.execute(query, params):
+                values.setdefault((row_page, row_metric), {}).setdefault(run_id, []).append(value)
+
+        return {
+            key: [(run_id, percentile(by_run[run_id], 50), percentile(by_run[run_id], 95), len(by_run[run_id]))
+                  for run_id in run_ids if run_id in by_run]
+            for key, by_run in sorted(values.items())
+        }
+
+
+def find_slowdowns(trends, threshold=0.25, min_delta_ms=50):
+    """
+    Flag timing metrics whose p50 in the latest run exceeds the median p50
+    of the earlier runs by more than threshold (and min_delta_ms).
+    """
+    slowdowns = []
+    for (page, metric), points in trends.items():
+        if metric not in TIMING_METRICS or len(points) < 2:
+            continue
+        latest = points[-1][1]
+        baseline = statistics.median(p50 for _, p50, _, _ in points[:-1])
+        if latest > baseline * (1 + threshold) and latest - baseline >= min_delta_ms:
+            slowdowns.append({"page": page, "metric": metric, "latest": latest, "baseline": baseline,
+                              "change": round((latest - baseline) / baseline * 100, 1) if baseline else None})
+    return slowdowns
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show page metric trends across runs and flag slowdowns.")
+    parser.add_argument("--db", default=DEFAULT_PERF_DB)
+    parser.add_argument("--runs", type=int, default=10, help="Number of recent runs to show.")
+    parser.add_argument("--page", default=None)
+    parser.add_argument("--metric", default=None)
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Flag a p50 this much above the earlier runs' median (default 0.25).")
+    parser.add_argument("--fail-on-slowdown", action="store_true")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"No metrics stored yet ({args.db}); run the suite with --perf-metrics.")
+        return 0
+
+    trends = PerfStore(args.db).trends(args.runs, args.page, args.metric)
+    for (page, metric), points in trends.items():
+        p50s = " -> ".join(f"{p50:.0f}" for _, p50, _, _ in points)
+        print(f"  {page:<14} {metric:<24} p50 {p50s}   (latest p95 {points[-1][2]:.0f}, "
+              f"{points[-1][3]} sample(s))")
+
+    slowdowns = find_slowdowns(trends, args.threshold)
+    for s in slowdowns:
+        print(f"  SLOWER: {s['page']} {s['metric']} p50 {s['latest']:.0f} ms vs "
+              f"{s['baseline']:.0f} ms median ({s['change']:+}%)")
+    print(f"\n{len(trends)} series over {len(PerfStore(args.db).runs(args.runs))} run(s), "
+          f"{len(slowdowns)} slowdown(s)")
+    return 1 if slowdowns and args.fail_on_slowdown else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
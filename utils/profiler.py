@@ -0,0 +1,172 @@
+"""
+Command Profiler - counts and times every WebDriver command, grouped by
+page-object method and by test step. Time spent sleeping inside
+WebDriverWait.until is reported separately from command time, and so is
+the time of in-page waits (event-driven waits, wait_for_page_stable):
+those are a single execute_async_script that sits idle in the browser
+until the page is ready, so their duration counts as wait time.
+"""
+
+import html
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from pages.base_page import BasePage
+from utils.event_wait import WAIT_SCRIPT
+from utils.stability import WAIT_STABLE_JS
+
+# Scripts that wait inside the page rather than do work
+IN_PAGE_WAIT_SCRIPTS = frozenset({WAIT_SCRIPT, WAIT_STABLE_JS})
+
+
+def _new_bucket():
+    return {"commands": 0, "command_time": 0.0, "wait_time": 0.0,
+            "by_command": defaultdict(int)}
+
+
+class CommandProfiler:
+    """Instruments one driver session; attach() before the test, detach() after."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.current_step = "(setup)"
+        self.by_method = defaultdict(_new_bucket)
+        self.by_step = defaultdict(_new_bucket)
+        self.total = _new_bucket()
+        # Time inside driver.execute (in-page waits included), so until() doesn't count it again
+        self._command_time = 0.0
+        self._original_until = None
+
+    # --- Attach / detach ---
+
+    def attach(self):
+        driver_execute = self.driver.execute
+        profiler = self
+
+        def execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                return driver_execute(driver_command, params)
+            finally:
+                profiler._record_command(driver_command, time.perf_counter() - started,
+                                         waiting=profiler._is_in_page_wait(driver_command, params))
+
+        self.driver.execute = execute
+
+        self._original_until = WebDriverWait.until
+        original_until = self._original_until
+
+        def until(wait, method, message=""):
+            started = time.perf_counter()
+            command_time_before = profiler._command_time
+            try:
+                return original_until(wait, method, message)
+            finally:
+                elapsed = time.perf_counter() - started
+                commands = profiler._command_time - command_time_before
+                profiler._record_wait(max(elapsed - commands, 0.0))
+
+        WebDriverWait.until = until
+        return self
+
+    def detach(self):
+        self.driver.__dict__.pop("execute", None)
+        if self._original_until is not None:
+            WebDriverWait.until = self._original_until
+            self._original_until = None
+
+    def on_step(self, number, title):
+        """Step listener: attribute following commands to this step."""
+        self.current_step = f"Step {number} - {title}"
+
+    # --- Recording ---
+
+    def _record_command(self, command, elapsed, waiting=False):
+        self._command_time += elapsed
+        for bucket in (self.total, self.by_method[self._page_method()], self.by_step[self.current_step]):
+            bucket["commands"] += 1
+            bucket["wait_time" if waiting else "command_time"] += elapsed
+            bucket["by_command"][command] += 1
+
+    @staticmethod
+    def _is_in_page_wait(command, params):
+        return command == "executeAsyncScript" and (params or {}).get("script") in IN_PAGE_WAIT_SCRIPTS
+
+    def _record_wait(self, elapsed):
+        for bucket in (self.total, self.by_method[self._page_method()], self.by_step[self.current_step]):
+            bucket["wait_time"] += elapsed
+
+    @staticmethod
+    def _page_method():
+        """Name of the outermost page-object method on the call stack."""
+        owner = "(test)"
+        frame = sys._getframe(1)
+        while frame is not None:
+            obj = frame.f_locals.get("self")
+            if isinstance(obj, BasePage):
+                owner = f"{type(obj).__name__}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        return owner
+
+    # --- Reporting ---
+
+    def report(self):
+        def dump(bucket):
+            return {
+                "commands": bucket["commands"],
+                "command_time": round(bucket["command_time"], 4),
+                "wait_time": round(bucket["wait_time"], 4),
+                "by_command": dict(sorted(bucket["by_command"].items(), key=lambda kv: -kv[1])),
+            }
+
+        def ranked(groups):
+            items = sorted(groups.items(),
+                           key=lambda kv: -(kv[1]["command_time"] + kv[1]["wait_time"]))
+            return {name: dump(bucket) for name, bucket in items}
+
+        return {
+            "total": dump(self.total),
+            "by_method": ranked(self.by_method),
+            "by_step": {name: dump(bucket) for name, bucket in self.by_step.items()},
+        }
+
+    def write_report(self, report_dir, name):
+        """Write <name>.json and <name>.html to report_dir, return the JSON path."""
+        os.makedirs(report_dir, exist_ok=True)
+        report = self.report()
+        json_path = os.path.join(report_dir, f"{name}.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        with open(os.path.join(report_dir, f"{name}.html"), "w", encoding="utf-8") as f:
+            f.write(self._render_html(name, report))
+        return json_path
+
+    @staticmethod
+    def _render_html(name, report):
+        def table(title, groups):
+            rows = "".join(
+                f"<tr><td>{html.escape(group)}</td><td>{b['commands']}</td>"
+                f"<td>{b['command_time']:.3f}</td><td>{b['wait_time']:.3f}</td>"
+                f"<td>{html.escape(', '.join(f'{c}: {n}' for c, n in b['by_command'].items()))}</td></tr>"
+                for group, b in groups.items()
+            )
+            return (f"<h2>{title}</h2><table><tr><th>Name</th><th>Commands</th>"
+                    f"<th>Command time (s)</th><th>Wait time (s)</th><th>Breakdown</th></tr>{rows}</table>")
+
+        total = report["total"]
+        return (
+            f"<html><head><meta charset='utf-8'><title>Profile - {html.escape(name)}</title>"
+            "<style>body{font-family:sans-serif}table{border-collapse:collapse}"
+            "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}</style></head><body>"
+            f"<h1>{html.escape(name)}</h1>"
+            f"<p>{total['commands']} commands, {total['command_time']:.3f}s in commands, "
+            f"{total['wait_time']:.3f}s waiting</p>"
+            + table("By page-object method", report["by_method"])
+            + table("By test step", report["by_step"])
+            + "</body></html>"
+        )
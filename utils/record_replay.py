@@ -0,0 +1,267 @@
+"""
+Record / Replay - captures the HTTP exchanges of a journey into an on-disk
+archive and serves them back from a local HTTP server.
+
+Archive layout:
+    <archive>/index.json      # [{method, url, status, content_type, location, body}]
+    <archive>/bodies/<sha1>   # raw response bodies
+
+During replay, recorded hosts are served under a path prefix
+(https://insiderone.com/careers/ -> http://127.0.0.1:<port>/insiderone.com/careers/)
+and absolute links to those hosts are rewritten in text responses, so the
+URL checks used by the page objects ("careers", "lever.co") still hold.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin, urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.abstract_event_listener import AbstractEventListener
+
+RECORDED_HOSTS = ("insiderone.com", "lever.co")
+
+TEXT_TYPES = ("text/", "javascript", "json", "xml")
+
+
+def enable_network_capture(options):
+    """Turn on Chrome performance logging so network events can be read back."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def drain_performance_log(driver):
+    """
+    Read (and thereby empty) Chrome's performance log. Drain it once and
+    pass the entries to every consumer; a second read only sees new events.
+    """
+    try:
+        return driver.get_log("performance")
+    except WebDriverException:
+        return []
+
+
+def _is_recorded_host(host, hosts):
+    return any(host == h or host.endswith("." + h) for h in hosts)
+
+
+class NetworkRecorder:
+    """Collects responses for recorded hosts from Chrome's performance log."""
+
+    def __init__(self, archive_dir, hosts=RECORDED_HOSTS, log_consumers=()):
+        self.archive_dir = archive_dir
+        self.hosts = hosts
+        self.entries = {}
+        # callable(driver, logs) also fed every drained batch (e.g. LeanProfile.collect)
+        self.log_consumers = list(log_consumers)
+
+    def capture(self, driver, logs=None):
+        """Fetch bodies of new responses in logs (default: drain the performance log)."""
+        if logs is None:
+            logs = drain_performance_log(driver)
+        for consumer in self.log_consumers:
+            consumer(driver, logs)
+
+        methods = {}
+        for log in logs:
+            message = json.loads(log["message"])["message"]
+            params = message.get("params", {})
+
+            if message.get("method") == "Network.requestWillBeSent":
+                methods[params["requestId"]] = params["request"]["method"]
+                redirect = params.get("redirectResponse")
+                if redirect:
+                    self._add(params["request"]["method"], redirect, body=b"")
+
+            elif message.get("method") == "Network.responseReceived":
+                response = params["response"]
+                if not self._wants(response["url"]):
+                    continue
+                body = self._fetch_body(driver, params["requestId"])
+                if body is not None:
+                    self._add(methods.get(params["requestId"], "GET"), response, body)
+
+    def save(self):
+        """Write the archive index and bodies to disk."""
+        bodies_dir = os.path.join(self.archive_dir, "bodies")
+        os.makedirs(bodies_dir, exist_ok=True)
+
+        index = []
+        for entry in self.entries.values():
+            digest = hashlib.sha1(entry["_body"]).hexdigest()
+            with open(os.path.join(bodies_dir, digest), "wb") as f:
+                f.write(entry["_body"])
+            record = {k: v for k, v in entry.items() if k != "_body"}
+            record["body"] = digest
+            index.append(record)
+
+        with open(os.path.join(self.archive_dir, "index.json"), "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        print(f"  Recorded {len(index)} response(s) to {self.archive_dir}")
+
+    # --- Internals ---
+
+    def _wants(self, url):
+        parts = urlsplit(url)
+        return parts.scheme in ("http", "https") and _is_recorded_host(parts.hostname or "", self.hosts)
+
+    def _fetch_body(self, driver, request_id):
+        try:
+            result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException:
+            # Body already evicted (e.g. page navigated away) or no body at all
+            return None
+        if result.get("base64Encoded"):
+            return base64.b64decode(result["body"])
+        return result["body"].encode("utf-8")
+
+    def _add(self, method, response, body):
+        if not self._wants(response["url"]):
+            return
+        headers = {k.lower(): v for k, v in response.get("headers", {}).items()}
+        self.entries[(method, response["url"])] = {
+            "method": method,
+            "url": response["url"],
+            "status": response["status"],
+            "content_type": headers.get("content-type", response.get("mimeType", "")),
+            "location": headers.get("location"),
+            "_body": body,
+        }
+
+
+class RecordingListener(AbstractEventListener):
+    """
+    Drains the recorder around navigations and scripts: Chrome drops
+    response bodies once the page that loaded them navigates away.
+    """
+
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    def before_navigate_to(self, url, driver):
+        self.recorder.capture(driver)
+
+    def after_navigate_to(self, url, driver):
+        self.recorder.capture(driver)
+
+    def before_click(self, element, driver):
+        self.recorder.capture(driver)
+
+    def before_execute_script(self, script, driver):
+        self.recorder.capture(driver)
+
+    def before_quit(self, driver):
+        self.recorder.capture(driver)
+
+
+class ReplayServer:
+    """Serves a recorded archive from a local HTTP server."""
+
+    def __init__(self, archive_dir, host="127.0.0.1", port=0):
+        self.archive_dir = archive_dir
+        with open(os.path.join(archive_dir, "index.json"), encoding="utf-8") as f:
+            index = json.load(f)
+
+        self.entries = {(e["method"], e["url"]): e for e in index}
+        # Fallback lookup that ignores the query string
+        self.by_path = {}
+        for e in index:
+            parts = urlsplit(e["url"])
+            self.by_path.setdefault((e["method"], parts.hostname, parts.path), e)
+        self.hosts = sorted({urlsplit(e["url"]).hostname for e in index}, key=len, reverse=True)
+
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def local_url(self, url):
+        """Map a live URL to its replay URL."""
+        parts = urlsplit(url)
+        local = f"{self.base_url}/{parts.hostname}{parts.path or '/'}"
+        return local + (f"?{parts.query}" if parts.query else "")
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    # --- Serving ---
+
+    def lookup(self, method, path, referer=None):
+        """Find the archived entry for a replay path like /insiderone.com/careers/."""
+        method = "GET" if method == "HEAD" else method
+        host, _, rest = path.lstrip("/").partition("/")
+        if host not in self.hosts and referer:
+            # Root-relative link (e.g. /careers/): resolve against the referring host
+            ref_path = urlsplit(referer).path
+            host, rest = ref_path.lstrip("/").partition("/")[0], path.lstrip("/")
+        if host not in self.hosts:
+            return None
+
+        target = f"/{rest}"
+        parts = urlsplit(target)
+        for scheme in ("https", "http"):
+            entry = self.entries.get((method, f"{scheme}://{host}{target}"))
+            if entry:
+                return entry
+        return self.by_path.get((method, host, parts.path))
+
+    def rewrite(self, body):
+        """Point absolute links to recorded hosts at the replay server."""
+        hosts = "|".join(re.escape(h) for h in self.hosts)
+        pattern = r"(?:https?:)?(?:\\/\\/|//)(" + hosts + r")(?![\w.-])"
+        return re.sub(pattern.encode(), lambda m: f"{self.base_url}/".encode() + m.group(1), body)
+
+    def read_body(self, entry):
+        with open(os.path.join(self.archive_dir, "bodies", entry["body"]), "rb") as f:
+            body = f.read()
+        if any(t in (entry["content_type"] or "") for t in TEXT_TYPES):
+            body = self.rewrite(body)
+        return body
+
+    def _make_handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def _serve(self):
+                entry = replay.lookup(self.command, self.path, self.headers.get("Referer"))
+                if entry is None:
+                    replay.misses += 1
+                    self.send_error(404, "Not in archive")
+                    return
+
+                replay.hits += 1
+                body = replay.read_body(entry)
+                self.send_response(entry["status"])
+                if entry["content_type"]:
+                    self.send_header("Content-Type", entry["content_type"])
+                if entry.get("location"):
+                    location = urljoin(entry["url"], entry["location"])
+                    self.send_header("Location", replay.local_url(location))
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_HEAD = _serve
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,190 @@
+"""
+Remote Scheduler - hands out WebDriver sessions across several remote
+endpoints (Selenium standalone servers, Grid hubs or nodes).
+
+Each new session goes to the healthy endpoint with the lowest load,
+read from its /status (busy slots for Grid/standalone servers, the
+sessions started here otherwise). Every endpoint has one keep-alive
+RemoteConnection shared by all of its sessions, so commands reuse the
+same HTTP connections; quitting a session only drops the idle sockets,
+which reopen on the next command. An endpoint that stops answering is
+marked down and skipped until its status recovers; one that refuses a
+session (full, or can't match the capabilities) is only skipped for that
+session start. When no endpoint can
+take a session, create_driver waits for fresh statuses and tries again
+(retries); a test that lost its session mid-run can be re-run on another
+endpoint by pytest-rerunfailures, matching NODE_LOST_ERRORS (see conftest).
+"""
+
+import json
+import threading
+import time
+import urllib.request
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+
+# Failures that mean the test's endpoint went away, not that the test failed
+NODE_LOST_ERRORS = (
+    "NoHealthyNode",
+    "MaxRetryError",
+    "ConnectionRefusedError",
+    "RemoteDisconnected",
+    "ProtocolError",
+    "invalid session id",
+)
+
+
+class NoHealthyNode(WebDriverException):
+    """Every remote endpoint is down or at capacity."""
+
+
+def is_node_lost(error):
+    """True if error means the endpoint can't be reached, not that it refused the request."""
+    return isinstance(error, OSError) or any(
+        marker in f"{type(error).__name__}: {error}" for marker in NODE_LOST_ERRORS)
+
+
+def _keep_alive_connection(url):
+    try:
+        from selenium.webdriver.remote.client_config import ClientConfig
+    except ImportError:
+        # Selenium releases before ClientConfig take keep_alive directly
+        return RemoteConnection(url, keep_alive=True)
+    return RemoteConnection(client_config=ClientConfig(url, keep_alive=True))
+
+
+class RemoteNode:
+    """One remote WebDriver endpoint and its last known status."""
+
+    def __init__(self, url, max_sessions=1):
+        self.url = url.rstrip("/")
+        self.max_sessions = max_sessions
+        self.connection = _keep_alive_connection(self.url)
+        self.active = 0
+        self.healthy = True
+        self.capacity = max_sessions
+        self.busy = 0
+        self.checked_at = None
+        self.error = None
+
+    @property
+    def load(self):
+        """Fraction of slots in use: busy slots reported by the node, or sessions started here."""
+        return max(self.busy, self.active) / self.capacity if self.capacity else 1.0
+
+    def refresh(self, timeout=3):
+        """Read /status; returns True if the node is ready for new sessions."""
+        try:
+            with urllib.request.urlopen(f"{self.url}/status", timeout=timeout) as response:
+                value = json.loads(response.read()).get("value") or {}
+        except (OSError, ValueError) as e:
+            self.healthy, self.error = False, f"{type(e).__name__}: {e}"
+        else:
+            slots = [slot for node in value.get("nodes") or []
+                     if node.get("availability", "UP") == "UP"
+                     for slot in node.get("slots") or []]
+            if slots:
+                self.capacity = len(slots)
+                self.busy = sum(1 for slot in slots if slot.get("session"))
+            else:
+                self.capacity, self.busy = self.max_sessions, 0
+            self.healthy = bool(value.get("ready", True)) or self.busy > 0
+            self.error = None if self.healthy else value.get("message", "not ready")
+        self.checked_at = time.monotonic()
+        return self.healthy
+
+    def __repr__(self):
+        return f"RemoteNode({self.url!r}, load={self.load:.2f}, healthy={self.healthy})"
+
+
+class RemoteScheduler:
+    """Load- and health-aware session factory over remote endpoints (a DriverPool factory)."""
+
+    def __init__(self, urls, options_factory, max_sessions=1, status_ttl=2.0, status_timeout=3,
+                 retries=0, driver_class=webdriver.Remote):
+        if not urls:
+            raise ValueError("RemoteScheduler needs at least one endpoint URL.")
+        self.nodes = [RemoteNode(url, max_sessions) for url in urls]
+        self.options_factory = options_factory
+        self.status_ttl = status_ttl
+        self.status_timeout = status_timeout
+        self.retries = retries
+        self.driver_class = driver_class
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.started = 0
+
+    # --- Scheduling ---
+
+    def create_driver(self):
+        """
+        Start a session on the least-loaded healthy node, falling back to the
+        next one. If none can take it, wait for fresh statuses and start over,
+        up to `retries` times, before raising NoHealthyNode.
+        """
+        tried = set()
+        attempt = 0
+        while True:
+            node = self._pick(exclude=tried)
+            if node is None:
+                states = ", ".join(f"{n.url} ({n.error or f'load {n.load:.2f}'})" for n in self.nodes)
+                if attempt >= self.retries:
+                    raise NoHealthyNode(f"No remote endpoint can take a session: {states}")
+                attempt += 1
+                print(f"  Remote: no endpoint can take a session ({states}); "
+                      f"retrying in {self.status_ttl:.1f}s ({attempt}/{self.retries})")
+                time.sleep(self.status_ttl)
+                tried.clear()
+                continue
+            try:
+                driver = self.driver_class(command_executor=node.connection, options=self.options_factory())
+            except Exception as e:
+                with self._lock:
+                    node.active -= 1
+                    node.error = f"{type(e).__name__}: {e}"
+                    if is_node_lost(e):
+                        node.healthy = False
+                    elif not isinstance(e, SessionNotCreatedException):
+                        # Not the node's fault (bad options, driver bug): don't mask it
+                        raise
+                # Unreachable nodes stay down until their status recovers;
+                # refusing ones (e.g. no free slot) are only skipped for this start
+                tried.add(node.url)
+                print(f"  Remote: could not start a session on {node.url} - {node.error}")
+                continue
+            with self._lock:
+                self._sessions[id(driver)] = node
+                self.started += 1
+            return driver
+
+    def _pick(self, exclude=()):
+        for node in self.nodes:
+            if node.checked_at is None or time.monotonic() - node.checked_at > self.status_ttl:
+                node.refresh(self.status_timeout)
+        with self._lock:
+            candidates = [n for n in self.nodes if n.healthy and n.load < 1 and n.url not in exclude]
+            if not candidates:
+                return None
+            node = min(candidates, key=lambda n: n.load)
+            # Reserve the slot before the (slow) session start so parallel callers spread out
+            node.active += 1
+            return node
+
+    # --- Session bookkeeping ---
+
+    def node_for(self, driver):
+        return self._sessions.get(id(driver))
+
+    def forget(self, driver):
+        """Release a quit session's slot (DriverPool on_evict hook)."""
+        with self._lock:
+            node = self._sessions.pop(id(driver), None)
+            if node is not None:
+                node.active = max(node.active - 1, 0)
+
+    def summary(self):
+        return [{"url": n.url, "healthy": n.healthy, "load": round(n.load, 2), "active": n.active}
+                for n in self.nodes]
@@ -0,0 +1,257 @@
+"""
+Screencast - keeps the last N seconds of a tab's CDP screencast in
+memory and encodes them into a video only when a test fails.
+
+Chrome pushes low-resolution JPEG frames (Page.startScreencast with a
+max size, quality and everyNthFrame) over the DevTools websocket of
+utils/cdp.py. Frames stay as the base64 strings Chrome sends, in a
+deque trimmed to the time window and capped at MAX_FPS * seconds
+frames, so memory is bounded. Encoding runs in a separate process:
+an MP4 through ffmpeg when it is on PATH, otherwise a self-contained
+HTML flipbook. The reader thread's CPU time for frames (JSON decoding
+of the base64 payload plus the handler), the handler's share of it and
+the buffer size are tracked per recorder and summed in
+ScreencastRecorder.totals.
+"""
+
+import base64
+import datetime
+import json
+import math
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from functools import partial
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.cdp import CDPConnection, CDPError, browser_ws_url
+
+MAX_FPS = 30
+
+FLIPBOOK_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title></head>
+<body style="background:#222;color:#eee;font-family:sans-serif">
+<p>{title} - <span id="info"></span>
+<button id="toggle">Pause</button> <input id="seek" type="range" min="0" max="{last}" value="0" style="width:50%"></p>
+<img id="frame" style="max-width:100%">
+<script>
+var frames = {frames}, index = 0, playing = true, timer = null;
+var img = document.getElementById('frame'), seek = document.getElementById('seek');
+function show(i) {{
+    index = i; img.src = 'data:image/jpeg;base64,' + frames[i][1]; seek.value = i;
+    document.getElementById('info').textContent = 'frame ' + (i + 1) + '/' + frames.length +
+        ' at ' + (frames[i][0] - frames[0][0]).toFixed(2) + 's';
+}}
+function tick() {{
+    show(index);
+    if (!playing) return;
+    var next = (index + 1) % frames.length;
+    var delay = next ? (frames[next][0] - frames[index][0]) * 1000 : 1000;
+    timer = setTimeout(function () {{ index = next; tick(); }}, Math.max(delay, 10));
+}}
+document.getElementById('toggle').onclick = function () {{
+    playing = !playing; this.textContent = playing ? 'Pause' : 'Play'; clearTimeout(timer); tick();
+}};
+seek.oninput = function () {{ playing = false; clearTimeout(timer); show(+this.value); }};
+tick();
+</script></body></html>
+"""
+
+_encoders = []
+
+
+def wait_for_encoders(timeout=60):
+    """Block until background encodes finish (call before the process exits)."""
+    for process in list(_encoders):
+        process.join(timeout)
+    _encoders[:] = [p for p in _encoders if p.is_alive()]
+
+
+def encode_frames(frames, base_path, ffmpeg=None):
+    """
+    Encode (timestamp, base64 JPEG) frames to base_path + ".mp4" with
+    ffmpeg, or to base_path + ".html" as a flipbook. Returns the path.
+    """
+    os.makedirs(os.path.dirname(base_path) or ".", exist_ok=True)
+    if ffmpeg:
+        try:
+            return _encode_mp4(frames, base_path + ".mp4", ffmpeg)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"  Screencast: ffmpeg failed ({e}); writing a flipbook instead")
+
+    path = base_path + ".html"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(FLIPBOOK_HTML.format(title=os.path.basename(base_path), last=len(frames) - 1,
+                                     frames=json.dumps([[ts, data] for ts, data in frames])))
+    return path
+
+
+def _encode_mp4(frames, path, ffmpeg):
+    with tempfile.TemporaryDirectory() as tmp:
+        lines = []
+        for number, (timestamp, data) in enumerate(frames):
+            name = os.path.join(tmp, f"{number:05d}.jpg")
+            with open(name, "wb") as f:
+                f.write(base64.b64decode(data))
+            duration = frames[number + 1][0] - timestamp if number + 1 < len(frames) else 1.0
+            lines += [f"file '{name}'", f"duration {max(duration, 0.001):.3f}"]
+        # The concat demuxer ignores the last duration unless the file is listed again
+        lines.append(f"file '{name}'")
+        listing = os.path.join(tmp, "frames.txt")
+        with open(listing, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", listing,
+             "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2", "-pix_fmt", "yuv420p", "-fps_mode", "vfr", path],
+            check=True, timeout=120,
+        )
+    return path
+
+
+class ScreencastRecorder:
+    """Rolling in-memory screencast of one driver's current tab."""
+
+    totals = Counter()
+
+    def __init__(self, driver, seconds=10, max_width=640, max_height=360, quality=40, every_nth_frame=2):
+        self.driver = driver
+        self.seconds = seconds
+        self.params = {"format": "jpeg", "quality": quality, "maxWidth": max_width,
+                       "maxHeight": max_height, "everyNthFrame": every_nth_frame}
+        self.frames = deque(maxlen=max(math.ceil(seconds * MAX_FPS), 1))
+        self._lock = threading.Lock()
+        self.ffmpeg = shutil.which("ffmpeg")
+        self.connection = None
+        self.target_id = None
+        self.session_id = None
+        self.started_at = None
+        self.received = 0
+        self.buffer_bytes = 0
+        self.peak_buffer_bytes = 0
+        self.handler_cpu = 0.0
+        self.reader_cpu = 0.0
+        self._frame_listener = None
+
+    # --- Recording ---
+
+    def start(self, connection=None):
+        """Open a DevTools connection (unless given) and start streaming the current tab."""
+        self.connection = connection or CDPConnection(browser_ws_url(self.driver))
+        self.started_at = time.monotonic()
+        try:
+            self._attach(self.driver.current_window_handle)
+        except Exception:
+            self.connection.close()
+            self.connection = None
+            raise
+        return self
+
+    def on_step(self, number, title):
+        """Step listener: follow the driver when a step switched tabs."""
+        try:
+            handle = self.driver.current_window_handle
+        except WebDriverException:
+            return
+        if handle != self.target_id and self.connection is not None:
+            self._detach()
+            try:
+                self._attach(handle)
+            except (CDPError, TimeoutError, KeyError) as e:
+                print(f"  Screencast: could not follow the new tab - {e}")
+
+    def stop(self):
+        """Stop streaming and add this recorder's overhead to the totals."""
+        if self.connection is None:
+            return
+        self._detach()
+        self._read_reader_cpu()
+        self.connection.close()
+        self.connection = None
+        stats = self.stats()
+        ScreencastRecorder.totals["recordings"] += 1
+        ScreencastRecorder.totals["frames"] += stats["frames_received"]
+        ScreencastRecorder.totals["duration"] += stats["duration"]
+        ScreencastRecorder.totals["handler_cpu"] += stats["handler_cpu"]
+        ScreencastRecorder.totals["reader_cpu"] += stats["reader_cpu"]
+        ScreencastRecorder.totals["peak_buffer_bytes"] = max(
+            ScreencastRecorder.totals["peak_buffer_bytes"], stats["peak_buffer_bytes"])
+
+    def stats(self):
+        duration = time.monotonic() - self.started_at if self.started_at else 0.0
+        self._read_reader_cpu()
+        return {"frames_received": self.received, "frames_buffered": len(self.frames),
+                "buffer_bytes": self.buffer_bytes, "peak_buffer_bytes": self.peak_buffer_bytes,
+                "handler_cpu": round(self.handler_cpu, 4), "reader_cpu": round(self.reader_cpu, 4),
+                "duration": round(duration, 3)}
+
+    def _read_reader_cpu(self):
+        if self.connection is not None:
+            self.reader_cpu = self.connection.event_cpu["Page.screencastFrame"]
+
+    # --- Failure output ---
+
+    def flush(self, directory, name):
+        """Encode the buffered frames in a background process; returns the output path without extension."""
+        with self._lock:
+            frames = list(self.frames)
+            self.frames.clear()
+            self.buffer_bytes = 0
+        if not frames:
+            return None
+
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        base_path = os.path.join(directory, f"FAIL_{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}_{timestamp}")
+        process = multiprocessing.get_context("spawn").Process(
+            target=encode_frames, args=(frames, base_path, self.ffmpeg), daemon=True)
+        process.start()
+        _encoders.append(process)
+        ScreencastRecorder.totals["encodes"] += 1
+        return base_path
+
+    # --- Internals ---
+
+    def _attach(self, target_id):
+        self.target_id = target_id
+        self.session_id = self.connection.execute(
+            "Target.attachToTarget", {"targetId": target_id, "flatten": True})["sessionId"]
+        # Bound to its session, so a frame arriving during a tab switch is acked on its own target
+        self._frame_listener = partial(self._on_frame, self.session_id)
+        self.connection.on("Page.screencastFrame", self._frame_listener, self.session_id)
+        self.connection.execute("Page.startScreencast", self.params, self.session_id)
+
+    def _detach(self):
+        if self.session_id is None:
+            return
+        session_id, self.session_id = self.session_id, None
+        self.connection.off("Page.screencastFrame", self._frame_listener, session_id)
+        try:
+            self.connection.execute("Page.stopScreencast", session_id=session_id, timeout=5)
+            self.connection.execute("Target.detachFromTarget", {"sessionId": session_id}, timeout=5)
+        except (CDPError, TimeoutError):
+            # The tab may already be gone
+            pass
+
+    def _on_frame(self, session_id, params):
+        started = time.thread_time()
+        # Chrome stops sending frames until the previous one is acknowledged
+        self.connection.send("Page.screencastFrameAck", {"sessionId": params["sessionId"]}, session_id)
+
+        timestamp = params.get("metadata", {}).get("timestamp") or time.time()
+        with self._lock:
+            if len(self.frames) == self.frames.maxlen:
+                self.buffer_bytes -= len(self.frames[0][1])
+            self.frames.append((timestamp, params["data"]))
+            self.buffer_bytes += len(params["data"])
+            while timestamp - self.frames[0][0] > self.seconds:
+                self.buffer_bytes -= len(self.frames.popleft()[1])
+            self.peak_buffer_bytes = max(self.peak_buffer_bytes, self.buffer_bytes)
+
+        self.received += 1
+        self.handler_cpu += time.thread_time() - started
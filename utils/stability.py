@@ -0,0 +1,199 @@
+"""
+Page stability - decides when a page has actually settled: document
+loaded, no first-party fetch/XHR in flight, no content changes or
+scrolling for a short quiet window, and no finite CSS/Web animations
+still running.
+
+Analytics, chat widgets and long-polls never go quiet on the live site,
+so only requests to the page's own host or FIRST_PARTY_HOSTS count, and
+only until they have been open for LONG_REQUEST_MS. Likewise only nodes
+added or removed outside <head> (inside <main> when the page has one)
+count as DOM activity; attribute churn from tickers and carousels doesn't.
+
+A tracker script records in-flight requests and the last activity
+time. It is registered with Page.addScriptToEvaluateOnNewDocument where
+CDP is available, so requests that start before the first wait are seen
+too. Each wait is a single execute_async_script call that resolves the
+moment the page is idle. Every wait is recorded, so a run can report
+how long stabilization took and which pages never settled.
+"""
+
+import time
+import weakref
+from collections import deque
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.event_wait import MAX_SCRIPT_WAIT
+
+# No content mutations or scrolls for this long counts as idle
+QUIET_MS = 100
+
+# Requests to other hosts (analytics, chat, CDNs) don't hold up a wait
+FIRST_PARTY_HOSTS = ("insiderone.com", "lever.co")
+
+# A request open this long is a long-poll or stream, not page content
+LONG_REQUEST_MS = 3000
+
+TRACKER_JS = """
+(function () {
+    if (window.__stability) return;
+    var s = window.__stability = {requests: {}, nextId: 0, lastActivity: Date.now()};
+    function touch() { s.lastActivity = Date.now(); }
+    function start(url) {
+        var id = ++s.nextId;
+        s.requests[id] = {url: String(url || ''), started: Date.now()};
+        return id;
+    }
+    function end(id) { delete s.requests[id]; }
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function (input) {
+            var id = start(input && input.url || input);
+            return originalFetch.apply(this, arguments).then(
+                function (response) { end(id); return response; },
+                function (error) { end(id); throw error; });
+        };
+    }
+    var originalOpen = XMLHttpRequest.prototype.open;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__stabilityUrl = url;
+        return originalOpen.apply(this, arguments);
+    };
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        var id = start(this.__stabilityUrl);
+        this.addEventListener('loadend', function () { end(id); });
+        try { return originalSend.apply(this, arguments); }
+        catch (e) { end(id); throw e; }
+    };
+
+    function inContent(node) {
+        if (document.head && document.head.contains(node)) return false;
+        var main = document.querySelector('main, [role="main"]');
+        return !main || main.contains(node);
+    }
+    new MutationObserver(function (records) {
+        for (var i = 0; i < records.length; i++) {
+            if (inContent(records[i].target)) { touch(); return; }
+        }
+    }).observe(document, {subtree: true, childList: true});
+    window.addEventListener('scroll', touch, true);
+})();
+"""
+
+WAIT_STABLE_JS = TRACKER_JS + """
+var quietMs = arguments[0], timeoutMs = arguments[1], hosts = arguments[2], longRequestMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var s = window.__stability, started = Date.now();
+
+function firstParty(url) {
+    var host;
+    try { host = new URL(url, window.location.href).hostname; } catch (e) { return true; }
+    return host === window.location.hostname || hosts.some(function (h) {
+        return host === h || host.slice(-h.length - 1) === '.' + h;
+    });
+}
+
+function loading() {
+    var now = Date.now();
+    return Object.keys(s.requests).some(function (id) {
+        var request = s.requests[id];
+        return now - request.started < longRequestMs && firstParty(request.url);
+    });
+}
+
+function animating() {
+    if (!document.getAnimations) return false;
+    return document.getAnimations().some(function (a) {
+        var timing = a.effect && a.effect.getTiming ? a.effect.getTiming() : {};
+        // Spinners and carousels loop forever; don't wait on them
+        return a.playState === 'running' && timing.iterations !== Infinity;
+    });
+}
+
+function busy() {
+    var reasons = [];
+    if (document.readyState !== 'complete') reasons.push('document');
+    if (loading()) reasons.push('network');
+    if (Date.now() - s.lastActivity < quietMs) reasons.push('dom');
+    if (animating()) reasons.push('animations');
+    return reasons;
+}
+
+(function check() {
+    var reasons = busy(), elapsed = Date.now() - started;
+    if (!reasons.length) { done({stable: true, waiting_for: []}); return; }
+    if (elapsed >= timeoutMs) { done({stable: false, waiting_for: reasons}); return; }
+    setTimeout(check, 25);
+})();
+"""
+
+_installed = weakref.WeakSet()
+
+# Recent stabilizations across the run: {label, elapsed, stable, waiting_for}
+history = deque(maxlen=1000)
+
+
+def install(driver):
+    """Register the tracker on every new document of driver (once per driver)."""
+    try:
+        if driver in _installed:
+            return
+        _installed.add(driver)
+    except TypeError:
+        return
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_JS})
+    except (AttributeError, WebDriverException):
+        # Not Chrome: the tracker is injected by the first wait on each page instead
+        pass
+
+
+def wait_until_stable(driver, timeout=2, quiet_ms=QUIET_MS, label=None):
+    """
+    Block until the page is idle or timeout seconds pass. Returns and
+    records {label, elapsed, stable, waiting_for}; waiting_for names what
+    was still busy at the timeout ('document', 'network', 'dom', 'animations').
+    """
+    install(driver)
+    started = time.perf_counter()
+    result = None
+
+    while True:
+        remaining = timeout - (time.perf_counter() - started)
+        if remaining <= 0:
+            break
+        try:
+            result = driver.execute_async_script(
+                WAIT_STABLE_JS, quiet_ms, int(min(remaining, MAX_SCRIPT_WAIT) * 1000),
+                list(FIRST_PARTY_HOSTS), LONG_REQUEST_MS,
+            )
+            break
+        except WebDriverException:
+            # Document unloaded mid-wait (the page navigated): wait on the new one
+            time.sleep(0.05)
+
+    entry = {
+        "label": label,
+        "elapsed": round(time.perf_counter() - started, 3),
+        "stable": bool(result and result.get("stable")),
+        "waiting_for": result.get("waiting_for", []) if result else ["script"],
+    }
+    history.append(entry)
+    return entry
+
+
+def summary():
+    """Aggregate the recorded waits: count, total and slowest time, how many timed out."""
+    if not history:
+        return None
+    slowest = max(history, key=lambda e: e["elapsed"])
+    return {
+        "waits": len(history),
+        "total_time": round(sum(e["elapsed"] for e in history), 3),
+        "slowest": slowest["elapsed"],
+        "slowest_label": slowest["label"],
+        "unstable": sum(1 for e in history if not e["stable"]),
+    }
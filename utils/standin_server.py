@@ -0,0 +1,255 @@
+"""
+Stand-in Server - a local HTTP server that imitates the parts of
+insiderone.com and Lever the suite talks to, for tests and benchmarks
+that must not depend on the live site.
+
+Pages are served under a host prefix, like the replay server, so the
+URL checks in the page objects ("careers", "lever.co") still hold.
+
+Routes:
+    GET /v0/postings/<company>?mode=json           # Lever postings API schema
+    GET /insiderone.com/                           # Homepage with the footer link
+    GET /insiderone.com/careers/                   # Careers page, team blocks load late
+    GET /jobs.lever.co/<company>?location=&team=   # Lever board with filter dropdowns
+    GET /jobs.lever.co/<company>/<id>/apply        # Lever application form
+
+Any path in `redirects` answers 302 to the mapped location instead.
+"""
+
+import html
+import itertools
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlencode, urlsplit
+
+LOCATIONS = ["Istanbul, Turkiye", "London, UK", "Barcelona, Spain", "Singapore", "New York, US"]
+TEAMS = ["Quality Assurance", "Software Development", "Product", "Data Science", "Sales"]
+
+
+def make_posting(title, location, team, company="insiderone", base_url="https://jobs.lever.co"):
+    """Build a posting object in Lever's API schema."""
+    posting_id = str(uuid.uuid4())
+    hosted_url = f"{base_url}/{company}/{posting_id}"
+    return {
+        "id": posting_id,
+        "text": title,
+        "categories": {
+            "location": location,
+            "allLocations": [location],
+            "team": team,
+            "commitment": "Full-time",
+        },
+        "hostedUrl": hosted_url,
+        "applyUrl": f"{hosted_url}/apply",
+    }
+
+
+class StandInServer:
+    """Serves synthetic insiderone.com / Lever data from 127.0.0.1 on a free port."""
+
+    def __init__(self, postings=None, company="insiderone", host="127.0.0.1", port=0,
+                 team_block_delay_ms=300):
+        self.postings = postings or []
+        self.company = company
+        self.team_block_delay_ms = team_block_delay_ms
+        self.redirects = {}
+        self.requests = 0
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return f"{self.base_url}/v0/postings"
+
+    @property
+    def home_url(self):
+        return f"{self.base_url}/insiderone.com/"
+
+    @property
+    def board_url(self):
+        return f"{self.base_url}/jobs.lever.co/{self.company}"
+
+    def add_synthetic_postings(self, count):
+        """Fill the board with count postings spread over the known locations and teams."""
+        combos = itertools.cycle(itertools.product(LOCATIONS, TEAMS))
+        for number in range(count):
+            location, team = next(combos)
+            self.postings.append(make_posting(
+                f"{team} Engineer {number + 1}", location, team,
+                company=self.company, base_url=f"{self.base_url}/jobs.lever.co",
+            ))
+        return self
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- Routes ---
+
+    def filtered(self, query):
+        """Lever filters on exact category values."""
+        postings = self.postings
+        for key in ("location", "team", "commitment"):
+            wanted = query.get(key)
+            if wanted:
+                postings = [p for p in postings if p["categories"].get(key) in wanted]
+        return postings
+
+    def postings_api(self, company, query):
+        if company != self.company:
+            return 404, "application/json", b'{"ok": false, "error": "Document not found"}'
+        return 200, "application/json", json.dumps(self.filtered(query)).encode("utf-8")
+
+    def home_page(self):
+        return _page("Insider One", f"""
+            <main><h1>Insider One</h1></main>
+            <footer><a href="{self.base_url}/insiderone.com/careers/">We're hiring</a></footer>
+        """)
+
+    def careers_page(self):
+        board = f"{self.board_url}?team={quote('Software Development')}"
+        return _page("Careers | Insider One", f"""
+            <a href="#open-roles">Explore open roles</a>
+            <section id="open-roles"><div id="teams"></div></section>
+            <script>
+                // Team blocks arrive after readyState is complete, like the live site
+                setTimeout(function () {{
+                    document.getElementById('teams').innerHTML =
+                        '<a href="{board}">Software Development</a>';
+                }}, {self.team_block_delay_ms});
+            </script>
+        """)
+
+    def board_page(self, company, query):
+        if company != self.company:
+            return _page("Not found", "<h1>Not found</h1>", status=404)
+
+        current = {k: v[0] for k, v in query.items()}
+        filters = [
+            ("Location type", "workplaceType", ["On-site", "Hybrid", "Remote"]),
+            ("Location", "location", LOCATIONS),
+            ("Team", "team", TEAMS),
+            ("Work type", "commitment", ["Full-time"]),
+        ]
+        wrappers = ""
+        for label, key, values in filters:
+            options = "".join(
+                '<li><a href="?{}">{}</a></li>'.format(
+                    html.escape(urlencode(dict(current, **{key: value}))), html.escape(value))
+                for value in values
+            )
+            wrappers += (
+                '<div class="filter-button-wrapper">'
+                f'<div class="filter-button">{html.escape(current.get(key, label))}</div>'
+                f'<div class="filter-popup" style="display:none"><ul>{options}</ul></div>'
+                '</div>'
+            )
+        # Lever shows the popup when the button is clicked
+        toggle = """<script>
+            document.querySelectorAll('.filter-button').forEach(function (btn) {
+                btn.addEventListener('click', function () {
+                    var popup = btn.parentNode.querySelector('.filter-popup');
+                    popup.style.display = popup.style.display === 'none' ? 'block' : 'none';
+                });
+            });
+        </script>"""
+
+        groups = {}
+        for posting in self.filtered(query):
+            groups.setdefault(posting["categories"]["team"], []).append(posting)
+        postings = ""
+        for team, team_postings in groups.items():
+            postings += ('<div class="postings-group">'
+                         f'<div class="posting-category-title">{html.escape(team)}</div>')
+            for p in team_postings:
+                postings += (
+                    f'<div class="posting" data-qa-posting-id="{p["id"]}">'
+                    f'<a class="posting-title" href="{p["hostedUrl"]}">'
+                    f'<h5 data-qa="posting-name">{html.escape(p["text"])}</h5>'
+                    f'<span class="sort-by-location">{html.escape(p["categories"]["location"])}</span>'
+                    '</a>'
+                    f'<a class="posting-btn-submit" href="{p["applyUrl"]}">Apply</a>'
+                    '</div>'
+                )
+            postings += "</div>"
+        return _page(f"{self.company} jobs", f'<div class="filter-bar">{wrappers}</div>'
+                                              f'<div class="postings-wrapper">{postings}</div>{toggle}')
+
+    def apply_page(self, company, posting_id):
+        posting = next((p for p in self.postings if p["id"] == posting_id), None)
+        if company != self.company or posting is None:
+            return _page("Not found", "<h1>Not found</h1>", status=404)
+        return _page(f"{posting['text']} - Apply", f"""
+            <h2>{html.escape(posting['text'])}</h2>
+            <form id="application-form" class="application-form" method="POST">
+                <input name="name"><input name="email"><button type="submit">Submit application</button>
+            </form>
+        """)
+
+    def route(self, path, query):
+        parts = [p for p in path.split("/") if p]
+        if len(parts) == 3 and parts[:2] == ["v0", "postings"]:
+            return self.postings_api(parts[2], query)
+        if parts == ["insiderone.com"]:
+            return self.home_page()
+        if parts == ["insiderone.com", "careers"]:
+            return self.careers_page()
+        if len(parts) == 2 and parts[0] == "jobs.lever.co":
+            return self.board_page(parts[1], query)
+        if len(parts) == 4 and parts[0] == "jobs.lever.co" and parts[3] == "apply":
+            return self.apply_page(parts[1], parts[2])
+        return 404, "text/plain", b"Not found"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                url = urlsplit(self.path)
+                if url.path in server.redirects:
+                    self.send_response(302)
+                    self.send_header("Location", server.redirects[url.path])
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                status, content_type, body = server.route(url.path, parse_qs(url.query))
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_HEAD = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _page(title, body, status=200):
+    document = (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+                f"</head><body>{body}</body></html>")
+    return status, "text/html; charset=utf-8", document.encode("utf-8")
@@ -0,0 +1,23 @@
+"""
+Test steps - prints the numbered step banner and notifies listeners
+(profiler, capture buffer, ...) that a new step has started.
+"""
+
+_listeners = []
+
+
+def add_step_listener(listener):
+    """Register a callable(number, title) invoked at the start of every step."""
+    _listeners.append(listener)
+
+
+def remove_step_listener(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def step(number, title):
+    """Start a test step: print '[Step N] title...' and notify listeners."""
+    print(f"\n[Step {number}] {title}...")
+    for listener in list(_listeners):
+        listener(number, title)